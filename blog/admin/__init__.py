@@ -1,3 +1,4 @@
 from .category_admin import CategoryAdmin
 from .tag_admin import TagAdmin
 from .article_admin import ArticleAdmin
+from .job_admin import JobAdmin
@@ -1,12 +1,16 @@
-from django.contrib import admin
-from django.urls import path
+from django.contrib import admin, messages
+from django.urls import path, reverse
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
 from django.utils.html import format_html
 from blog.models.article_model import Article
 from blog.admin.tag_admin import TagInline
-from blog.utils.openai_utils import generate_article
+from blog.utils import suggestion_service
+from blog.utils.job_queue import run_or_enqueue
+from blog.utils.openai_utils import api_key
+from blog.utils.pagination import EstimatedCountPaginator
+from blog.utils.search_backends import get_search_backend
 from .mixins_admin import DeleteWithImageMixin
 import os
 import logging
@@ -14,7 +18,7 @@ from blog.models.category_model import Category
 from blog.models.tag_model import Tag
 from django.template.loader import render_to_string
 from django.views.decorators.http import require_http_methods
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import ImproperlyConfigured, PermissionDenied
 import json
 from django.views.decorators.csrf import ensure_csrf_cookie
 
@@ -31,9 +35,15 @@ class ArticleAdmin(DeleteWithImageMixin, admin.ModelAdmin):
         'updated_at',
         'featured_image_thumbnail'
     )
-    list_filter = ('is_published', 'is_featured', 'category')
+    list_filter = ('is_published', 'is_featured', 'category', 'language')
     filter_horizontal = ['tags']  # Better UI for managing tags
+    # Only switches the changelist search box on: get_search_results matches
+    # through the full-text index, never with icontains on these columns
     search_fields = ('title', 'content')
+    search_help_text = _('Finds articles containing every word, in the title or the content.')
+    paginator = EstimatedCountPaginator
+    # Skip the extra unfiltered COUNT(*) the changelist runs for "N total"
+    show_full_result_count = False
     prepopulated_fields = {'slug': ('title',)}
     inlines = [TagInline]
     date_hierarchy = 'created_at'
@@ -49,7 +59,7 @@ class ArticleAdmin(DeleteWithImageMixin, admin.ModelAdmin):
 
     fieldsets = (
         (_('Basic Information'), {
-            'fields': ('title', 'slug','content', 'excerpt', 'category')
+            'fields': ('title', 'slug', 'language', 'content', 'excerpt', 'category')
         }),
         (_('SEO Metadata'), {
             'fields': ('meta_description',),
@@ -156,6 +166,16 @@ class ArticleAdmin(DeleteWithImageMixin, admin.ModelAdmin):
 
         return format_html(''.join(html))
 
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Match through the active search backend (FTS5, tsvector or the BM25
+        index) instead of an icontains scan over every article body. Like
+        Django's search, an article must contain every word.
+        """
+        if not search_term.strip():
+            return queryset, False
+        return get_search_backend().filter(queryset, search_term), False
+
     def get_urls(self):
         """Add custom URLs for AJAX endpoints"""
         urls = super().get_urls()
@@ -163,6 +183,9 @@ class ArticleAdmin(DeleteWithImageMixin, admin.ModelAdmin):
             path('suggest/<int:article_id>/',
                  self.admin_site.admin_view(self.get_suggestions),
                  name='article-suggestions'),
+            path('suggest/<int:article_id>/status/',
+                 self.admin_site.admin_view(self.get_suggestions_status),
+                 name='article-suggestions-status'),
             path('create-tag/',
                 self.admin_site.admin_view(ensure_csrf_cookie(self.create_tag)),
                  name='create-tag'),
@@ -183,38 +206,30 @@ class ArticleAdmin(DeleteWithImageMixin, admin.ModelAdmin):
     
 
     def get_suggestions(self, request, article_id):
-        """AJAX endpoint for getting suggestions"""
+        """AJAX endpoint for getting suggestions (200 with results, or 202 and a poll URL)"""
         if request.method != 'POST':
             return JsonResponse({'error': 'Only POST method is allowed'}, status=405)
-            
+
         article = get_object_or_404(Article, pk=article_id)
-        raw_suggestions = article.suggest_content_tags_and_categories()
-        
-        # Format suggestions properly
-        formatted_suggestions = {
-            'tags': [
-                {
-                    'type': suggestion[0],
-                    'info': {
-                        'id': suggestion[1].id if suggestion[0] == 'existing' else None,
-                        'name': suggestion[1].name if suggestion[0] == 'existing' else suggestion[1]['name']
-                    }
-                }
-                for suggestion in raw_suggestions.get('tags', [])
-            ],
-            'categories': [
-                {
-                    'type': suggestion[0],
-                    'info': {
-                        'id': suggestion[1].id if suggestion[0] == 'existing' else None,
-                        'name': suggestion[1].name if suggestion[0] == 'existing' else suggestion[1]['name']
-                    }
-                }
-                for suggestion in raw_suggestions.get('categories', [])
-            ]
-        }
-        
-        return JsonResponse(formatted_suggestions)
+        return self.suggestions_response(article, suggestion_service.get_suggestions(article))
+
+    def get_suggestions_status(self, request, article_id):
+        """Poll endpoint for suggestions still being computed"""
+        article = get_object_or_404(Article, pk=article_id)
+        return self.suggestions_response(article, suggestion_service.get_suggestions(article, wait=0))
+
+    def suggestions_response(self, article, outcome):
+        status, version, payload = outcome
+        if status == suggestion_service.STATUS_READY:
+            return JsonResponse(payload)
+        if status == suggestion_service.STATUS_PENDING:
+            poll_url = reverse('admin:article-suggestions-status', args=[article.pk])
+            return JsonResponse({'status': status, 'version': version, 'poll_url': poll_url}, status=202)
+        if status == suggestion_service.STATUS_BUSY:
+            response = JsonResponse(payload, status=503)
+            response['Retry-After'] = '2'
+            return response
+        return JsonResponse(payload, status=500)
 
     def create_tag(self, request):
         """Handle tag creation AJAX request"""
@@ -265,14 +280,22 @@ class ArticleAdmin(DeleteWithImageMixin, admin.ModelAdmin):
         }
         js = ('admin/js/article_suggestions.js',)
 
-    # actions = ['generate_article_content']
-    
-    # def generate_article_content(self, request, queryset):
-    #     for article in queryset:
-    #         #if not article.content:  # Avoid overwriting existing content
-    #         prompt = f'Write a detailed blog article on the topic: {article.title}'
-    #         article.content = generate_article(prompt)
-    #         article.save()
-    #     self.message_user(request, _('Articles content generated successfully.'))
+    actions = ['generate_article_content']
+
+    def generate_article_content(self, request, queryset):
+        try:
+            api_key()
+        except ImproperlyConfigured as e:
+            self.message_user(request, _('Content generation is not configured: %(error)s') % {'error': e},
+                              level=messages.ERROR)
+            return
+
+        # Generation takes minutes for a batch, so it runs on the job queue, not in this request
+        article_ids = list(queryset.values_list('pk', flat=True))
+        run_or_enqueue('article.generate_content', article_ids=article_ids)
+        self.message_user(
+            request,
+            _('Content generation queued for %(count)d article(s).') % {'count': len(article_ids)},
+        )
 
-    # generate_article_content.short_description = _('Generate content for selected articles')
+    generate_article_content.short_description = _('Generate content for selected articles')
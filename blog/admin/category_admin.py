@@ -3,11 +3,11 @@ from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
 from django.utils.html import format_html
 from blog.models.category_model import Category
-from .mixins_admin import ArticleCountMixin, DeleteWithImageMixin
+from .mixins_admin import DeleteWithImageMixin
 import os
 
 @admin.register(Category)
-class CategoryAdmin(ArticleCountMixin, DeleteWithImageMixin, admin.ModelAdmin):
+class CategoryAdmin(DeleteWithImageMixin, admin.ModelAdmin):
     list_display = ('name','slug', 'created_at', 'updated_at', 'article_count', 'featured_image_thumbnail')  # Fields displayed in list view
     search_fields = ('name', 'description')
     prepopulated_fields = {'slug': ('name',)}  # Auto-generate slug from 'name'
@@ -0,0 +1,43 @@
+# blog/admin/job_admin.py
+from django.contrib import admin
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from blog.models.job_model import Job
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('task', 'status', 'attempts', 'worker', 'created_at', 'started_at', 'finished_at', 'duration')
+    list_filter = ('status', 'task')
+    search_fields = ('task',)
+    ordering = ('-created_at',)
+    readonly_fields = (
+        'task',
+        'payload',
+        'status',
+        'attempts',
+        'worker',
+        'last_error',
+        'run_after',
+        'created_at',
+        'started_at',
+        'finished_at',
+    )
+    actions = ['retry_jobs']
+
+    def has_add_permission(self, request):
+        # Jobs are created by the application, never by hand
+        return False
+
+    def duration(self, obj):
+        return obj.duration
+    duration.short_description = _('Duration')
+
+    def retry_jobs(self, request, queryset):
+        """Send failed jobs back to the queue"""
+        updated = queryset.filter(status=Job.STATUS_FAILED).update(
+            status=Job.STATUS_PENDING,
+            attempts=0,
+            run_after=timezone.now(),
+        )
+        self.message_user(request, _('%(count)d jobs re-queued.') % {'count': updated})
+    retry_jobs.short_description = _('Retry selected failed jobs')
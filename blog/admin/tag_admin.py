@@ -2,11 +2,11 @@ from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
 from blog.models.tag_model import Tag
 from blog.models.article_model import Article
-from .mixins_admin import ArticleCountMixin, DeleteWithImageMixin
+from .mixins_admin import DeleteWithImageMixin
 from django.utils.html import format_html
 
 @admin.register(Tag)
-class TagAdmin( ArticleCountMixin, DeleteWithImageMixin, admin.ModelAdmin):
+class TagAdmin(DeleteWithImageMixin, admin.ModelAdmin):
     list_display = ('name', 'slug', 'created_at', 'updated_at', 'article_count', 'featured_image_thumbnail')  # Fields displayed in list view
     search_fields = ('name', 'description')
     prepopulated_fields = {'slug': ('name',)}  # Auto-generate slug from 'name'
@@ -7,4 +7,5 @@ class BlogConfig(AppConfig):
     verbose_name = _('Blog')
 
     def ready(self):
-        import blog.signals  # Ensure signals are loaded
\ No newline at end of file
+        import blog.signals  # Ensure signals are loaded
+        import blog.tasks  # Register background tasks
\ No newline at end of file
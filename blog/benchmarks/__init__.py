@@ -0,0 +1,58 @@
+# blog/benchmarks/__init__.py
+"""
+Micro-benchmarks for hot paths, run with ``./manage.py benchmark <name>``.
+
+Each module exposes ``run(stdout, repeat)``.
+"""
+import time
+
+
+def best_of(func, repeat=5):
+    """Run func `repeat` times and return (best time in ms, last result)"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+ENTITIES = [
+    ('Django', 'ORG'), ('Python', 'PRODUCT'), ('Mozilla', 'ORG'), ('Stockholm', 'GPE'),
+    ('Belgrade', 'GPE'), ('PostgreSQL', 'PRODUCT'), ('Guido', 'PERSON'), ('GitHub', 'ORG'),
+]
+NOUNS = ['framework', 'library', 'database', 'release', 'tutorial', 'server', 'editor', 'plugin']
+
+# "<Entity> released a new <noun> for <noun> developers ."
+SENTENCE_POS = ['PROPN', 'VERB', 'DET', 'ADJ', 'NOUN', 'ADP', 'NOUN', 'NOUN', 'PUNCT']
+SENTENCE_DEPS = ['nsubj', 'ROOT', 'det', 'amod', 'dobj', 'prep', 'compound', 'pobj', 'punct']
+SENTENCE_HEADS = [1, 1, 4, 4, 1, 4, 7, 5, 1]
+
+
+def synthetic_doc(n_words, seed=0):
+    """
+    A parsed spaCy Doc of roughly `n_words` tokens with POS tags, a
+    dependency parse (so noun chunks work) and entities, built without
+    loading a trained model.
+    """
+    import random
+    import spacy
+    from spacy.tokens import Doc
+
+    rng = random.Random(seed)
+    words, spaces, pos, deps, heads, ents = [], [], [], [], [], []
+
+    while len(words) < n_words:
+        offset = len(words)
+        entity, label = rng.choice(ENTITIES)
+        sentence = [entity, 'released', 'a', 'new', rng.choice(NOUNS), 'for', rng.choice(NOUNS), 'developers', '.']
+        words.extend(sentence)
+        spaces.extend([True] * 7 + [False, True])
+        pos.extend(SENTENCE_POS)
+        deps.extend(SENTENCE_DEPS)
+        heads.extend(offset + head for head in SENTENCE_HEADS)
+        ents.extend([f'B-{label}'] + ['O'] * 8)
+
+    return Doc(spacy.blank('en').vocab, words=words, spaces=spaces, pos=pos, deps=deps, heads=heads, ents=ents)
@@ -0,0 +1,57 @@
+# blog/benchmarks/article_cards.py
+"""Rendering a page of article cards: an include loop vs. the fragment cache, cold and warm"""
+import random
+from django.core.cache import caches
+from django.db import transaction
+from django.template import Context, Template
+from blog.benchmarks import NOUNS, best_of
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.settings import FRAGMENT_CACHE_SETTINGS
+from blog.views.article_view import article_cards
+
+PAGE_SIZES = (20, 40, 60, 80, 100)
+WORDS_PER_ARTICLE = 1200
+
+LOOP = Template(
+    "{% for article in articles %}{% include 'blog/components/article_item.html' with article=article %}{% endfor %}"
+)
+CACHED = Template("{% load fragment_tags %}{% cached_cards articles %}")
+
+
+class Rollback(Exception):
+    pass
+
+
+def build_corpus(size, seed=0):
+    rng = random.Random(seed)
+    category = Category.objects.create(name="Cards benchmark", slug="cards-benchmark")
+    Article.objects.bulk_create([
+        Article(
+            title=f"Benchmark card {i}", slug=f"benchmark-card-{i}", category=category, is_published=True,
+            content=' '.join(f"<p>{' '.join(rng.choices(NOUNS, k=WORDS_PER_ARTICLE // 10))}</p>" for _ in range(10)),
+        )
+        for i in range(size)
+    ])
+    return list(article_cards(Article.objects.filter(category=category)).order_by('-created_at', '-id'))
+
+
+def run(stdout, repeat=5):
+    cache = caches[FRAGMENT_CACHE_SETTINGS['CACHE_ALIAS']]
+    stdout.write(f"{'cards':>6} {'loop ms':>8} {'cold ms':>8} {'warm ms':>8} {'speedup':>8}")
+    try:
+        with transaction.atomic():
+            articles = build_corpus(max(PAGE_SIZES))
+            for size in PAGE_SIZES:
+                page = articles[:size]
+                loop_ms, _ = best_of(lambda: LOOP.render(Context({'articles': page})), repeat)
+
+                def cold():
+                    cache.clear()
+                    return CACHED.render(Context({'articles': page}))
+                cold_ms, _ = best_of(cold, repeat)
+                warm_ms, _ = best_of(lambda: CACHED.render(Context({'articles': page})), repeat)
+                stdout.write(f"{size:>6} {loop_ms:>8.2f} {cold_ms:>8.2f} {warm_ms:>8.2f} {loop_ms / warm_ms:>7.1f}x")
+            raise Rollback
+    except Rollback:
+        cache.clear()
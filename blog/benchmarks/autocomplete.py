@@ -0,0 +1,66 @@
+# blog/benchmarks/autocomplete.py
+"""Prefix-trie completions: build time, memory and per-keystroke latency"""
+import random
+import time
+import tracemalloc
+from blog.benchmarks import NOUNS, best_of
+from blog.settings import AUTOCOMPLETE_SETTINGS
+from blog.utils.autocomplete import KIND_ARTICLE, KIND_TAG, CompletionTrie, Entry, completion_keys
+
+WORDS = NOUNS + [
+    'django', 'python', 'deploy', 'testing', 'async', 'queries', 'caching', 'search', 'models', 'views',
+    'templates', 'security', 'performance', 'migrations', 'signals', 'forms', 'admin', 'docker', 'api', 'graphql',
+]
+# Per-keystroke budget for one lookup
+BUDGET_US = 1000.0
+
+
+def synthetic_entries(articles, tags, seed=0):
+    rng = random.Random(seed)
+    entries = []
+    for pk in range(articles):
+        title = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(3, 8))) + f" {pk}"
+        entries.append(Entry(KIND_ARTICLE, pk, title, str(pk), 5 if rng.random() < 0.05 else 1))
+    for pk in range(tags):
+        name = f"{rng.choice(WORDS)}{pk}"
+        entries.append(Entry(KIND_TAG, pk, name, name, rng.randint(0, 500)))
+    return entries
+
+
+def build(entries):
+    items = [(entry, completion_keys(entry.label)) for entry in entries]
+    return CompletionTrie.build(AUTOCOMPLETE_SETTINGS['TOP_CAPACITY'], items)
+
+
+def run(stdout, repeat=5):
+    stdout.write(f"{'articles':>9} {'build s':>8} {'memory MB':>10} {'lookup us':>10} {'patch us':>9} {'budget':>7}")
+    prefixes = [word[:length] for word in WORDS for length in (1, 2, 3, 5)]
+    limit = AUTOCOMPLETE_SETTINGS['LIMIT']
+
+    for articles in (10000, 100000):
+        entries = synthetic_entries(articles, articles // 20)
+        started = time.perf_counter()
+        trie = build(entries)
+        build_s = time.perf_counter() - started
+        del trie
+        # Measured on a second build: tracemalloc slows allocation down several times
+        tracemalloc.start()
+        trie = build(entries)
+        memory_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+        tracemalloc.stop()
+
+        lookups_ms, _ = best_of(lambda: [trie.complete(prefix, limit) for prefix in prefixes], repeat)
+        lookup_us = lookups_ms * 1000 / len(prefixes)
+
+        # Re-save the most popular article of a busy prefix: removal dirties full lists
+        def patch():
+            for entry in trie.complete('d', 1):
+                trie.add(entry, completion_keys(entry.label))
+                trie.complete('d', limit)
+        patch_ms, _ = best_of(patch, repeat)
+
+        verdict = 'ok' if lookup_us <= BUDGET_US else 'OVER'
+        stdout.write(
+            f"{articles:>9} {build_s:>8.1f} {memory_mb:>10.0f} {lookup_us:>10.1f} {patch_ms * 1000:>9.0f} {verdict:>7}"
+        )
+    stdout.write(f"Budget: {BUDGET_US:.0f} us per lookup")
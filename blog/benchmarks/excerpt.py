@@ -0,0 +1,39 @@
+# blog/benchmarks/excerpt.py
+"""Extractive excerpt and meta description from sentence importance, against a per-article budget"""
+from blog.benchmarks import best_of, synthetic_doc
+from blog.utils.text_analysis import ContentAnalysis
+
+# Scoring and selection for one article, after parsing, must stay under this
+BUDGET_MS = 250.0
+# The span loop is quadratic (Span.noun_chunks walks the whole doc); skip it on larger docs
+LEGACY_MAX_WORDS = 10000
+
+
+def legacy_sentence_importance(doc):
+    """The per-sentence span loop get_sentence_importance used before"""
+    important_pos = {'NOUN', 'PROPN', 'VERB'}
+    return [
+        len(sent.ents) + len(list(sent.noun_chunks)) + len([t for t in sent if t.pos_ in important_pos])
+        for sent in doc.sents
+    ]
+
+
+def summarize(doc):
+    analysis = ContentAnalysis.from_doc(doc)
+    return analysis.excerpt(), analysis.meta_description()
+
+
+def run(stdout, repeat=5):
+    stdout.write(f"{'words':>7} {'loop ms':>10} {'analysis ms':>12} {'budget':>8}  scores")
+    for words in (2000, 10000, 50000):
+        doc = synthetic_doc(words)
+        total_ms, _ = best_of(lambda: summarize(doc), repeat)
+        verdict = 'ok' if total_ms <= BUDGET_MS else 'OVER'
+
+        if words <= LEGACY_MAX_WORDS:
+            loop_ms, expected = best_of(lambda: legacy_sentence_importance(doc), 1)
+            same = 'identical' if ContentAnalysis.from_doc(doc).sentence_scores == expected else 'DIFFERENT'
+            stdout.write(f"{words:>7} {loop_ms:>10.1f} {total_ms:>12.1f} {verdict:>8}  {same}")
+        else:
+            stdout.write(f"{words:>7} {'-':>10} {total_ms:>12.1f} {verdict:>8}  -")
+    stdout.write(f"Budget: {BUDGET_MS:.0f} ms per article")
@@ -0,0 +1,38 @@
+# blog/benchmarks/html_text.py
+"""Streaming HTML extractor vs. the previous BeautifulSoup cleaning path"""
+import re
+from html import unescape
+from bs4 import BeautifulSoup
+from blog.benchmarks import best_of
+from blog.utils.html_utils import html_to_text
+
+PARAGRAPH = (
+    '<p>Django <strong>makes</strong> it easier to build better web apps '
+    'more quickly and with <a href="/docs/">less code</a>. It&rsquo;s free &amp; '
+    'open source.</p>\n<ul><li>Fast</li><li>Secure</li><li>Scalable</li></ul>\n'
+)
+NOISE = '<script>var tracking = {"id": 1};</script><style>.x { color: red; }</style>\n'
+
+
+def beautifulsoup_text(html):
+    """The cleaning code previously used by Article and ContentSuggestionSystem"""
+    soup = BeautifulSoup(html, 'html.parser')
+    text = unescape(soup.get_text(separator=' '))
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def build_document(paragraphs):
+    return ''.join(PARAGRAPH + (NOISE if i % 10 == 0 else '') for i in range(paragraphs))
+
+
+def run(stdout, repeat=5):
+    stdout.write(f"{'size':>10} {'bs4 ms':>10} {'stream ms':>10} {'speedup':>8}")
+    for paragraphs in (100, 1000, 5000):
+        html = build_document(paragraphs)
+        bs_ms, expected = best_of(lambda: beautifulsoup_text(html), repeat)
+        stream_ms, text = best_of(lambda: html_to_text(html), repeat)
+        if text != expected:
+            stdout.write(f"  output differs at {paragraphs} paragraphs")
+        stdout.write(
+            f"{len(html) // 1024:>8}KB {bs_ms:>10.1f} {stream_ms:>10.1f} {bs_ms / stream_ms:>7.1f}x"
+        )
@@ -0,0 +1,98 @@
+# blog/benchmarks/search.py
+"""BM25 search over the inverted index vs. SQLite FTS5 and an icontains scan, on synthetic corpora"""
+import numpy as np
+from django.db import connection, transaction
+from django.db.models import Q
+from blog.benchmarks import best_of
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.search_index_model import SearchDocument, SearchPosting, SearchTerm
+from blog.utils.search_backends import BACKENDS, FTS5_TABLE
+from blog.utils.search_index import reset_index_stats, search
+
+VOCABULARY_SIZE = 50000
+TERMS_PER_ARTICLE = 30
+QUERIES = ['term7', 'term120 term3', 'term2500 term40 term9']
+
+
+class Rollback(Exception):
+    pass
+
+
+def build_corpus(size, seed=0):
+    """Articles plus their postings written straight to the index tables (Zipf-distributed terms)"""
+    rng = np.random.default_rng(seed)
+    bodies = []
+    for _ in range(size):
+        drawn = np.minimum(rng.zipf(1.3, TERMS_PER_ARTICLE * 2), VOCABULARY_SIZE) - 1
+        bodies.append(np.unique(drawn, return_counts=True))
+
+    category = Category.objects.create(name="Search benchmark", slug="search-benchmark")
+    Article.objects.bulk_create([
+        Article(
+            title=f"Benchmark article {i}", slug=f"benchmark-article-{i}", category=category, is_published=True,
+            content=' '.join(f"term{term}" for term in np.repeat(terms, frequencies).tolist()),
+        )
+        for i, (terms, frequencies) in enumerate(bodies)
+    ], batch_size=2000)
+    article_ids = list(Article.objects.filter(category=category).order_by('pk').values_list('pk', flat=True))
+
+    SearchTerm.objects.bulk_create([SearchTerm(term=f"term{i}") for i in range(VOCABULARY_SIZE)], batch_size=5000)
+    term_ids = np.array(
+        [pk for _, pk in sorted(SearchTerm.objects.values_list('term', 'pk'), key=lambda row: int(row[0][4:]))]
+    )
+
+    documents, postings = [], []
+    document_counts = np.zeros(VOCABULARY_SIZE, dtype=np.int64)
+    for article_id, (terms, frequencies) in zip(article_ids, bodies):
+        document_counts[terms] += 1
+        documents.append(SearchDocument(article_id=article_id, length=int(frequencies.sum())))
+        postings.extend(
+            SearchPosting(term_id=int(term_ids[term]), document_id=article_id, frequency=int(frequency))
+            for term, frequency in zip(terms.tolist(), frequencies.tolist())
+        )
+    SearchDocument.objects.bulk_create(documents, batch_size=5000)
+    SearchPosting.objects.bulk_create(postings, batch_size=5000)
+    for term in np.flatnonzero(document_counts).tolist():
+        SearchTerm.objects.filter(pk=int(term_ids[term])).update(document_count=int(document_counts[term]))
+    reset_index_stats()
+
+    if BACKENDS['fts5'].is_available():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {FTS5_TABLE} (rowid, title, content) "
+                f"SELECT id, title, content FROM blog_article WHERE category_id = %s", [category.pk]
+            )
+
+
+def scan(query):
+    """What a search without the index costs: a LIKE over every title and body"""
+    condition = Q()
+    for word in query.split():
+        condition |= Q(title__icontains=word) | Q(content__icontains=word)
+    matches = Article.objects.filter(condition, is_published=True)
+    return matches.count(), list(matches.order_by('-pk').values_list('pk', flat=True)[:10])
+
+
+def run(stdout, repeat=5):
+    fts5 = BACKENDS['fts5']
+    stdout.write(
+        f"{'articles':>9} {'query':<24} {'matches':>8} {'page 1 ms':>10} {'page 5 ms':>10} {'fts5 ms':>8} {'scan ms':>8}"
+    )
+    for size in (10000, 100000):
+        try:
+            with transaction.atomic():
+                build_corpus(size)
+                for query in QUERIES:
+                    first_ms, results = best_of(lambda: search(query), repeat)
+                    fifth_ms, _ = best_of(lambda: search(query, page=5), repeat)
+                    fts5_ms = best_of(lambda: fts5.search(query), repeat)[0] if fts5.is_available() else None
+                    scan_ms, _ = best_of(lambda: scan(query), 1)
+                    fts5_column = f"{fts5_ms:>8.1f}" if fts5_ms is not None else f"{'-':>8}"
+                    stdout.write(
+                        f"{size:>9} {query:<24} {results.total:>8} {first_ms:>10.1f} {fifth_ms:>10.1f} "
+                        f"{fts5_column} {scan_ms:>8.1f}"
+                    )
+                raise Rollback
+        except Rollback:
+            reset_index_stats()
@@ -0,0 +1,77 @@
+# blog/benchmarks/topic_scoring.py
+"""
+Vectorized category topic scoring vs. the code it replaced: from_doc walking
+doc.sents with sent.ents / sent.noun_chunks, then the per-section scoring loop
+"""
+from blog.benchmarks import best_of, synthetic_doc
+from blog.utils.text_analysis import TOPIC_ENTITY_LABELS, ContentAnalysis
+from blog.utils.topic_scoring import score_topics
+
+SECTIONS = [(0, 1, 2.0), (1, 3, 1.5), (3, None, 1.0)]
+
+
+def previous_analysis(doc):
+    """ContentAnalysis.from_doc as it was: one pass per sentence span"""
+    sentences = []
+    entities = []
+    noun_chunks = []
+
+    has_chunks = doc.has_annotation('DEP')
+    for index, sent in enumerate(doc.sents):
+        sentences.append(sent.text.strip())
+        entities.extend((ent.text, ent.label_, index) for ent in sent.ents)
+        if has_chunks:
+            noun_chunks.extend((chunk.text, index) for chunk in sent.noun_chunks)
+
+    keywords = [
+        token.text.lower()
+        for token in doc
+        if token.pos_ in ['NOUN', 'PROPN']
+        and not token.is_stop
+        and len(token.text) > 3
+    ]
+    return ContentAnalysis(text=doc.text, sentences=sentences, entities=entities,
+                           noun_chunks=noun_chunks, keywords=keywords)
+
+
+def previous_topic_scores(analysis):
+    """ContentSuggestionSystem._score_sentence_topics over the three sections, then the sort"""
+    topic_scores = {}
+    for first, last, weight in SECTIONS:
+        def in_section(index):
+            return index >= first and (last is None or index < last)
+
+        for text, label, index in analysis.entities:
+            if label in TOPIC_ENTITY_LABELS and in_section(index):
+                topic = text.lower()
+                topic_scores[topic] = topic_scores.get(topic, 0) + (1 * weight)
+        for text, index in analysis.noun_chunks:
+            if 1 <= len(text.split()) <= 2 and in_section(index):
+                topic = text.lower()
+                topic_scores[topic] = topic_scores.get(topic, 0) + (0.5 * weight)
+    return sorted(topic_scores.items(), key=lambda x: x[1], reverse=True)
+
+
+def vectorized_topic_scores(analysis):
+    return score_topics([(analysis, first, last, weight) for first, last, weight in SECTIONS])
+
+
+def run(stdout, repeat=5):
+    stdout.write(
+        f"{'words':>7} {'before ms':>10} {'after ms':>10} {'speedup':>8}"
+        f" {'score loop':>11} {'score vec':>10}  rankings"
+    )
+    for words in (5000, 10000, 20000):
+        doc = synthetic_doc(words)
+        # Analysis + scoring, end to end
+        before_ms, expected = best_of(lambda: previous_topic_scores(previous_analysis(doc)), repeat)
+        after_ms, ranked = best_of(lambda: vectorized_topic_scores(ContentAnalysis.from_doc(doc)), repeat)
+        # Scoring alone, over the same analysis: the loop was already linear
+        analysis = ContentAnalysis.from_doc(doc)
+        loop_ms, _ = best_of(lambda: previous_topic_scores(analysis), repeat)
+        vector_ms, _ = best_of(lambda: vectorized_topic_scores(analysis), repeat)
+        same = 'identical' if ranked == expected else 'DIFFERENT'
+        stdout.write(
+            f"{words:>7} {before_ms:>10.1f} {after_ms:>10.1f} {before_ms / after_ms:>7.1f}x"
+            f" {loop_ms:>11.1f} {vector_ms:>10.1f}  {same}"
+        )
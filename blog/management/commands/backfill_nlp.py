@@ -0,0 +1,127 @@
+# blog/management/commands/backfill_nlp.py
+
+import json
+import os
+import time
+from itertools import groupby
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+from blog.models.article_model import Article
+from blog.utils import page_cache
+from blog.utils.nlp_cache import analysis_cache
+from blog.utils.spicy_utils import get_nlp_pipeline, model_for_language
+from blog.utils.text_analysis import ContentAnalysis, clean_html
+
+DEFAULT_CHECKPOINT = os.path.join(settings.BASE_DIR, 'cache', 'backfill_nlp.json')
+
+
+class Command(BaseCommand):
+    help = "Fill empty article excerpts and meta descriptions in bulk with spaCy"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help="Texts per nlp.pipe batch and rows per bulk_update")
+        parser.add_argument('--n-process', type=int, default=1,
+                            help="Number of spaCy worker processes")
+        parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT,
+                            help="File recording the last processed primary key")
+        parser.add_argument('--reset', action='store_true',
+                            help="Ignore any existing checkpoint and start from the first article")
+        parser.add_argument('--limit', type=int, default=None,
+                            help="Stop after this many articles")
+
+    def handle(self, *args, **options):
+        self.checkpoint_path = options['checkpoint']
+        batch_size = options['batch_size']
+
+        start_pk = 0 if options['reset'] else self.read_checkpoint()
+        if start_pk:
+            self.stdout.write(f"Resuming after article #{start_pk}")
+
+        articles = (
+            Article.objects
+            .filter(Q(excerpt='') | Q(meta_description=''), pk__gt=start_pk)
+            .order_by('pk')
+            .only('pk', 'content', 'language', 'excerpt', 'meta_description')
+        )
+        if options['limit']:
+            articles = articles[:options['limit']]
+
+        started = time.perf_counter()
+        processed = 0
+        pending = []
+
+        for doc, article, model_name in self.parse(articles, batch_size, options['n_process']):
+            analysis = ContentAnalysis.from_doc(doc)
+            analysis_cache.set(analysis_cache.make_key(doc.text, model_name), analysis.to_dict())
+
+            if not article.excerpt:
+                article.excerpt = analysis.excerpt()
+            if not article.meta_description:
+                article.meta_description = analysis.meta_description()
+            pending.append(article)
+
+            if len(pending) >= batch_size:
+                processed += self.flush(pending)
+                self.report(processed, started)
+                pending = []
+
+        if pending:
+            processed += self.flush(pending)
+
+        self.report(processed, started)
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {processed} articles"))
+
+    def parse(self, articles, batch_size, n_process):
+        """
+        Yield (doc, article, model name) in primary key order. Consecutive
+        articles in the same language share one nlp.pipe stream, so mixed
+        corpora switch models only at language boundaries.
+        """
+        for model_name, group in groupby(
+            articles.iterator(chunk_size=batch_size),
+            key=lambda article: model_for_language(article.language),
+        ):
+            nlp = get_nlp_pipeline('analysis', model_name)
+            docs = nlp.pipe(self.texts(group), as_tuples=True, batch_size=batch_size, n_process=n_process)
+            for doc, article in docs:
+                yield doc, article, model_name
+
+    def texts(self, articles):
+        """Yield (clean text, article) pairs, skipping articles without text"""
+        for article in articles:
+            text = clean_html(article.content or '')
+            if text:
+                yield text, article
+
+    def flush(self, articles):
+        """Write a batch back, retire the pages showing it and advance the checkpoint"""
+        # bulk_update skips auto_now: move updated_at so ETags and card fragments follow
+        now = timezone.now()
+        for article in articles:
+            article.updated_at = now
+        Article.objects.bulk_update(articles, ['excerpt', 'meta_description', 'updated_at'])
+        page_cache.purge_rows(Article, [article.pk for article in articles])
+        self.write_checkpoint(articles[-1].pk)
+        return len(articles)
+
+    def report(self, processed, started):
+        elapsed = time.perf_counter() - started
+        rate = processed / elapsed if elapsed else 0
+        self.stdout.write(f"{processed} articles in {elapsed:.1f}s ({rate:.1f} articles/s)")
+
+    def read_checkpoint(self):
+        try:
+            with open(self.checkpoint_path) as checkpoint:
+                return json.load(checkpoint).get('last_pk', 0)
+        except (OSError, ValueError):
+            return 0
+
+    def write_checkpoint(self, pk):
+        os.makedirs(os.path.dirname(self.checkpoint_path), exist_ok=True)
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, 'w') as checkpoint:
+            json.dump({'last_pk': pk}, checkpoint)
+        os.replace(tmp_path, self.checkpoint_path)
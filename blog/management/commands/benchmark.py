@@ -0,0 +1,30 @@
+# blog/management/commands/benchmark.py
+
+import importlib
+import pkgutil
+from django.core.management.base import BaseCommand, CommandError
+import blog.benchmarks
+
+
+def available_benchmarks():
+    return sorted(module.name for module in pkgutil.iter_modules(blog.benchmarks.__path__))
+
+
+class Command(BaseCommand):
+    help = "Run one of the micro-benchmarks in blog/benchmarks"
+
+    def add_arguments(self, parser):
+        parser.add_argument('name', nargs='?', help="Benchmark to run (omit to list them)")
+        parser.add_argument('--repeat', type=int, default=5, help="Runs per measurement (best is reported)")
+
+    def handle(self, *args, **options):
+        names = available_benchmarks()
+        if not options['name']:
+            self.stdout.write("Available benchmarks: " + ", ".join(names))
+            return
+
+        if options['name'] not in names:
+            raise CommandError(f"Unknown benchmark {options['name']!r}. Available: {', '.join(names)}")
+
+        module = importlib.import_module(f"blog.benchmarks.{options['name']}")
+        module.run(self.stdout, repeat=options['repeat'])
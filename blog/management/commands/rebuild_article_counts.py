@@ -0,0 +1,19 @@
+# blog/management/commands/rebuild_article_counts.py
+
+from django.core.management.base import BaseCommand
+from blog.models.category_model import Category
+from blog.models.tag_model import Tag
+from blog.utils.article_counts import recount
+
+
+class Command(BaseCommand):
+    help = "Reconcile the stored published-article counts of categories and tags with the articles"
+
+    def handle(self, *args, **options):
+        for model in (Category, Tag):
+            drifted = recount(model)
+            for pk, (stored, actual) in sorted(drifted.items()):
+                self.stdout.write(f"{model.__name__} {pk}: {stored} -> {actual}")
+            self.stdout.write(self.style.SUCCESS(
+                f"{model._meta.verbose_name_plural.capitalize()}: {len(drifted)} count(s) repaired"
+            ))
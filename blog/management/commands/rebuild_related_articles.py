@@ -0,0 +1,15 @@
+# blog/management/commands/rebuild_related_articles.py
+
+import time
+from django.core.management.base import BaseCommand
+from blog.utils.related_articles import rebuild_related_articles
+
+
+class Command(BaseCommand):
+    help = "Recompute the precomputed related articles of every article"
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        count = rebuild_related_articles()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Related articles rebuilt for {count} articles in {elapsed:.1f}s"))
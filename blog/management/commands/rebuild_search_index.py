@@ -0,0 +1,35 @@
+# blog/management/commands/rebuild_search_index.py
+
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from blog.models.article_model import Article
+from blog.utils.search_backends import BACKENDS, get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index from every article"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Articles read per query")
+        parser.add_argument(
+            '--backend', choices=sorted(BACKENDS),
+            help="Index to rebuild (default: the active one, see SEARCH_SETTINGS['BACKEND'])"
+        )
+
+    def handle(self, *args, **options):
+        backend = BACKENDS[options['backend']] if options['backend'] else get_search_backend()
+        if not backend.is_available():
+            raise CommandError(f"Search backend {backend.name!r} is not available on this database")
+        started = time.perf_counter()
+
+        with transaction.atomic():
+            backend.clear()
+            count = 0
+            articles = Article.objects.order_by('pk').only('pk', 'title', 'content', 'language')
+            for article in articles.iterator(chunk_size=options['batch_size']):
+                backend.index(article)
+                count += 1
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} articles with {backend.name} in {elapsed:.1f}s"))
@@ -0,0 +1,50 @@
+# blog/management/commands/rebuild_term_stats.py
+
+import time
+from collections import Counter
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from blog.models.article_model import Article
+from blog.models.term_stats_model import ArticleTerm, ArticleTermStats, TermDocumentFrequency
+from blog.utils.term_stats import article_terms
+
+
+class Command(BaseCommand):
+    help = "Recompute tag candidate terms and tf-idf document frequencies for every article"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help="Articles read per query and rows per bulk_create")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        started = time.perf_counter()
+
+        stats = []
+        document_frequency = Counter()
+        articles = Article.objects.order_by('pk').only('pk', 'title', 'content', 'language')
+
+        for article in articles.iterator(chunk_size=batch_size):
+            terms = article_terms(article)
+            document_frequency.update(terms.keys())
+            stats.append(ArticleTermStats(article=article, terms=dict(terms)))
+
+        with transaction.atomic():
+            ArticleTermStats.objects.all().delete()
+            TermDocumentFrequency.objects.all().delete()
+            ArticleTerm.objects.all().delete()
+            ArticleTermStats.objects.bulk_create(stats, batch_size=batch_size)
+            ArticleTerm.objects.bulk_create(
+                [ArticleTerm(article_id=stat.article_id, term=term) for stat in stats for term in stat.terms],
+                batch_size=batch_size,
+            )
+            TermDocumentFrequency.objects.bulk_create(
+                [TermDocumentFrequency(term=term, document_count=count)
+                 for term, count in document_frequency.items()],
+                batch_size=batch_size,
+            )
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {len(document_frequency)} terms from {len(stats)} articles in {elapsed:.1f}s"
+        ))
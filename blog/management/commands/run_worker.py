@@ -0,0 +1,53 @@
+# blog/management/commands/run_worker.py
+
+import time
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from blog.settings import JOB_QUEUE_SETTINGS
+from blog.utils.job_queue import claim_next_job, requeue_stale_jobs, run_job, worker_name
+
+
+class Command(BaseCommand):
+    help = "Process queued background jobs (start several to run jobs in parallel)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help="Exit when the queue is empty instead of polling")
+        parser.add_argument('--max-jobs', type=int, default=None,
+                            help="Exit after processing this many jobs")
+        parser.add_argument('--sleep', type=float, default=JOB_QUEUE_SETTINGS['POLL_INTERVAL'],
+                            help="Seconds to wait between polls when idle")
+
+    def handle(self, *args, **options):
+        name = worker_name()
+        processed = 0
+
+        requeued = requeue_stale_jobs()
+        if requeued:
+            self.stdout.write(f"Re-queued {requeued} stale jobs")
+        self.stdout.write(f"Worker {name} started")
+
+        try:
+            while options['max_jobs'] is None or processed < options['max_jobs']:
+                close_old_connections()
+                job = claim_next_job(name)
+
+                if job is None:
+                    if options['once']:
+                        break
+                    time.sleep(options['sleep'])
+                    continue
+
+                started = time.perf_counter()
+                succeeded = run_job(job)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                processed += 1
+
+                if succeeded:
+                    self.stdout.write(f"{job.task} #{job.pk} done in {elapsed_ms:.0f} ms")
+                else:
+                    self.stdout.write(self.style.ERROR(f"{job.task} #{job.pk} failed after {elapsed_ms:.0f} ms"))
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f"Worker {name} processed {processed} jobs"))
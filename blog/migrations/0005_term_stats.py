@@ -0,0 +1,74 @@
+# Generated by Django 5.1.4 on 2026-10-18 20:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0004_job"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TermDocumentFrequency",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "term",
+                    models.CharField(max_length=255, unique=True, verbose_name="Term"),
+                ),
+                (
+                    "document_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Document Count"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Term Document Frequency",
+                "verbose_name_plural": "Term Document Frequencies",
+            },
+        ),
+        migrations.CreateModel(
+            name="ArticleTermStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("terms", models.JSONField(default=dict, verbose_name="Terms")),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated At"),
+                ),
+                (
+                    "article",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="term_stats",
+                        to="blog.article",
+                        verbose_name="Article",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Article Term Statistics",
+                "verbose_name_plural": "Article Term Statistics",
+            },
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.1.4 on 2026-10-18 20:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0005_term_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RelatedArticle",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rank", models.PositiveSmallIntegerField(verbose_name="Rank")),
+                ("score", models.FloatField(verbose_name="Score")),
+                (
+                    "article",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_links",
+                        to="blog.article",
+                        verbose_name="Article",
+                    ),
+                ),
+                (
+                    "related",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_from",
+                        to="blog.article",
+                        verbose_name="Related Article",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Related Article",
+                "verbose_name_plural": "Related Articles",
+                "ordering": ["article", "rank"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("article", "rank"), name="blog_related_article_rank"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-18 20:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0006_related_article"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="language",
+            field=models.CharField(
+                choices=[("en", "English"), ("sv", "Swedish"), ("sr", "Serbian")],
+                default="en",
+                help_text="Language of the content; selects the spaCy model used to analyze it",
+                max_length=10,
+                verbose_name="Language",
+            ),
+        ),
+    ]
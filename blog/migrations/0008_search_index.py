@@ -0,0 +1,114 @@
+# Generated by Django 5.1.4 on 2026-10-18 20:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0007_article_language"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                (
+                    "article",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="blog.article",
+                        verbose_name="Article",
+                    ),
+                ),
+                (
+                    "length",
+                    models.PositiveIntegerField(default=0, verbose_name="Length"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated At"),
+                ),
+            ],
+            options={
+                "verbose_name": "Search Document",
+                "verbose_name_plural": "Search Documents",
+            },
+        ),
+        migrations.CreateModel(
+            name="SearchTerm",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "term",
+                    models.CharField(max_length=100, unique=True, verbose_name="Term"),
+                ),
+                (
+                    "document_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Document Count"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Search Term",
+                "verbose_name_plural": "Search Terms",
+            },
+        ),
+        migrations.CreateModel(
+            name="SearchPosting",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("frequency", models.PositiveIntegerField(verbose_name="Frequency")),
+                (
+                    "document",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="postings",
+                        to="blog.searchdocument",
+                        verbose_name="Document",
+                    ),
+                ),
+                (
+                    "term",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="postings",
+                        to="blog.searchterm",
+                        verbose_name="Term",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Search Posting",
+                "verbose_name_plural": "Search Postings",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("term", "document"),
+                        name="blog_search_posting_term_document",
+                    )
+                ],
+            },
+        ),
+    ]
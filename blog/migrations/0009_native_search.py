@@ -0,0 +1,48 @@
+# Native full-text indexes, created only on engines that have them.
+# The portable BM25 tables from 0008 stay as the fallback everywhere.
+
+from django.db import DatabaseError, migrations, transaction
+
+FTS5_TABLE = "blog_article_fts"
+POSTGRES_TABLE = "blog_article_search"
+
+
+def create_native_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "sqlite":
+        try:
+            with transaction.atomic(using=connection.alias):
+                schema_editor.execute(
+                    f"CREATE VIRTUAL TABLE {FTS5_TABLE} USING fts5("
+                    f"title, content, tokenize = 'unicode61 remove_diacritics 2')"
+                )
+        except DatabaseError:
+            # SQLite built without FTS5: search falls back to the BM25 index
+            pass
+    elif connection.vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE TABLE {POSTGRES_TABLE} ("
+            f"article_id bigint PRIMARY KEY REFERENCES blog_article (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+            f"document tsvector NOT NULL)"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX {POSTGRES_TABLE}_document_gin ON {POSTGRES_TABLE} USING GIN (document)"
+        )
+
+
+def drop_native_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS5_TABLE}")
+    elif schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {POSTGRES_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0008_search_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_native_index, drop_native_index),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-18 21:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0009_native_search"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("is_published", True)),
+                fields=["created_at", "id"],
+                name="blog_article_published_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-18 21:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0010_article_published_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("is_published", True)),
+                fields=["category", "created_at", "id"],
+                name="blog_article_category_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.4 on 2026-10-18 21:37
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def count_published_articles(apps, schema_editor):
+    for name in ("Category", "Tag"):
+        model = apps.get_model("blog", name)
+        rows = model.objects.annotate(
+            published=Count("articles", filter=Q(articles__is_published=True))
+        ).values_list("pk", "published")
+        model.objects.bulk_update(
+            [model(pk=pk, article_count=published) for pk, published in rows if published],
+            ["article_count"],
+            batch_size=500,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0011_taxonomy_listing_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="article_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Published articles"
+            ),
+        ),
+        migrations.AddField(
+            model_name="tag",
+            name="article_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Published articles"
+            ),
+        ),
+        migrations.RunPython(count_published_articles, migrations.RunPython.noop),
+    ]
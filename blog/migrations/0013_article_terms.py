@@ -0,0 +1,60 @@
+# Generated by Django 5.1.4 on 2026-10-18 21:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def link_stored_terms(apps, schema_editor):
+    ArticleTermStats = apps.get_model("blog", "ArticleTermStats")
+    ArticleTerm = apps.get_model("blog", "ArticleTerm")
+    ArticleTerm.objects.bulk_create(
+        (
+            ArticleTerm(article_id=article_id, term=term)
+            for article_id, terms in ArticleTermStats.objects.values_list("article_id", "terms").iterator()
+            for term in terms
+        ),
+        batch_size=1000,
+    )
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0012_taxonomy_article_counts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArticleTerm",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("term", models.CharField(max_length=255, verbose_name="Term")),
+                (
+                    "article",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="term_links",
+                        to="blog.article",
+                        verbose_name="Article",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Article Term",
+                "verbose_name_plural": "Article Terms",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("term", "article"), name="blog_article_term_unique"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(link_stored_terms, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-18 22:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0013_article_terms"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("is_published", True)),
+                fields=["updated_at"],
+                name="blog_article_updated_idx",
+            ),
+        ),
+    ]
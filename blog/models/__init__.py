@@ -0,0 +1,21 @@
+from .category_model import Category
+from .tag_model import Tag
+from .article_model import Article
+from .job_model import Job
+from .related_article_model import RelatedArticle
+from .search_index_model import SearchDocument, SearchPosting, SearchTerm
+from .term_stats_model import ArticleTerm, ArticleTermStats, TermDocumentFrequency
+
+__all__ = [
+    'Article',
+    'ArticleTerm',
+    'ArticleTermStats',
+    'Category',
+    'Job',
+    'RelatedArticle',
+    'SearchDocument',
+    'SearchPosting',
+    'SearchTerm',
+    'Tag',
+    'TermDocumentFrequency',
+]
@@ -1,4 +1,5 @@
-from django.db import models
+from django.conf import settings
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 from .category_model import Category
 from .tag_model import Tag
@@ -6,13 +7,12 @@ from django.urls import reverse
 from .featured_image_model import FeaturedImageModel
 from .base_model import BaseModelWithSlug
 from django.utils.text import Truncator
-import spacy
 from django.core.exceptions import ValidationError
-from bs4 import BeautifulSoup
-import re
-from html import unescape
 from blog.settings import SPACY_SETTINGS
 from blog.utils.content_suggestions import ContentSuggestionSystem
+from blog.utils.text_analysis import analyze_content, clean_html
+from blog.utils.job_queue import enqueue, queue_enabled
+from blog.utils.search_backends import maintained_backends
 
 class Article(BaseModelWithSlug, FeaturedImageModel):
     title = models.CharField(max_length=255, unique=True, verbose_name=_('Title'))
@@ -22,10 +22,40 @@ class Article(BaseModelWithSlug, FeaturedImageModel):
     tags = models.ManyToManyField(Tag, related_name='articles', verbose_name=_('Tags'))
     is_published = models.BooleanField(default=False, verbose_name=_('Is Published'))
     is_featured = models.BooleanField(default=False, verbose_name=_('Is Featured'))
+    language = models.CharField(
+        max_length=10,
+        choices=settings.LANGUAGES,
+        default=settings.LANGUAGE_CODE,
+        verbose_name=_('Language'),
+        help_text=_('Language of the content; selects the spaCy model used to analyze it')
+    )
 
     class Meta:
         verbose_name = _('Article')
         verbose_name_plural = _('Articles')
+        indexes = [
+            # Partial on published rows: filter(is_published=True) compiles to a bare
+            # boolean test, which SQLite matches against an index's WHERE clause but
+            # never uses as a leading index column.
+            # Published listings, newest first, and keyset seeks on (created_at, id)
+            models.Index(
+                fields=['created_at', 'id'],
+                condition=models.Q(is_published=True),
+                name='blog_article_published_idx',
+            ),
+            # Category pages: one range of the index per page
+            models.Index(
+                fields=['category', 'created_at', 'id'],
+                condition=models.Q(is_published=True),
+                name='blog_article_category_idx',
+            ),
+            # The list validators' newest published updated_at (blog/utils/conditional.py)
+            models.Index(
+                fields=['updated_at'],
+                condition=models.Q(is_published=True),
+                name='blog_article_updated_idx',
+            ),
+        ]
 
     source_field = 'title'  # Define the source field for the slug
 
@@ -33,8 +63,9 @@ class Article(BaseModelWithSlug, FeaturedImageModel):
         return reverse('article-detail', args=[self.slug])
 
     def update_search_index(self):
-        # Logic to update search index goes here
-        pass
+        """Refresh this article in the full-text search indexes"""
+        for backend in maintained_backends():
+            backend.index(self)
 
     @property
     def seo_meta_description(self):
@@ -48,87 +79,41 @@ class Article(BaseModelWithSlug, FeaturedImageModel):
 
     def clean_html_content(self, content):
         """Remove HTML tags and clean up text"""
-        # Remove HTML tags
-        soup = BeautifulSoup(content, 'html.parser')
-        text = soup.get_text(separator=' ')
-        
-        # Unescape HTML entities
-        text = unescape(text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return clean_html(content)
+
+    def analyze_content(self):
+        """
+        Clean and parse the content once, with the model for the article's language.
+        The result is kept on the instance until the content or language changes.
+        """
+        cached = getattr(self, '_content_analysis', None)
+        if cached is not None and cached[0] == (self.content, self.language):
+            return cached[1]
+
+        analysis = analyze_content(self.content, language=self.language)
+        self._content_analysis = ((self.content, self.language), analysis)
+        return analysis
 
-    def generate_excerpt(self, max_words=SPACY_SETTINGS['EXCERPT_MAX_WORDS']):
+    def generate_excerpt(self, max_words=SPACY_SETTINGS['EXCERPT_MAX_WORDS'], analysis=None):
         """Generate excerpt using spaCy"""
         if not self.content:
             return ""
 
         try:
-            # Load spaCy model
-            nlp = spacy.load(SPACY_SETTINGS['MODEL_NAME'])
-            
-            # Clean content
-            clean_text = self.clean_html_content(self.content)
-            
-            # Process the text
-            doc = nlp(clean_text)
-            
-            # Get sentences and their importance scores
-            sentences = list(doc.sents)
-            if not sentences:
-                return ""
-
-            # Take first few sentences that fit within word limit
-            excerpt = []
-            word_count = 0
-            
-            for sent in sentences:
-                sent_words = len(sent.text.split())
-                if word_count + sent_words <= SPACY_SETTINGS['EXCERPT_MAX_WORDS']:
-                    excerpt.append(sent.text)
-                    word_count += sent_words
-                else:
-                    break
-            
-            return ' '.join(excerpt).strip()
+            analysis = analysis or self.analyze_content()
+            return analysis.excerpt(max_words)
 
         except Exception as e:
             raise ValidationError(f"Error generating excerpt: {str(e)}")
 
-    def generate_meta_description(self, max_chars=SPACY_SETTINGS['META_DESCRIPTION_MAX_CHARS']):
+    def generate_meta_description(self, max_chars=SPACY_SETTINGS['META_DESCRIPTION_MAX_CHARS'], analysis=None):
         """Generate meta description using spaCy"""
         if not self.content:
             return ""
 
         try:
-            # Load spaCy model
-            nlp = spacy.load(SPACY_SETTINGS['MODEL_NAME'])
-            
-            # Clean content
-            clean_text = self.clean_html_content(self.content)
-            
-            # Process the text
-            doc = nlp(clean_text)
-            
-            # Get the most important sentence based on token importance
-            sentences = list(doc.sents)
-            if not sentences:
-                return ""
-
-            # Use the first sentence that's under the character limit
-            for sent in sentences:
-                if len(sent.text) <= SPACY_SETTINGS['META_DESCRIPTION_MAX_CHARS']:
-                    return sent.text.strip()
-            
-            # If no sentence is short enough, truncate the first sentence
-            first_sent = sentences[0].text.strip()
-            if len(first_sent) > SPACY_SETTINGS['META_DESCRIPTION_MAX_CHARS'] - 3:
-                return first_sent[:SPACY_SETTINGS['META_DESCRIPTION_MAX_CHARS'] - 3] + "..."
-
-                
-            return first_sent
+            analysis = analysis or self.analyze_content()
+            return analysis.meta_description(max_chars)
 
         except Exception as e:
             raise ValidationError(f"Error generating meta description: {str(e)}")
@@ -136,9 +121,12 @@ class Article(BaseModelWithSlug, FeaturedImageModel):
     def suggest_content_tags_and_categories(self):
         """Get suggestions for tags and categories"""
         suggestion_system = ContentSuggestionSystem(
-            content=f"{self.title}\n\n{self.content}",
+            content=self.content,
             existing_tags=list(self.tags.all()),
-            existing_categories=[self.category] if self.category else []
+            existing_categories=[self.category] if self.category else [],
+            analysis=self.analyze_content(),
+            title_analysis=analyze_content(self.title, language=self.language),
+            language=self.language,
         )
         
         suggested_tags = suggestion_system.suggest_tags()
@@ -177,12 +165,24 @@ class Article(BaseModelWithSlug, FeaturedImageModel):
                 )
 
     def save(self, *args, **kwargs):
-        # Generate excerpt if not provided
-        if not self.excerpt:
-            self.excerpt = self.generate_excerpt()
-        
-        # Generate meta description if not provided
-        if not self.meta_description:
-            self.meta_description = self.generate_meta_description()
-            
-        super().save(*args, **kwargs)
+        needs_summaries = not self.excerpt or not self.meta_description
+
+        if needs_summaries and not queue_enabled():
+            # Both fields below are built from the same parse (see analyze_content)
+
+            # Generate excerpt if not provided
+            if not self.excerpt:
+                self.excerpt = self.generate_excerpt()
+
+            # Generate meta description if not provided
+            if not self.meta_description:
+                self.meta_description = self.generate_meta_description()
+
+        # One transaction from pre_save to post_save: the article counters lock
+        # the stored row before the write and move their totals after it
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+
+        if needs_summaries and queue_enabled():
+            # Generated by a background worker once the transaction commits
+            enqueue('article.generate_summaries', article_id=self.pk)
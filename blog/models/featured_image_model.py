@@ -11,6 +11,7 @@ from blog.utils.image_utils import (
     process_single_image
 )
 from blog.settings import IMAGE_SETTINGS
+from blog.utils.job_queue import enqueue, queue_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -116,18 +117,28 @@ class FeaturedImageModel(models.Model):
     def save(self, *args, **kwargs):
         """Save the model and process images"""
         is_new_instance = self.pk is None
-        
+
         # Handle old image replacement
         if not is_new_instance:
             self.handle_old_featured_image()
 
+        # Only a freshly uploaded file needs resizing
+        needs_processing = bool(self.featured_image) and not self.featured_image._committed
+
         # Save instance first to apply upload_to logic
         super().save(*args, **kwargs)
 
-        # Process the featured image after initial save
-        if self.featured_image:
-            self.process_featured_image()
-            super().save(update_fields=['featured_image'])
+        if needs_processing:
+            if queue_enabled():
+                enqueue('image.process_featured_image', model=self._meta.label_lower, pk=self.pk)
+            else:
+                # Imported here: the page cache imports the models
+                from blog.utils.page_cache import update_derived
+
+                self.process_featured_image()
+                # Persist the new file name without a second full save(); updated_at
+                # moves with it, so cached cards and pages pick up the new image
+                update_derived(type(self), [self.pk], featured_image=self.featured_image.name)
 
     def delete(self, *args, **kwargs):
         """Delete all image variants when the model instance is deleted"""
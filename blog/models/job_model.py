@@ -0,0 +1,52 @@
+# blog/models/job_model.py
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class Job(models.Model):
+    """A unit of background work picked up by the `run_worker` command"""
+
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, _('Pending')),
+        (STATUS_RUNNING, _('Running')),
+        (STATUS_DONE, _('Done')),
+        (STATUS_FAILED, _('Failed')),
+    ]
+
+    task = models.CharField(max_length=100, verbose_name=_('Task'))
+    payload = models.JSONField(default=dict, blank=True, verbose_name=_('Payload'))
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        verbose_name=_('Status')
+    )
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name=_('Attempts'))
+    last_error = models.TextField(blank=True, verbose_name=_('Last Error'))
+    worker = models.CharField(max_length=100, blank=True, verbose_name=_('Worker'))
+    run_after = models.DateTimeField(default=timezone.now, verbose_name=_('Run After'))
+    created_at = models.DateTimeField(_('Created At'), auto_now_add=True)
+    started_at = models.DateTimeField(_('Started At'), null=True, blank=True)
+    finished_at = models.DateTimeField(_('Finished At'), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('Job')
+        verbose_name_plural = _('Jobs')
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='blog_job_status_run_after_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.status})"
+
+    @property
+    def duration(self):
+        if self.started_at and self.finished_at:
+            return self.finished_at - self.started_at
+        return None
@@ -0,0 +1,32 @@
+# blog/models/related_article_model.py
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class RelatedArticle(models.Model):
+    """One precomputed neighbour of an article, read by the detail page"""
+    article = models.ForeignKey(
+        'blog.Article',
+        on_delete=models.CASCADE,
+        related_name='related_links',
+        verbose_name=_('Article')
+    )
+    related = models.ForeignKey(
+        'blog.Article',
+        on_delete=models.CASCADE,
+        related_name='related_from',
+        verbose_name=_('Related Article')
+    )
+    rank = models.PositiveSmallIntegerField(verbose_name=_('Rank'))
+    score = models.FloatField(verbose_name=_('Score'))
+
+    class Meta:
+        verbose_name = _('Related Article')
+        verbose_name_plural = _('Related Articles')
+        ordering = ['article', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['article', 'rank'], name='blog_related_article_rank'),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id} -> {self.related_id} ({self.score:.3f})"
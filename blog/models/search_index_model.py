@@ -0,0 +1,65 @@
+# blog/models/search_index_model.py
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SearchDocument(models.Model):
+    """An indexed article and its length in tokens (for BM25 length normalisation)"""
+    article = models.OneToOneField(
+        'blog.Article',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_document',
+        verbose_name=_('Article')
+    )
+    length = models.PositiveIntegerField(default=0, verbose_name=_('Length'))
+    updated_at = models.DateTimeField(_('Updated At'), auto_now=True)
+
+    class Meta:
+        verbose_name = _('Search Document')
+        verbose_name_plural = _('Search Documents')
+
+    def __str__(self):
+        return f"{self.article_id} ({self.length} tokens)"
+
+
+class SearchTerm(models.Model):
+    """A term of the inverted index and the number of documents containing it"""
+    term = models.CharField(max_length=100, unique=True, verbose_name=_('Term'))
+    document_count = models.PositiveIntegerField(default=0, verbose_name=_('Document Count'))
+
+    class Meta:
+        verbose_name = _('Search Term')
+        verbose_name_plural = _('Search Terms')
+
+    def __str__(self):
+        return f"{self.term} ({self.document_count})"
+
+
+class SearchPosting(models.Model):
+    """Occurrences of one term in one document"""
+    # Posting lists are read through the (term, document) unique index below
+    term = models.ForeignKey(
+        SearchTerm,
+        on_delete=models.CASCADE,
+        related_name='postings',
+        db_index=False,
+        verbose_name=_('Term')
+    )
+    document = models.ForeignKey(
+        SearchDocument,
+        on_delete=models.CASCADE,
+        related_name='postings',
+        verbose_name=_('Document')
+    )
+    frequency = models.PositiveIntegerField(verbose_name=_('Frequency'))
+
+    class Meta:
+        verbose_name = _('Search Posting')
+        verbose_name_plural = _('Search Postings')
+        constraints = [
+            models.UniqueConstraint(fields=['term', 'document'], name='blog_search_posting_term_document'),
+        ]
+
+    def __str__(self):
+        return f"{self.term_id} in {self.document_id} x{self.frequency}"
@@ -13,6 +13,8 @@ from django.utils.text import slugify
 class Tag(FeaturedImageModel, BaseModelWithSlug):
     name = models.CharField(max_length=255, unique=True, verbose_name=_('Name'))
     description = models.TextField(blank=True, null=True, verbose_name=_('Description'))
+    # Published articles in this tag, kept up to date by blog/utils/article_counts.py
+    article_count = models.PositiveIntegerField(default=0, editable=False, verbose_name=_('Published articles'))
 
     class Meta:
         verbose_name = _('Tag')
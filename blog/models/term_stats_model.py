@@ -0,0 +1,56 @@
+# blog/models/term_stats_model.py
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class TermDocumentFrequency(models.Model):
+    """Number of articles whose tag candidates include a term"""
+    term = models.CharField(max_length=255, unique=True, verbose_name=_('Term'))
+    document_count = models.PositiveIntegerField(default=0, verbose_name=_('Document Count'))
+
+    class Meta:
+        verbose_name = _('Term Document Frequency')
+        verbose_name_plural = _('Term Document Frequencies')
+
+    def __str__(self):
+        return f"{self.term} ({self.document_count})"
+
+
+class ArticleTermStats(models.Model):
+    """Tag candidate term counts of one article, kept to update frequencies incrementally"""
+    article = models.OneToOneField(
+        'blog.Article',
+        on_delete=models.CASCADE,
+        related_name='term_stats',
+        verbose_name=_('Article')
+    )
+    terms = models.JSONField(default=dict, verbose_name=_('Terms'))
+    updated_at = models.DateTimeField(_('Updated At'), auto_now=True)
+
+    class Meta:
+        verbose_name = _('Article Term Statistics')
+        verbose_name_plural = _('Article Term Statistics')
+
+    def __str__(self):
+        return f"{self.article_id}: {len(self.terms)} terms"
+
+
+class ArticleTerm(models.Model):
+    """One tag candidate term of an article, so articles sharing a term are found by index"""
+    article = models.ForeignKey(
+        'blog.Article',
+        on_delete=models.CASCADE,
+        related_name='term_links',
+        verbose_name=_('Article')
+    )
+    term = models.CharField(max_length=255, verbose_name=_('Term'))
+
+    class Meta:
+        verbose_name = _('Article Term')
+        verbose_name_plural = _('Article Terms')
+        constraints = [
+            models.UniqueConstraint(fields=['term', 'article'], name='blog_article_term_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id}: {self.term}"
@@ -1,7 +1,12 @@
 import graphene
+from django.core.paginator import InvalidPage
 from graphene_django.types import DjangoObjectType
-from graphene.relay import Connection, ConnectionField
+from graphene.relay import Connection, ConnectionField, PageInfo
+from graphql import GraphQLError
 from .models import Category, Tag, Article
+from .settings import PAGINATION_SETTINGS
+from .utils.pagination import KeysetPaginator
+from .views.search_view import search_articles
 
 # Define GraphQL types for each model
 class CategoryType(DjangoObjectType):
@@ -13,21 +18,7 @@ class CategoryType(DjangoObjectType):
 class TagType(DjangoObjectType):
     class Meta:
         model = Tag
-        fields = ('id', 'name', 'description', 'slug', 'meta_title', 'meta_description', 'featured_image')
-
-class Query(graphene.ObjectType):
-    all_tags = graphene.List(TagType)
-    tag_by_slug = graphene.Field(TagType, slug=graphene.String(required=True))
-
-    def resolve_all_tags(root, info):
-        return Tag.objects.all()
-
-    def resolve_tag_by_slug(root, info, slug):
-        try:
-            return Tag.objects.get(slug=slug)
-        except Tag.DoesNotExist:
-            return None
-
+        fields = ('id', 'name', 'description', 'slug', 'meta_description', 'featured_image')
 
 class ArticleType(DjangoObjectType):
     class Meta:
@@ -42,14 +33,62 @@ class ArticleType(DjangoObjectType):
             'is_published',
             'is_featured',
             'created_at',
-            'modified_at',
+            'updated_at',
         )
 
+
+class SearchHitType(graphene.ObjectType):
+    article = graphene.Field(ArticleType)
+    score = graphene.Float()
+
+
+class SearchResultsType(graphene.ObjectType):
+    total = graphene.Int()
+    page = graphene.Int()
+    num_pages = graphene.Int()
+    has_next = graphene.Boolean()
+    hits = graphene.List(SearchHitType)
+
 # Define a connection for Articles to enable pagination
 class ArticleConnection(Connection):
     class Meta:
         node = ArticleType
 
+    # The engine's row estimate (keyset pagination only); null where it has none
+    approximate_count = graphene.Int()
+
+    def resolve_approximate_count(root, info):
+        paginator = getattr(root, 'paginator', None)
+        return paginator.approximate_count if paginator else None
+
+
+def keyset_connection(connection_type, queryset, first=None, last=None, after=None, before=None, **kwargs):
+    """
+    A relay connection read with a KeysetPaginator: edge cursors encode the
+    (created_at, id) key, so no page costs an OFFSET scan or a COUNT(*).
+    """
+    limit = PAGINATION_SETTINGS['MAX_CONNECTION_PAGE_SIZE']
+    backward = first is None and last is not None
+    size = min(last if backward else first if first is not None else limit, limit)
+    paginator = KeysetPaginator(queryset, limit)
+    try:
+        page = paginator.page(after=after, before=before, size=size, backward=backward)
+    except InvalidPage as e:
+        raise GraphQLError(str(e))
+
+    edges = [connection_type.Edge(node=node, cursor=page.cursor(node)) for node in page]
+    connection = connection_type(
+        edges=edges,
+        page_info=PageInfo(
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+            has_previous_page=page.has_previous(),
+            has_next_page=page.has_next(),
+        ),
+    )
+    connection.paginator = paginator
+    return connection
+
 # Define the Query class with pagination for Articles
 class Query(graphene.ObjectType):
     # Define paginated query for articles
@@ -62,7 +101,15 @@ class Query(graphene.ObjectType):
     #     skip=graphene.Int(),
     # )
     
+    tag_by_slug = graphene.Field(TagType, slug=graphene.String(required=True))
     article_by_slug = graphene.Field(ArticleType, slug=graphene.String(required=True))
+    # Ranked full-text search over published articles (same backend as the search page)
+    search_articles = graphene.Field(
+        SearchResultsType,
+        query=graphene.String(required=True),
+        page=graphene.Int(default_value=1),
+        per_page=graphene.Int(),
+    )
 
     # Resolvers
     def resolve_all_categories(root, info):
@@ -72,14 +119,34 @@ class Query(graphene.ObjectType):
         return Tag.objects.all()
 
     def resolve_all_articles(self, info, **kwargs):
-        return  Article.objects.filter(is_published=True)  # Only fetch published articles
+        # Only fetch published articles; category and tags are batched rather than queried per node
+        articles = Article.objects.filter(is_published=True).select_related('category').prefetch_related('tags')
+        if PAGINATION_SETTINGS['KEYSET']:
+            return keyset_connection(ArticleConnection, articles, **kwargs)
+        return articles
+
 
+    def resolve_tag_by_slug(root, info, slug):
+        try:
+            return Tag.objects.get(slug=slug)
+        except Tag.DoesNotExist:
+            return None
+
+    def resolve_search_articles(root, info, query, page=1, per_page=None):
+        results, hits = search_articles(query, page, per_page)
+        return SearchResultsType(
+            total=results.total,
+            page=results.page,
+            num_pages=results.num_pages,
+            has_next=results.has_next,
+            hits=[SearchHitType(article=article, score=score) for article, score in hits],
+        )
 
     def resolve_article_by_slug(root, info, slug):
         print(f'Received slug: {slug}')  # Debugging
         try:
             # Fetch the article based on the slug
-            return Article.objects.get(slug=slug)
+            return Article.objects.select_related('category').prefetch_related('tags').get(slug=slug)
         except Article.DoesNotExist:
             return None  # Return None if article with slug doesn't exist
 
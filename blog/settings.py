@@ -4,7 +4,186 @@ from django.conf import settings
 SPACY_SETTINGS = {
     'EXCERPT_MAX_WORDS': 25,
     'META_DESCRIPTION_MAX_CHARS': 160,
-    'MODEL_NAME': 'en_core_web_sm'
+    # Default model, used for languages missing from LANGUAGE_MODELS
+    'MODEL_NAME': 'en_core_web_sm',
+
+    # Model per article language; 'blank:<lang>' is a tokenizer + sentencizer
+    # for languages without a trained spaCy pipeline
+    'LANGUAGE_MODELS': {
+        'en': 'en_core_web_sm',
+        'sv': 'sv_core_news_sm',
+        'sr': 'blank:sr',
+    },
+    # Least recently used models are unloaded once the pool's RSS growth exceeds this (0 = no cap)
+    'MODEL_POOL_MAX_MB': 1024,
+
+    # Named entity labels that make tag/category topics, per spaCy language whose
+    # models use another label scheme than the English one (text_analysis.TOPIC_ENTITY_LABELS)
+    'TOPIC_ENTITY_LABELS': {
+        # Swedish models label people and places PRS / LOC
+        'sv': ['ORG', 'PRS', 'LOC'],
+    },
+    # Pipeline components switched off per task (names missing from a model are ignored)
+    'TASK_DISABLED_PIPES': {
+        'analysis': ['lemmatizer'],
+        'sentences': ['ner', 'lemmatizer'],
+    },
+}
+
+# Cache for spaCy analysis results, keyed by a hash of the cleaned content
+NLP_CACHE_SETTINGS = {
+    'ENABLED': True,
+    # Falls back to the default cache when this alias is not configured
+    'CACHE_ALIAS': 'nlp',
+    'TIMEOUT': 60 * 60 * 24 * 30,
+    'KEY_PREFIX': 'nlp-analysis',
+}
+
+# In-memory Tag/Category name index used by content suggestions
+TAXONOMY_INDEX_SETTINGS = {
+    # Cache holding the index version; use a shared cache with several workers
+    'CACHE_ALIAS': 'default',
+    # Seconds before an index is rebuilt even without an invalidation
+    'MAX_AGE': 300,
+}
+
+# Background jobs (see blog/utils/job_queue.py and the run_worker command)
+JOB_QUEUE_SETTINGS = {
+    # When disabled, slow save-time work runs inline as before
+    'ENABLED': True,
+    # Run queued tasks right after commit in the current process (no worker needed)
+    'ALWAYS_EAGER': False,
+    'MAX_ATTEMPTS': 3,
+    # Seconds before a failed job is retried (multiplied by the attempt number)
+    'RETRY_DELAY': 30,
+    # Seconds an idle worker waits before polling again
+    'POLL_INTERVAL': 1.0,
+    # Running jobs older than this (seconds) are assumed orphaned and re-queued
+    'STALE_AFTER': 15 * 60,
+}
+
+# Article generation with the OpenAI chat API (see blog/utils/openai_utils.py)
+OPENAI_SETTINGS = {
+    'MODEL': 'gpt-3.5-turbo',
+    'MAX_TOKENS': 1500,
+    'TEMPERATURE': 0.7,
+    # Any OpenAI-compatible endpoint, e.g. a proxy or a local stub in tests (None = api.openai.com)
+    'BASE_URL': None,
+    # Requests in flight at once during batch generation
+    'CONCURRENCY': 4,
+    # Retries after rate limits, timeouts and 5xx errors, with exponential backoff (seconds)
+    'MAX_RETRIES': 3,
+    'BACKOFF_BASE': 1.0,
+    'BACKOFF_MAX': 30.0,
+    'TIMEOUT': 120.0,
+    # Responses cached by a hash of the prompt and generation parameters
+    'CACHE_ALIAS': 'nlp',
+    'CACHE_TIMEOUT': 60 * 60 * 24 * 30,
+    'KEY_PREFIX': 'openai-article',
+}
+
+# Tag/category suggestions for the article admin (see blog/utils/suggestion_service.py)
+SUGGESTION_SETTINGS = {
+    # Threads computing suggestions in each web process
+    'MAX_WORKERS': 2,
+    # Distinct computations allowed in flight before requests are turned away
+    'MAX_PENDING': 32,
+    # Seconds a request waits for a result before answering 202 and letting the client poll
+    'WAIT': 0.5,
+    # Results and in-flight markers; every web process must share this cache (with several
+    # hosts, a network cache), since a 202 poll can land on another process
+    'CACHE_ALIAS': 'nlp',
+    'CACHE_TIMEOUT': 60 * 60,
+    # Seconds a computation claimed by another process is waited for before starting a new one
+    'PENDING_TIMEOUT': 2 * 60,
+    # Seconds a failure is remembered, so polling clients see it
+    'ERROR_TIMEOUT': 30,
+    'KEY_PREFIX': 'article-suggestions',
+}
+
+# Full-text search (see blog/utils/search_backends.py and the BM25 index in blog/utils/search_index.py)
+SEARCH_SETTINGS = {
+    # 'auto' (the database's native full-text index, else the BM25 index), 'fts5', 'postgres' or 'inverted'.
+    # The BM25 index is kept current alongside a native one, so switching to it needs no rebuild.
+    'BACKEND': 'auto',
+    # PostgreSQL text search configuration per article language
+    'POSTGRES_CONFIGS': {
+        'en': 'english',
+        'sv': 'swedish',
+        'sr': 'simple',
+    },
+    # Title tokens count this many times towards a term's frequency
+    'TITLE_WEIGHT': 3,
+    'BM25_K1': 1.2,
+    'BM25_B': 0.75,
+    # Terms in more than this share of documents are skipped when the query has rarer ones
+    'MAX_DOCUMENT_RATIO': 0.5,
+    'RESULTS_PER_PAGE': 10,
+    # Cache for the document count / average length used by BM25
+    'CACHE_ALIAS': 'default',
+    'STATS_TIMEOUT': 5 * 60,
+}
+
+# Search-as-you-type over titles, tags and categories (see blog/utils/autocomplete.py)
+AUTOCOMPLETE_SETTINGS = {
+    # Completions returned by default, and the most a request may ask for
+    'LIMIT': 8,
+    'TOP_CAPACITY': 10,
+    'MIN_PREFIX': 1,
+    # Title words a completion may start at, and how much of a key is kept
+    'MAX_WORD_STARTS': 8,
+    'MAX_KEY_LENGTH': 40,
+    # Popularity: tags and categories score their published article count
+    'ARTICLE_SCORE': 1,
+    'FEATURED_ARTICLE_SCORE': 5,
+    # Cache holding the trie version; use a shared cache with several workers
+    'CACHE_ALIAS': 'default',
+    # Seconds before the trie is rebuilt even without a version change
+    'MAX_AGE': 60 * 60,
+}
+
+# Article lists, taxonomy pages, the admin changelist and the GraphQL connections
+# (see blog/utils/pagination.py)
+PAGINATION_SETTINGS = {
+    # Paginators that allow it report the engine's row estimate instead of COUNT(*) above this
+    # size; only for whole tables, and on SQLite only once ANALYZE has gathered statistics
+    'ESTIMATE_COUNT_ABOVE': 10000,
+    # Page article lists and the GraphQL allArticles connection by (created_at, id)
+    # cursors instead of page numbers (no OFFSET, no COUNT(*))
+    'KEYSET': False,
+    # Keyset connections return at most this many edges; also the size when first/last are omitted
+    'MAX_CONNECTION_PAGE_SIZE': 100,
+}
+
+# Whole public pages, purged when their content changes (see blog/utils/page_cache.py)
+PAGE_CACHE_SETTINGS = {
+    'ENABLED': True,
+    # A file or locmem cache works; pages are shared by all workers only with a shared backend
+    'CACHE_ALIAS': 'pages',
+    # Purges retire pages as soon as content changes; this only bounds how long orphans linger
+    'TIMEOUT': 60 * 60 * 24,
+}
+
+# Rendered article cards, keyed by article version and language (see blog/utils/fragment_cache.py)
+FRAGMENT_CACHE_SETTINGS = {
+    'ENABLED': True,
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 60 * 60 * 24,
+}
+
+# Precomputed "related articles" shown on the article detail page
+RELATED_ARTICLES_SETTINGS = {
+    # Neighbours stored per article
+    'COUNT': 4,
+    # Weights of tag overlap (Jaccard), same category and tf-idf cosine similarity
+    'TAG_WEIGHT': 1.0,
+    'CATEGORY_WEIGHT': 0.5,
+    'CONTENT_WEIGHT': 1.0,
+    # Neighbours scoring below this are left out
+    'MIN_SCORE': 0.05,
+    # A refresh scores at most this many articles from each of: most shared tags,
+    # most shared terms, newest of the same category
+    'MAX_CANDIDATES': 200,
 }
 
 # Image Processing Settings
@@ -35,5 +214,27 @@ try:
     # Update with any user-defined settings
     if hasattr(settings, 'BLOG_IMAGE_SETTINGS'):
         IMAGE_SETTINGS.update(settings.BLOG_IMAGE_SETTINGS)
+    if hasattr(settings, 'BLOG_SPACY_SETTINGS'):
+        SPACY_SETTINGS.update(settings.BLOG_SPACY_SETTINGS)
+    if hasattr(settings, 'BLOG_NLP_CACHE_SETTINGS'):
+        NLP_CACHE_SETTINGS.update(settings.BLOG_NLP_CACHE_SETTINGS)
+    if hasattr(settings, 'BLOG_JOB_QUEUE_SETTINGS'):
+        JOB_QUEUE_SETTINGS.update(settings.BLOG_JOB_QUEUE_SETTINGS)
+    if hasattr(settings, 'BLOG_OPENAI_SETTINGS'):
+        OPENAI_SETTINGS.update(settings.BLOG_OPENAI_SETTINGS)
+    if hasattr(settings, 'BLOG_SUGGESTION_SETTINGS'):
+        SUGGESTION_SETTINGS.update(settings.BLOG_SUGGESTION_SETTINGS)
+    if hasattr(settings, 'BLOG_SEARCH_SETTINGS'):
+        SEARCH_SETTINGS.update(settings.BLOG_SEARCH_SETTINGS)
+    if hasattr(settings, 'BLOG_AUTOCOMPLETE_SETTINGS'):
+        AUTOCOMPLETE_SETTINGS.update(settings.BLOG_AUTOCOMPLETE_SETTINGS)
+    if hasattr(settings, 'BLOG_PAGINATION_SETTINGS'):
+        PAGINATION_SETTINGS.update(settings.BLOG_PAGINATION_SETTINGS)
+    if hasattr(settings, 'BLOG_PAGE_CACHE_SETTINGS'):
+        PAGE_CACHE_SETTINGS.update(settings.BLOG_PAGE_CACHE_SETTINGS)
+    if hasattr(settings, 'BLOG_FRAGMENT_CACHE_SETTINGS'):
+        FRAGMENT_CACHE_SETTINGS.update(settings.BLOG_FRAGMENT_CACHE_SETTINGS)
+    if hasattr(settings, 'BLOG_RELATED_ARTICLES_SETTINGS'):
+        RELATED_ARTICLES_SETTINGS.update(settings.BLOG_RELATED_ARTICLES_SETTINGS)
 except ImportError:
     pass
\ No newline at end of file
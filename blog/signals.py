@@ -1,7 +1,16 @@
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
+from django.db import transaction
 from django.dispatch import receiver
 from django.utils.text import Truncator
 from .models.article_model import Article
+from .models.category_model import Category
+from .models.tag_model import Tag
+from .models.related_article_model import RelatedArticle
+from .utils import article_counts, autocomplete, page_cache
+from .utils.job_queue import run_or_enqueue
+from .utils.search_backends import maintained_backends
+from .utils.taxonomy_index import invalidate_taxonomy_index
+from .utils.term_stats import remove_article_terms
 
 # @receiver(pre_save, sender=Article)
 # def set_excerpt(sender, instance, **kwargs):
@@ -9,6 +18,195 @@ from .models.article_model import Article
 #         instance.excerpt = Truncator(instance.content).chars(120, truncate='...')
 
 @receiver(post_save, sender=Article)
-def update_search_index(sender, instance, **kwargs):
+def update_search_index(sender, instance, raw=False, **kwargs):
     # Automatically update search index when an article is saved
+    if raw:
+        return
     instance.update_search_index()
+
+
+@receiver(pre_delete, sender=Article)
+def remove_from_search_index(sender, instance, **kwargs):
+    # Release the article's terms before the cascade drops its postings
+    for backend in maintained_backends():
+        backend.remove(instance.pk)
+
+
+@receiver(post_save, sender=Article)
+def update_term_stats(sender, instance, raw=False, **kwargs):
+    # Keep the tf-idf document frequencies and related articles in step with the article
+    if raw:
+        return
+    run_or_enqueue('article.update_term_stats', article_id=instance.pk)
+    # That task refreshes the related articles too, after this transaction's tag changes
+    instance._related_refresh_scheduled = True
+    transaction.on_commit(lambda: vars(instance).pop('_related_refresh_scheduled', None))
+
+
+@receiver(pre_delete, sender=Article)
+def remove_term_stats(sender, instance, **kwargs):
+    # Before the cascade drops the article's term row and related links
+    remove_article_terms(instance.pk)
+    listed_by = list(RelatedArticle.objects.filter(related_id=instance.pk).values_list('article_id', flat=True))
+    if listed_by:
+        run_or_enqueue('article.recompute_related_articles', article_ids=listed_by)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def update_related_articles(sender, instance, action, reverse, pk_set, **kwargs):
+    # Shared tags changed, so tag overlap scores changed
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        # Article ids; a remove or clear uses the links update_tag_counts saw go (pk_set is None on clear)
+        article_ids = pk_set if action == 'post_add' else getattr(instance, '_unlinked_ids', ())
+    elif getattr(instance, '_related_refresh_scheduled', False):
+        # Saved in this transaction: its update_term_stats job covers the new tags
+        return
+    else:
+        article_ids = [instance.pk]
+    if article_ids:
+        # One job for a whole tag.articles.add(...)
+        run_or_enqueue('article.update_related_articles', article_ids=sorted(article_ids))
+
+
+@receiver(pre_save, sender=Article)
+def remember_stored_state(sender, instance, raw=False, **kwargs):
+    # Slug, category and publication as stored: the counters and cached pages follow the change
+    if raw:
+        return
+    instance._stored_state = article_counts.stored_state(instance)
+
+
+@receiver(post_save, sender=Article)
+def update_article_counts(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    article_counts.article_saved(instance, getattr(instance, '_stored_state', None))
+
+
+@receiver(pre_delete, sender=Article)
+def release_article_counts(sender, instance, **kwargs):
+    article_counts.article_deleted(instance)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def update_tag_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    # pk_set holds article ids when the change comes from the tag side
+    related = instance.articles if reverse else instance.tags
+    if action == 'pre_remove':
+        # Only links that exist are removed (post_add already gets just the new ones)
+        instance._unlinked_ids = list(related.filter(pk__in=pk_set).values_list('pk', flat=True))
+    elif action == 'pre_clear':
+        instance._unlinked_ids = list(related.values_list('pk', flat=True))
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        changed = pk_set if action == 'post_add' else getattr(instance, '_unlinked_ids', ())
+        if not changed:
+            return
+        delta = 1 if action == 'post_add' else -1
+        if reverse:
+            article_counts.tags_linked(changed, [instance.pk], delta)
+        else:
+            article_counts.tags_linked([instance.pk], changed, delta)
+
+
+@receiver(post_save, sender=Article)
+def update_autocomplete(sender, instance, raw=False, **kwargs):
+    # Title, publication and featured flag, plus the popularity of its categories and tags;
+    # registered after update_article_counts, so the stored counts have moved
+    if raw:
+        return
+    autocomplete.update_article(instance, getattr(instance, '_stored_state', None))
+
+
+@receiver(pre_delete, sender=Article)
+def remove_from_autocomplete(sender, instance, **kwargs):
+    # After release_article_counts, while its tags are still linked
+    autocomplete.remove_article(instance)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def update_autocomplete_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    # Tag popularity is the stored count update_tag_counts has just moved
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        autocomplete.update_taxonomies(Tag, [instance.pk])
+    elif instance.is_published:
+        # pk_set is None on clear: use the links update_tag_counts saw go
+        changed = pk_set if action == 'post_add' else getattr(instance, '_unlinked_ids', ())
+        if changed:
+            autocomplete.update_taxonomies(Tag, changed)
+
+
+@receiver(post_save, sender=Article)
+def purge_article_pages(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    page_cache.purge_article(instance, getattr(instance, '_stored_state', None))
+
+
+@receiver(pre_delete, sender=Article)
+def purge_deleted_article_pages(sender, instance, **kwargs):
+    # Before the cascade unlinks its tags and related articles
+    page_cache.purge_article(instance)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def purge_tag_link_pages(sender, instance, action, reverse, pk_set, **kwargs):
+    # Runs after update_tag_counts, which remembers the links a remove or clear dropped
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    changed = pk_set if action == 'post_add' else getattr(instance, '_unlinked_ids', ())
+    if not changed:
+        return
+    if reverse:
+        page_cache.purge_tag_links(changed, [instance.pk])
+    else:
+        page_cache.purge_tag_links([instance.pk], changed)
+
+
+@receiver(pre_save, sender=Tag)
+@receiver(pre_save, sender=Category)
+def remember_stored_slug(sender, instance, raw=False, **kwargs):
+    if raw or instance.pk is None:
+        return
+    instance._stored_slug = sender.objects.filter(pk=instance.pk).values_list('slug', flat=True).first()
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_save, sender=Category)
+def purge_taxonomy_pages(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    page_cache.purge_taxonomy(instance, getattr(instance, '_stored_slug', None))
+
+
+@receiver(pre_delete, sender=Tag)
+@receiver(pre_delete, sender=Category)
+def purge_deleted_taxonomy_pages(sender, instance, **kwargs):
+    # While its articles are still linked
+    page_cache.purge_taxonomy(instance)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_save, sender=Category)
+def update_autocomplete_taxonomy(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    autocomplete.update_taxonomies(sender, [instance.pk])
+
+
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=Category)
+def remove_autocomplete_taxonomy(sender, instance, **kwargs):
+    autocomplete.remove_taxonomy(sender, instance.pk)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_taxonomy_suggestion_index(sender, **kwargs):
+    # Names or slugs changed, so suggestion lookups must see a fresh index
+    invalidate_taxonomy_index(sender)
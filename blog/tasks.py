@@ -0,0 +1,89 @@
+# blog/tasks.py
+import logging
+from django.apps import apps
+from blog.models.article_model import Article
+from blog.utils.job_queue import register_task
+from blog.utils.openai_utils import article_prompt, generate_articles
+from blog.utils.page_cache import update_derived
+from blog.utils.related_articles import recompute_related_articles, refresh_related_articles
+from blog.utils.term_stats import update_article_terms
+
+logger = logging.getLogger(__name__)
+
+
+@register_task('article.generate_summaries')
+def generate_article_summaries(article_id):
+    """Fill a blank excerpt and meta description from one spaCy analysis"""
+    article = Article.objects.filter(pk=article_id).only('pk', 'content', 'language', 'excerpt', 'meta_description').first()
+    if article is None:
+        return
+
+    fields = {}
+    if not article.excerpt:
+        fields['excerpt'] = article.generate_excerpt()
+    if not article.meta_description:
+        fields['meta_description'] = article.generate_meta_description()
+
+    if fields:
+        # Queryset update: no second save() and no signals for derived fields
+        update_derived(Article, [article_id], **fields)
+
+
+@register_task('image.process_featured_image')
+def process_featured_image(model, pk):
+    """Create the resized WebP variants for a model's featured image"""
+    model_class = apps.get_model(model)
+    instance = model_class.objects.filter(pk=pk).first()
+    if instance is None or not instance.featured_image:
+        return
+
+    instance.process_featured_image()
+    update_derived(model_class, [pk], featured_image=instance.featured_image.name)
+
+
+@register_task('article.update_term_stats')
+def update_term_stats(article_id):
+    """Refresh an article's tag candidate terms, the corpus document frequencies and its related articles"""
+    article = Article.objects.filter(pk=article_id).only('pk', 'title', 'content', 'language').first()
+    if article is None:
+        return
+
+    update_article_terms(article)
+    # Content similarity reads the terms just stored
+    refresh_related_articles([article_id])
+
+
+@register_task('article.update_related_articles')
+def update_related_articles(article_ids):
+    """Recompute the related articles of articles whose tags changed and of the articles they affect"""
+    refresh_related_articles(article_ids)
+
+
+@register_task('article.recompute_related_articles')
+def recompute_related(article_ids):
+    """Recompute the related articles of the given articles only"""
+    recompute_related_articles(article_ids)
+
+
+@register_task('article.generate_content')
+def generate_article_content(article_ids):
+    """
+    Write the content of articles from their titles (the admin action).
+    Prompts run concurrently and finished ones are cached, so a retry after
+    a partial failure only asks the API for the articles that failed.
+    """
+    articles = list(Article.objects.filter(pk__in=article_ids).order_by('pk'))
+    results = generate_articles([article_prompt(article.title) for article in articles])
+
+    failed = []
+    for article, result in zip(articles, results):
+        if isinstance(result, Exception):
+            logger.error(f"Content generation failed for article {article.pk}: {result}")
+            failed.append(article.pk)
+        elif article.content != result:
+            article.content = result
+            article.save()
+
+    if failed:
+        # Lets the job queue retry; saved articles are skipped next time
+        raise RuntimeError(f"Content generation failed for articles {failed}")
@@ -15,6 +15,15 @@ def reading_time(content):
     minutes = math.ceil(word_count / 200)  # Average reading speed
     return f"{minutes} {_('min read')}"
 
+@register.simple_tag(takes_context=True)
+def page_url(context, number):
+    """
+    URL of page `number` of the view being rendered (see PageLinksMixin).
+
+    Usage: {% page_url page_obj.next_page_number %}
+    """
+    return context['view'].get_page_url(number)
+
 @register.filter
 def relative_date(value):
     """
@@ -0,0 +1,26 @@
+from django import template
+from django.utils.safestring import mark_safe
+from blog.settings import FRAGMENT_CACHE_SETTINGS
+from blog.utils.fragment_cache import render_many
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def cached_cards(context, objects, template_name='blog/components/article_item.html', name='article'):
+    """
+    Render `template_name` once per object, like {% include %} in a for loop,
+    through the fragment cache (see blog/utils/fragment_cache.py).
+
+    Usage: {% cached_cards article_list %}
+    """
+    card = context.template.engine.get_template(template_name)
+
+    def render(obj):
+        with context.push(**{name: obj}):
+            return card.render(context)
+
+    objects = list(objects)
+    if not FRAGMENT_CACHE_SETTINGS['ENABLED']:
+        return mark_safe(''.join(render(obj) for obj in objects))
+    return mark_safe(''.join(render_many(template_name, objects, render)))
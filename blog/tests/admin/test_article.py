@@ -0,0 +1,94 @@
+# blog/tests/admin/test_article.py
+import pytest
+from django.db import connection
+from django.urls import reverse
+from blog.models.article_model import Article
+from blog.models.job_model import Job
+from blog.models.category_model import Category
+from blog.settings import PAGINATION_SETTINGS, SEARCH_SETTINGS
+from blog.utils.pagination import EstimatedCountPaginator
+
+
+def create_article(title, content):
+    category, _ = Category.objects.get_or_create(name="General")
+    return Article.objects.create(title=title, content=content, excerpt="x", meta_description="x", category=category)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('backend', ['auto', 'inverted'])
+def test_changelist_search_uses_the_index(admin_client, monkeypatch, backend):
+    monkeypatch.setitem(SEARCH_SETTINGS, 'BACKEND', backend)
+    match = create_article("Release notes", "<p>The <b>kubernetes</b> operator.</p>")
+    create_article("Other", "<p>Nothing to see.</p>")
+
+    response = admin_client.get(reverse('admin:blog_article_changelist'), {'q': 'Kubernetes'})
+
+    assert response.status_code == 200
+    assert list(response.context['cl'].result_list) == [match]
+    assert response.context['cl'].full_result_count is None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('backend', ['auto', 'inverted'])
+def test_changelist_search_needs_every_word(admin_client, monkeypatch, backend):
+    monkeypatch.setitem(SEARCH_SETTINGS, 'BACKEND', backend)
+    both = create_article("Django async views", "<p>Body.</p>")
+    create_article("Django forms", "<p>Body.</p>")
+    create_article("Async Rust", "<p>Body.</p>")
+
+    response = admin_client.get(reverse('admin:blog_article_changelist'), {'q': 'django async'})
+
+    assert list(response.context['cl'].result_list) == [both]
+
+
+@pytest.mark.django_db
+def test_paginator_estimates_big_unfiltered_tables(monkeypatch):
+    articles = [create_article(f"Article {i}", "<p>Body.</p>") for i in range(3)]
+    articles[0].delete()
+    queryset = Article.objects.order_by('pk')
+    monkeypatch.setitem(PAGINATION_SETTINGS, 'ESTIMATE_COUNT_ABOVE', 1)
+
+    # No statistics yet: counted exactly, deleted rows and all
+    assert EstimatedCountPaginator(queryset, 10).count == 2
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    create_article("Article 3", "<p>Body.</p>")
+    # The row count as of the last ANALYZE
+    assert EstimatedCountPaginator(queryset, 10).count == 2
+    # Filtered querysets are always counted
+    assert EstimatedCountPaginator(queryset.filter(title__startswith="Article"), 10).count == 3
+
+    monkeypatch.setitem(PAGINATION_SETTINGS, 'ESTIMATE_COUNT_ABOVE', 10000)
+    assert EstimatedCountPaginator(queryset, 10).count == 3
+
+
+@pytest.mark.django_db
+def test_generate_content_action_queues_a_job(admin_client, settings, django_capture_on_commit_callbacks):
+    settings.OPENAI_API_KEY = 'test-key'
+    articles = [create_article(f"Topic {i}", "<p>Draft.</p>") for i in range(2)]
+    Job.objects.all().delete()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = admin_client.post(reverse('admin:blog_article_changelist'), {
+            'action': 'generate_article_content',
+            '_selected_action': [article.pk for article in articles],
+        })
+
+    assert response.status_code == 302
+    [job] = Job.objects.filter(task='article.generate_content')
+    assert sorted(job.payload['article_ids']) == sorted(article.pk for article in articles)
+
+
+@pytest.mark.django_db
+def test_generate_content_action_needs_an_api_key(admin_client, settings, django_capture_on_commit_callbacks):
+    settings.OPENAI_API_KEY = None
+    article = create_article("Topic", "<p>Draft.</p>")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = admin_client.post(reverse('admin:blog_article_changelist'), {
+            'action': 'generate_article_content', '_selected_action': [article.pk],
+        }, follow=True)
+
+    assert 'OPENAI_API_KEY is not set' in response.content.decode()
+    assert not Job.objects.filter(task='article.generate_content').exists()
@@ -0,0 +1,54 @@
+# blog/tests/conftest.py
+import pytest
+import spacy
+from django.core.cache import caches
+from blog.settings import NLP_CACHE_SETTINGS, PAGE_CACHE_SETTINGS
+from blog.utils import spicy_utils
+from blog.utils.nlp_cache import analysis_cache
+
+
+class CountingPipeline:
+    """Blank spaCy pipeline standing in for the shared model; counts parses."""
+
+    def __init__(self):
+        self.nlp = spacy.blank('en')
+        self.nlp.add_pipe('sentencizer')
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return self.nlp(text)
+
+    def pipe(self, texts, **kwargs):
+        kwargs.pop('disable', None)
+        for result in self.nlp.pipe(texts, **kwargs):
+            self.calls += 1
+            yield result
+
+
+@pytest.fixture
+def nlp_pipeline(monkeypatch):
+    """Replace the spaCy registry with a blank model and an isolated analysis cache."""
+    pipeline = CountingPipeline()
+    monkeypatch.setattr(spicy_utils.registry, 'get_pipeline', lambda task, model_name=None, language=None: pipeline)
+    # Keep cached analyses in the per-process cache, away from the file cache
+    monkeypatch.setitem(NLP_CACHE_SETTINGS, 'CACHE_ALIAS', 'default')
+    caches['default'].clear()
+    analysis_cache.reset_stats()
+    return pipeline
+
+
+@pytest.fixture(autouse=True)
+def no_page_cache(monkeypatch):
+    """Render every request; tests of the page cache turn it back on (see page_cache fixture)."""
+    monkeypatch.setitem(PAGE_CACHE_SETTINGS, 'ENABLED', False)
+    # Purges still run on every save; keep them out of the file cache
+    monkeypatch.setitem(PAGE_CACHE_SETTINGS, 'CACHE_ALIAS', 'default')
+
+
+@pytest.fixture
+def page_cache(monkeypatch, no_page_cache):
+    """The page cache on, in the per-process cache and empty."""
+    monkeypatch.setitem(PAGE_CACHE_SETTINGS, 'ENABLED', True)
+    caches['default'].clear()
+    return caches['default']
@@ -0,0 +1,64 @@
+# blog/tests/management/test_backfill_nlp.py
+import json
+import pytest
+from django.core.management import call_command
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.utils import page_cache
+from blog.utils.page_cache import article_group
+
+
+@pytest.fixture
+def imported_articles(nlp_pipeline):
+    """Articles as they arrive from an import: no excerpt, no meta description."""
+    category = Category.objects.create(name="Imports")
+    Article.objects.bulk_create([
+        Article(
+            title=f"Imported {i}",
+            slug=f"imported-{i}",
+            content=f"<p>Article number {i} starts here.</p><p>It goes on.</p>",
+            category=category,
+        )
+        for i in range(5)
+    ])
+    return Article.objects.order_by('pk')
+
+
+@pytest.mark.django_db
+def test_backfill_fills_empty_fields(imported_articles, nlp_pipeline, tmp_path):
+    checkpoint = tmp_path / "checkpoint.json"
+
+    call_command('backfill_nlp', batch_size=2, checkpoint=str(checkpoint))
+
+    assert nlp_pipeline.calls == 5
+    for i, article in enumerate(imported_articles):
+        assert article.excerpt == f"Article number {i} starts here. It goes on."
+        assert article.meta_description == f"Article number {i} starts here."
+    assert json.loads(checkpoint.read_text()) == {'last_pk': imported_articles.last().pk}
+
+
+@pytest.mark.django_db
+def test_backfill_resumes_after_checkpoint(imported_articles, nlp_pipeline, tmp_path):
+    checkpoint = tmp_path / "checkpoint.json"
+    checkpoint.write_text(json.dumps({'last_pk': imported_articles[2].pk}))
+
+    call_command('backfill_nlp', batch_size=2, checkpoint=str(checkpoint))
+
+    assert nlp_pipeline.calls == 2
+    assert [bool(article.excerpt) for article in imported_articles] == [False, False, False, True, True]
+
+
+@pytest.mark.django_db
+def test_backfill_retires_published_pages(imported_articles, nlp_pipeline, tmp_path, monkeypatch):
+    imported_articles.filter(pk=imported_articles[0].pk).update(is_published=True)
+    before = imported_articles[0].updated_at
+    purged = []
+    monkeypatch.setattr(page_cache, 'purge', lambda *groups: purged.extend(groups))
+
+    call_command('backfill_nlp', batch_size=2, checkpoint=str(tmp_path / "checkpoint.json"))
+
+    article = imported_articles[0]
+    assert article.updated_at > before
+    assert article_group(article.slug) in purged
+    # Drafts are on no public page
+    assert article_group(imported_articles[1].slug) not in purged
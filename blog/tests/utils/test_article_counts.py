@@ -0,0 +1,94 @@
+# blog/tests/utils/test_article_counts.py
+import pytest
+from django.core.management import call_command
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.tag_model import Tag
+from blog.utils.article_counts import recount
+
+
+@pytest.fixture
+def taxonomy(db):
+    python = Category.objects.create(name="Python", slug="python")
+    rust = Category.objects.create(name="Rust", slug="rust")
+    tags = [Tag.objects.create(name=name, slug=name.lower()) for name in ("Django", "Async", "Tooling")]
+    return python, rust, tags
+
+
+def make_article(title, category, **kwargs):
+    return Article.objects.create(
+        title=title, content="<p>Body.</p>", excerpt="x", meta_description="x", category=category, **kwargs
+    )
+
+
+def counts(*objects):
+    return [type(obj).objects.values_list('article_count', flat=True).get(pk=obj.pk) for obj in objects]
+
+
+def assert_consistent():
+    assert recount(Category) == {} and recount(Tag) == {}
+
+
+def test_publish_toggle_and_category_move(taxonomy):
+    python, rust, (django, asyncio, tooling) = taxonomy
+    article = make_article("Views", python)
+    article.tags.add(django, asyncio)
+    assert counts(python, django, asyncio) == [0, 0, 0]
+
+    article.is_published = True
+    article.save()
+    assert counts(python, rust, django, asyncio) == [1, 0, 1, 1]
+
+    article.category = rust
+    article.save()
+    assert counts(python, rust, django) == [0, 1, 1]
+
+    article.is_published = False
+    article.save()
+    assert counts(rust, django, asyncio) == [0, 0, 0]
+    assert_consistent()
+
+
+def test_tag_links_from_both_sides(taxonomy):
+    python, _, (django, asyncio, tooling) = taxonomy
+    first = make_article("First", python, is_published=True)
+    second = make_article("Second", python, is_published=True)
+    draft = make_article("Draft", python)
+
+    first.tags.add(django, asyncio)
+    django.articles.add(second, draft)
+    assert counts(django, asyncio) == [2, 1]
+
+    # Removing a link that does not exist changes nothing
+    first.tags.remove(asyncio, tooling)
+    django.articles.remove(draft)
+    assert counts(django, asyncio, tooling) == [2, 0, 0]
+
+    django.articles.clear()
+    first.tags.set([tooling])
+    assert counts(django, tooling) == [0, 1]
+    assert_consistent()
+
+
+def test_delete_releases_counts(taxonomy):
+    python, rust, (django, *_) = taxonomy
+    article = make_article("Gone", python, is_published=True)
+    article.tags.add(django)
+    article.delete()
+    assert counts(python, django) == [0, 0]
+
+    make_article("Kept", rust, is_published=True).tags.add(django)
+    rust.delete()
+    assert counts(django) == [0]
+    assert_consistent()
+
+
+def test_rebuild_command_repairs_drift(taxonomy, capsys):
+    python, _, (django, *_) = taxonomy
+    make_article("Counted", python, is_published=True).tags.add(django)
+    Category.objects.filter(pk=python.pk).update(article_count=7)
+    Tag.objects.filter(pk=django.pk).update(article_count=0)
+
+    call_command('rebuild_article_counts')
+    assert counts(python, django) == [1, 1]
+    assert f"Category {python.pk}: 7 -> 1" in capsys.readouterr().out
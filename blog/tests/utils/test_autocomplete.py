@@ -0,0 +1,179 @@
+# blog/tests/utils/test_autocomplete.py
+import random
+import pytest
+from django.core.cache import caches
+from django.db import transaction
+from django.urls import reverse
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.tag_model import Tag
+from blog.settings import AUTOCOMPLETE_SETTINGS
+from blog.utils.autocomplete import (
+    KIND_ARTICLE, KIND_TAG, CompletionTrie, Entry, autocomplete_index, complete, completion_keys, normalize,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    caches[AUTOCOMPLETE_SETTINGS['CACHE_ALIAS']].clear()
+    autocomplete_index.clear()
+    yield
+    autocomplete_index.clear()
+
+
+def labels(entries):
+    return [entry.label for entry in entries]
+
+
+def test_completion_keys_start_at_each_word():
+    assert normalize("  Čevapi   Recipes ") == "cevapi recipes"
+    assert completion_keys("Intro to Django") == ["intro to django", "to django", "django"]
+
+
+def test_trie_ranks_by_score_then_label():
+    trie = CompletionTrie(capacity=3)
+    for pk, (label, score) in enumerate([("Django", 1), ("Djangocon", 5), ("Dart", 2), ("Deno", 2)]):
+        trie.add(Entry(KIND_TAG, pk, label, label.lower(), score), completion_keys(label))
+
+    assert labels(trie.complete("d", 10)) == ["Djangocon", "Dart", "Deno"]
+    assert labels(trie.complete("dja", 10)) == ["Djangocon", "Django"]
+    assert labels(trie.complete("djangoc", 10)) == ["Djangocon"]
+    assert trie.complete("x", 10) == []
+
+
+def test_trie_refills_top_lists_after_removal():
+    trie = CompletionTrie(capacity=2)
+    for pk in range(5):
+        trie.add(Entry(KIND_TAG, pk, f"python {pk}", str(pk), 10 - pk), [f"python {pk}"])
+
+    trie.remove(KIND_TAG, 0)
+    trie.remove(KIND_TAG, 1)
+
+    assert labels(trie.complete("py", 2)) == ["python 2", "python 3"]
+
+
+def test_trie_matches_brute_force_under_random_updates():
+    rng = random.Random(7)
+    words = ["data", "database", "date", "django", "dj", "docker", "do", "python", "pytest", "py"]
+    live = {}
+    for pk in range(20):
+        label = ' '.join(rng.sample(words, 2))
+        live[pk] = Entry(KIND_TAG, pk, label, str(pk), rng.randrange(5))
+    trie = CompletionTrie.build(4, [(entry, completion_keys(entry.label)) for entry in live.values()])
+
+    for step in range(400):
+        pk = rng.randrange(40)
+        if rng.random() < 0.3:
+            trie.remove(KIND_TAG, pk)
+            live.pop(pk, None)
+        else:
+            label = ' '.join(rng.sample(words, 2))
+            entry = Entry(KIND_TAG, pk, label, str(pk), rng.randrange(5))
+            trie.add(entry, completion_keys(label))
+            live[pk] = entry
+
+        prefix = rng.choice(words)[:rng.randrange(1, 4)]
+        expected = sorted(
+            (entry for entry in live.values() if any(key.startswith(prefix) for key in completion_keys(entry.label))),
+            key=lambda entry: entry.rank,
+        )[:4]
+        assert [entry.key for entry in trie.complete(prefix, 4)] == [entry.key for entry in expected]
+
+
+def create_article(title, category, tags=(), **kwargs):
+    article = Article.objects.create(
+        title=title, content="<p>Body.</p>", excerpt="x", meta_description="x", category=category, **kwargs
+    )
+    article.tags.add(*tags)
+    return article
+
+
+@pytest.mark.django_db
+def test_signals_patch_the_loaded_trie(django_capture_on_commit_callbacks):
+    category = Category.objects.create(name="Programming")
+    django_tag = Tag.objects.create(name="Django")
+    Tag.objects.create(name="Docker")
+    create_article("Deploying apps", category, [django_tag], is_published=True)
+
+    # Ties on popularity are alphabetical; Docker has no published articles
+    assert labels(complete("d")) == ["Deploying apps", "Django", "Docker"]
+
+    # Featured articles outrank a tag with one article
+    with django_capture_on_commit_callbacks(execute=True):
+        featured = create_article("Debugging tips", category, is_published=True, is_featured=True)
+    assert labels(complete("d"))[0] == "Debugging tips"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        draft = create_article("Draft about Django", category, [django_tag])
+    assert "Draft about Django" not in labels(complete("dra"))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        draft.is_published = True
+        draft.save()
+    assert labels(complete("dra")) == ["Draft about Django"]
+    assert [entry.score for entry in complete("djan") if entry.kind == KIND_TAG] == [2]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        featured.delete()
+        django_tag.delete()
+    assert labels(complete("d")) == ["Deploying apps", "Draft about Django", "Docker"]
+
+
+@pytest.mark.django_db
+def test_moving_an_article_rescores_both_categories(django_capture_on_commit_callbacks):
+    programming = Category.objects.create(name="Programming")
+    databases = Category.objects.create(name="Databases")
+    article = create_article("Indexes", programming, is_published=True)
+    assert [entry.score for entry in complete("prog")] == [1]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        article.category = databases
+        article.save()
+
+    assert [entry.score for entry in complete("prog")] == [0]
+    assert [entry.score for entry in complete("data")] == [1]
+
+
+@pytest.mark.django_db
+def test_rolled_back_changes_never_reach_the_trie(django_capture_on_commit_callbacks):
+    category = Category.objects.create(name="Programming")
+    assert complete("phantom") == []
+    version = caches[AUTOCOMPLETE_SETTINGS['CACHE_ALIAS']].get('autocomplete-trie-version', 0)
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                create_article("Phantom article", category, is_published=True)
+                raise RuntimeError
+
+    assert callbacks == []
+    assert complete("phantom") == []
+    assert caches[AUTOCOMPLETE_SETTINGS['CACHE_ALIAS']].get('autocomplete-trie-version', 0) == version
+
+
+@pytest.mark.django_db
+def test_changes_elsewhere_trigger_a_rebuild():
+    category = Category.objects.create(name="Programming")
+    assert complete("rust") == []
+
+    # Another process saved: the shared version moved, our trie is stale
+    cache = caches[AUTOCOMPLETE_SETTINGS['CACHE_ALIAS']]
+    cache.set('autocomplete-trie-version', cache.get('autocomplete-trie-version', 0) + 1)
+    Article.objects.bulk_create([Article(title="Rust in production", slug="rust", content="x", category=category,
+                                         is_published=True)])
+
+    assert labels(complete("rust")) == ["Rust in production"]
+
+
+@pytest.mark.django_db
+def test_autocomplete_endpoint(client):
+    category = Category.objects.create(name="Programming")
+    article = create_article("Python packaging", category, is_published=True)
+
+    response = client.get(reverse('search-autocomplete'), {'q': 'pyt'})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        'query': 'pyt',
+        'results': [{'type': KIND_ARTICLE, 'label': "Python packaging", 'url': article.get_absolute_url()}],
+    }
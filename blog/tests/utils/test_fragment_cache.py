@@ -0,0 +1,79 @@
+# blog/tests/utils/test_fragment_cache.py
+import pytest
+from django.core.cache import caches
+from django.template import Context, Template
+from django.utils import translation
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.settings import FRAGMENT_CACHE_SETTINGS
+from blog.utils.fragment_cache import render_many
+from blog.utils.page_cache import update_derived
+from blog.views.article_view import article_cards
+
+CARD = 'blog/components/article_item.html'
+
+
+@pytest.fixture
+def articles(db):
+    caches[FRAGMENT_CACHE_SETTINGS['CACHE_ALIAS']].clear()
+    category = Category.objects.create(name="Python", slug="python")
+    for i in range(3):
+        Article.objects.create(
+            title=f"Card {i}", content="<p>Body.</p>", excerpt="x", meta_description="x",
+            category=category, is_published=True,
+        )
+    return category
+
+
+def cards():
+    return list(article_cards(Article.objects.all()).order_by('pk'))
+
+
+def rendered_titles(objects):
+    calls = []
+    render_many(CARD, objects, lambda article: calls.append(article.title) or article.title)
+    return calls
+
+
+def test_only_misses_are_rendered(articles):
+    assert rendered_titles(cards()) == ["Card 0", "Card 1", "Card 2"]
+    assert rendered_titles(cards()) == []
+
+    article = Article.objects.get(title="Card 1")
+    article.content = "<p>Edited.</p>"
+    article.save()
+    assert rendered_titles(cards()) == ["Card 1"]
+
+
+def test_language_and_category_are_part_of_the_version(articles):
+    rendered_titles(cards())
+    with translation.override('sv'):
+        assert len(rendered_titles(cards())) == 3
+
+    articles.name = "Python 3"
+    articles.save()
+    assert len(rendered_titles(cards())) == 3
+
+
+def test_processed_featured_image_is_part_of_the_version(articles):
+    rendered_titles(cards())
+    article = Article.objects.get(title="Card 1")
+    Article.objects.filter(pk=article.pk).update(featured_image='featured_images/card-1.webp')
+    assert rendered_titles(cards()) == ["Card 1"]
+
+    update_derived(Article, [article.pk], featured_image='featured_images/card-1-1200.webp')
+    assert Article.objects.get(pk=article.pk).updated_at > article.updated_at
+    assert rendered_titles(cards()) == ["Card 1"]
+
+
+def test_tag_matches_an_include_loop(articles, django_assert_num_queries):
+    objects = cards()
+    loop = Template(
+        "{% for article in articles %}{% include 'blog/components/article_item.html' with article=article %}{% endfor %}"
+    ).render(Context({'articles': objects}))
+    cached = Template("{% load fragment_tags %}{% cached_cards articles %}")
+
+    assert cached.render(Context({'articles': objects})) == loop
+    # Second time round every card comes from one get_many, and no card reads the database
+    with django_assert_num_queries(0):
+        assert cached.render(Context({'articles': objects})) == loop
@@ -0,0 +1,20 @@
+# blog/tests/utils/test_html.py
+from blog.utils.html_utils import html_to_text
+
+
+def test_html_to_text_collapses_whitespace_and_entities():
+    html = "<h1>Title</h1>\n\n<p>Some&nbsp;<b>bold</b>text &amp; more</p>  "
+    assert html_to_text(html) == "Title Some bold text & more"
+
+
+def test_html_to_text_skips_scripts_styles_and_comments():
+    html = (
+        "<p>Visible</p><script>if (a < b) { alert('x') }</script>"
+        "<style>p { color: red }</style><!-- hidden --><p>again</p>"
+    )
+    assert html_to_text(html) == "Visible again"
+
+
+def test_html_to_text_handles_plain_text():
+    assert html_to_text("  plain   text\n") == "plain text"
+    assert html_to_text("") == ""
@@ -0,0 +1,57 @@
+# blog/tests/utils/test_job_queue.py
+import pytest
+from django.core.management import call_command
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.job_model import Job
+from blog.settings import JOB_QUEUE_SETTINGS
+from blog.utils import job_queue
+
+
+@pytest.fixture
+def category():
+    return Category.objects.create(name="Queue")
+
+
+@pytest.mark.django_db
+def test_article_save_defers_summaries_to_worker(nlp_pipeline, category, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        article = Article.objects.create(
+            title="Queued", content="<p>Queued first sentence.</p><p>Then more.</p>", category=category
+        )
+
+    # Nothing was parsed inside the request
+    assert nlp_pipeline.calls == 0
+    job = Job.objects.get(task='article.generate_summaries')
+    assert (job.payload, job.status) == ({'article_id': article.pk}, 'pending')
+    assert Job.objects.filter(task='article.update_term_stats', payload={'article_id': article.pk}).exists()
+
+    call_command('run_worker', once=True)
+
+    article.refresh_from_db()
+    job.refresh_from_db()
+    assert job.status == Job.STATUS_DONE
+    assert article.excerpt == "Queued first sentence. Then more."
+    assert article.meta_description == "Queued first sentence."
+
+
+@pytest.mark.django_db
+def test_failed_job_is_retried_then_marked_failed(monkeypatch):
+    monkeypatch.setitem(JOB_QUEUE_SETTINGS, 'MAX_ATTEMPTS', 2)
+    monkeypatch.setitem(JOB_QUEUE_SETTINGS, 'RETRY_DELAY', 0)
+
+    @job_queue.register_task('test.explode')
+    def explode():
+        raise RuntimeError("boom")
+
+    job = Job.objects.create(task='test.explode')
+
+    assert job_queue.run_job(job_queue.claim_next_job('test')) is False
+    job.refresh_from_db()
+    assert (job.status, job.attempts) == (Job.STATUS_PENDING, 1)
+
+    assert job_queue.run_job(job_queue.claim_next_job('test')) is False
+    job.refresh_from_db()
+    assert (job.status, job.attempts) == (Job.STATUS_FAILED, 2)
+    assert "boom" in job.last_error
+    assert job_queue.claim_next_job('test') is None
@@ -0,0 +1,124 @@
+# blog/tests/utils/test_openai_utils.py
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from blog import tasks
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.settings import OPENAI_SETTINGS
+from blog.utils import openai_utils
+
+
+class StubCompletions(BaseHTTPRequestHandler):
+    """Streams '<prompt> body' back as chat completion chunks; fails prompts starting with 'flaky' once"""
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        prompt = body['messages'][-1]['content']
+
+        with server.lock:
+            server.requests.append(prompt)
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            fail = prompt.startswith('flaky') and prompt not in server.failed
+            server.failed.add(prompt)
+
+        try:
+            if fail:
+                self.send_response(500)
+                self.send_header('Content-Type', 'application/json')
+                self.end_headers()
+                self.wfile.write(b'{"error": {"message": "try again"}}')
+                return
+
+            time.sleep(0.05)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.end_headers()
+            for token in [prompt, ' ', 'body']:
+                chunk = {
+                    'id': 'chatcmpl-stub', 'object': 'chat.completion.chunk', 'created': 0, 'model': body['model'],
+                    'choices': [{'index': 0, 'delta': {'content': token}, 'finish_reason': None}],
+                }
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.write(b"data: [DONE]\n\n")
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api(monkeypatch, settings):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubCompletions)
+    server.lock = threading.Lock()
+    server.requests, server.failed = [], set()
+    server.active = server.peak = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    settings.OPENAI_API_KEY = 'test-key'
+    monkeypatch.setitem(OPENAI_SETTINGS, 'BASE_URL', f"http://127.0.0.1:{server.server_port}/v1")
+    monkeypatch.setitem(OPENAI_SETTINGS, 'CACHE_ALIAS', 'default')
+    monkeypatch.setitem(OPENAI_SETTINGS, 'BACKOFF_BASE', 0.01)
+    caches['default'].clear()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_batch_generation_streams_retries_and_limits_concurrency(stub_api):
+    prompts = [f"topic {i}" for i in range(6)] + ['flaky topic']
+    tokens = []
+
+    results = openai_utils.generate_articles(prompts, concurrency=2, on_token=lambda p, t: tokens.append((p, t)))
+
+    assert results == [f"{prompt} body" for prompt in prompts]
+    assert stub_api.peak <= 2
+    # The failing prompt was retried once
+    assert stub_api.requests.count('flaky topic') == 2
+    assert [token for prompt, token in tokens if prompt == 'topic 0'] == ['topic 0', ' ', 'body']
+
+
+def test_cached_prompts_skip_the_api(stub_api):
+    openai_utils.generate_articles(['cached topic'])
+    stub_api.requests.clear()
+
+    assert openai_utils.generate_articles(['cached topic', 'new topic']) == ['cached topic body', 'new topic body']
+    assert stub_api.requests == ['new topic']
+
+
+def test_failures_are_returned_after_retries(stub_api, monkeypatch):
+    monkeypatch.setitem(OPENAI_SETTINGS, 'MAX_RETRIES', 0)
+
+    [result] = openai_utils.generate_articles(['flaky again'])
+
+    assert isinstance(result, openai_utils.openai.InternalServerError)
+
+
+def test_missing_api_key_fails_before_any_request(stub_api, settings):
+    settings.OPENAI_API_KEY = None
+
+    with pytest.raises(ImproperlyConfigured):
+        openai_utils.generate_articles(['topic'])
+    assert stub_api.requests == []
+
+
+@pytest.mark.django_db
+def test_generation_job_saves_generated_content(stub_api):
+    category = Category.objects.create(name="Generated")
+    article = Article.objects.create(
+        title="Async views", content="<p>Draft.</p>", excerpt="x", meta_description="x", category=category
+    )
+
+    tasks.generate_article_content([article.pk])
+
+    article.refresh_from_db()
+    assert article.content == f"{openai_utils.article_prompt('Async views')} body"
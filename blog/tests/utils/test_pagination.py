@@ -0,0 +1,73 @@
+# blog/tests/utils/test_pagination.py
+from datetime import timedelta
+import pytest
+from django.utils import timezone
+from blog.models import Article, Category
+from blog.utils.pagination import InvalidCursor, KeysetPaginator, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def articles(db):
+    """25 published articles; groups of five share a created_at to exercise the id tiebreak"""
+    category, _ = Category.objects.get_or_create(name="General")
+    Article.objects.bulk_create([
+        Article(title=f"Article {i}", slug=f"article-{i}", content="Body", excerpt="Excerpt",
+                category=category, is_published=True)
+        for i in range(25)
+    ])
+    start = timezone.now()
+    for article in Article.objects.all():
+        Article.objects.filter(pk=article.pk).update(created_at=start - timedelta(minutes=article.pk // 5))
+    return list(Article.objects.order_by('-created_at', '-id').values_list('pk', flat=True))
+
+
+def ids(page):
+    return [article.pk for article in page]
+
+
+def test_forward_walk_visits_every_row_once(articles):
+    paginator = KeysetPaginator(Article.objects.all(), 7)
+    seen, after = [], None
+    while True:
+        page = paginator.page(after=after)
+        seen += ids(page)
+        if not page.has_next():
+            break
+        after = page.next_cursor
+
+    assert seen == articles
+    assert page.next_cursor is None and page.has_previous()
+
+
+def test_backward_pages_mirror_forward_pages(articles):
+    paginator = KeysetPaginator(Article.objects.all(), 7)
+    first = paginator.page()
+    second = paginator.page(after=first.next_cursor)
+
+    back = paginator.page(before=second.previous_cursor)
+    assert ids(back) == ids(first) == articles[:7]
+    assert back.has_next() and not back.has_previous()
+
+    last = paginator.page(backward=True)
+    assert ids(last) == articles[-7:]
+    assert last.has_previous() and not last.has_next()
+
+
+def test_first_page_reads_one_query(articles, django_assert_num_queries):
+    paginator = KeysetPaginator(Article.objects.all(), 10)
+    with django_assert_num_queries(1):
+        page = paginator.page()
+        assert len(page) == 10 and page.has_next() and not page.has_previous()
+
+
+def test_cursor_round_trip_keeps_microseconds(articles):
+    article = Article.objects.get(pk=articles[3])
+    fields = [Article._meta.get_field('created_at'), Article._meta.get_field('id')]
+    cursor = encode_cursor([article.created_at, article.pk])
+    assert decode_cursor(cursor, fields) == [article.created_at, article.pk]
+
+
+@pytest.mark.parametrize('cursor', ['garbage', encode_cursor([1]), encode_cursor(['not a date', 3])])
+def test_invalid_cursor(articles, cursor):
+    with pytest.raises(InvalidCursor):
+        KeysetPaginator(Article.objects.all(), 5).page(after=cursor)
@@ -0,0 +1,174 @@
+# blog/tests/utils/test_related_articles.py
+from collections import Counter
+import pytest
+from django.urls import reverse
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.related_article_model import RelatedArticle
+from blog.models.tag_model import Tag
+from blog import tasks
+from blog.settings import JOB_QUEUE_SETTINGS, RELATED_ARTICLES_SETTINGS
+from blog.utils import term_stats
+from blog.utils.related_articles import RelatedArticlesIndex, candidate_articles, rebuild_related_articles
+
+
+@pytest.fixture
+def fixed_terms(monkeypatch):
+    """Serve each article's terms from a dict keyed by title and run index updates inline"""
+    terms = {}
+    monkeypatch.setitem(JOB_QUEUE_SETTINGS, 'ENABLED', False)
+    monkeypatch.setitem(RELATED_ARTICLES_SETTINGS, 'COUNT', 2)
+    monkeypatch.setattr(term_stats, 'article_terms', lambda article: Counter(terms.get(article.title, {})))
+    return terms
+
+
+def stored():
+    result = {}
+    for link in RelatedArticle.objects.order_by('article_id', 'rank'):
+        result.setdefault(link.article_id, []).append(link.related_id)
+    return result
+
+
+def create_article(title, category, tags=()):
+    article = Article.objects.create(
+        title=title, content="<p>Body.</p>", excerpt="x", meta_description="x",
+        category=category, is_published=True,
+    )
+    article.tags.add(*tags)
+    return article
+
+
+def test_scores_combine_tags_category_and_content():
+    index = RelatedArticlesIndex(
+        articles=[(1, 10, True), (2, 10, True), (3, 20, True), (4, 20, False)],
+        tag_pairs=[(1, 100), (1, 101), (2, 100), (3, 100), (3, 101), (4, 100), (4, 101)],
+        term_rows=[(1, {"django": 2}), (2, {"flask": 1}), (3, {"django": 1}), (4, {"django": 2})],
+    )
+
+    scores = index.scores(1)
+
+    # Same tags and same terms beat a shared category
+    assert scores[2] > scores[1] > 0
+    assert scores[0] == float('-inf')
+    # The unpublished article scores highest but is never offered
+    assert [pk for pk, _ in index.neighbours(1)] == [3, 2]
+
+
+@pytest.mark.django_db
+def test_incremental_updates_match_full_rebuild(fixed_terms, monkeypatch, django_capture_on_commit_callbacks):
+    # idf weights drift with every change to the corpus; only the rebuild command re-weights everything
+    monkeypatch.setitem(RELATED_ARTICLES_SETTINGS, 'CONTENT_WEIGHT', 0.0)
+    python, web = Category.objects.create(name="Python"), Category.objects.create(name="Web")
+    orm, views = Tag.objects.create(name="ORM"), Tag.objects.create(name="Views")
+    fixed_terms.update({
+        "Models": {"django": 2, "orm": 1},
+        "Queries": {"django": 1, "orm": 2},
+        "Templates": {"django": 1, "templates": 2},
+        "Forms": {"forms": 3},
+    })
+
+    with django_capture_on_commit_callbacks(execute=True):
+        models = create_article("Models", python, [orm])
+        create_article("Queries", python, [orm])
+        create_article("Templates", web, [views])
+        forms = create_article("Forms", web, [views])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        forms.tags.add(orm)
+        fixed_terms["Forms"] = {"orm": 1, "forms": 1}
+        forms.save()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        models.delete()
+
+    incremental = stored()
+    rebuild_related_articles()
+    assert incremental == stored()
+    assert models.pk not in {pk for related in incremental.values() for pk in related}
+
+
+@pytest.mark.django_db
+def test_detail_page_reads_related_articles(client, fixed_terms, django_capture_on_commit_callbacks):
+    category = Category.objects.create(name="Python")
+    fixed_terms.update({"First": {"django": 1}, "Second": {"django": 1}})
+    with django_capture_on_commit_callbacks(execute=True):
+        first = create_article("First", category)
+        second = create_article("Second", category)
+
+    response = client.get(reverse('article-detail', args=[first.slug]))
+
+    assert list(response.context['related_articles']) == [second]
+
+
+@pytest.mark.django_db
+def test_refresh_reads_only_candidate_neighbours(fixed_terms, django_capture_on_commit_callbacks):
+    python, web, rust = (Category.objects.create(name=name) for name in ("Python", "Web", "Rust"))
+    orm = Tag.objects.create(name="ORM")
+    fixed_terms.update({"Models": {"django": 1}, "Templates": {"django": 1}, "Borrowing": {"lifetimes": 1}})
+    with django_capture_on_commit_callbacks(execute=True):
+        models = create_article("Models", python, [orm])
+        queries = create_article("Queries", web, [orm])
+        templates = create_article("Templates", web)
+        same_category = create_article("Packaging", python)
+        create_article("Borrowing", rust)
+
+    assert candidate_articles([models.pk]) == {models.pk, queries.pk, templates.pk, same_category.pk}
+
+
+@pytest.mark.django_db
+def test_candidates_are_capped_per_source(fixed_terms, monkeypatch, django_capture_on_commit_callbacks):
+    monkeypatch.setitem(RELATED_ARTICLES_SETTINGS, 'MAX_CANDIDATES', 2)
+    python, web = Category.objects.create(name="Python"), Category.objects.create(name="Web")
+    orm, views = Tag.objects.create(name="ORM"), Tag.objects.create(name="Views")
+    with django_capture_on_commit_callbacks(execute=True):
+        target = create_article("Target", python, [orm, views])
+        older = [create_article(f"Older {i}", python) for i in range(3)]
+        newest = [create_article(f"Newest {i}", python) for i in range(2)]
+        both_tags = create_article("Both tags", web, [orm, views])
+        one_tag = create_article("One tag", web, [orm])
+
+    candidates = candidate_articles([target.pk])
+
+    # The two newest of the category, and the two sharing the most tags
+    # (the target itself among them), not the whole category
+    assert {a.pk for a in newest} <= candidates
+    assert both_tags.pk in candidates
+    assert not {a.pk for a in older} & candidates
+    assert one_tag.pk not in candidates
+
+
+@pytest.mark.django_db
+def test_save_and_tag_changes_refresh_once(fixed_terms, monkeypatch, django_capture_on_commit_callbacks):
+    refreshed = []
+    monkeypatch.setattr(tasks, 'refresh_related_articles', lambda pks: refreshed.append(list(pks)))
+    category = Category.objects.create(name="Python")
+    orm, views = Tag.objects.create(name="ORM"), Tag.objects.create(name="Views")
+    with django_capture_on_commit_callbacks(execute=True):
+        first = create_article("First", category)
+        second = create_article("Second", category)
+    refreshed.clear()
+
+    # An admin save: the article, then its tags, in one transaction
+    with django_capture_on_commit_callbacks(execute=True):
+        first.save()
+        first.tags.set([orm])
+    assert refreshed == [[first.pk]]
+
+    refreshed.clear()
+    with django_capture_on_commit_callbacks(execute=True):
+        views.articles.add(first, second)
+    assert refreshed == [sorted([first.pk, second.pk])]
+
+
+@pytest.mark.django_db
+def test_clearing_a_tag_refreshes_its_articles(fixed_terms, django_capture_on_commit_callbacks):
+    python, web = Category.objects.create(name="Python"), Category.objects.create(name="Web")
+    orm = Tag.objects.create(name="ORM")
+    with django_capture_on_commit_callbacks(execute=True):
+        first = create_article("First", python, [orm])
+        second = create_article("Second", web, [orm])
+    assert stored() == {first.pk: [second.pk], second.pk: [first.pk]}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        orm.articles.clear()
+    assert stored() == {}
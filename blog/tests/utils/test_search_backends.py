@@ -0,0 +1,148 @@
+# blog/tests/utils/test_search_backends.py
+import json
+import pytest
+from django.urls import reverse
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.search_index_model import SearchDocument
+from blog.settings import PAGINATION_SETTINGS, SEARCH_SETTINGS
+from blog.utils.search_backends import BACKENDS, PostgresBackend, get_search_backend
+
+
+def create_article(title, content, is_published=True):
+    category, _ = Category.objects.get_or_create(name="General")
+    return Article.objects.create(
+        title=title, content=content, excerpt="x", meta_description="x",
+        category=category, is_published=is_published,
+    )
+
+
+@pytest.mark.django_db
+def test_auto_picks_fts5_on_sqlite():
+    assert get_search_backend().name == 'fts5'
+
+
+@pytest.mark.django_db
+def test_unavailable_native_index_falls_back_to_bm25(monkeypatch):
+    monkeypatch.setattr(BACKENDS['fts5'], '_available', False)
+    assert get_search_backend().name == 'inverted'
+
+    article = create_article("Fallback", "<p>Still searchable.</p>")
+
+    assert SearchDocument.objects.filter(pk=article.pk).exists()
+    assert get_search_backend().search("searchable").article_ids == [article.pk]
+
+
+@pytest.mark.django_db
+def test_fts5_ranks_title_matches_first():
+    body = create_article("Cooking", "<p>A note on <b>django</b> templates.</p>")
+    title = create_article("Django", "<p>A note on templates.</p>")
+
+    results = get_search_backend().search("django")
+
+    assert results.article_ids == [title.pk, body.pk]
+    assert results.hits[0][1] > results.hits[1][1]
+
+
+@pytest.mark.django_db
+def test_fts5_follows_updates_and_deletes():
+    article = create_article("Release", "<p>Python notes.</p>")
+    article.content = "<p>Rust notes.</p>"
+    article.save()
+    backend = get_search_backend()
+
+    assert backend.search("python").total == 0
+    assert backend.search("rust").article_ids == [article.pk]
+
+    article.delete()
+
+    assert backend.search("rust").total == 0
+
+
+@pytest.mark.django_db
+def test_bm25_index_stays_current_while_fts5_is_active(monkeypatch):
+    article = create_article("Release", "<p>Python notes.</p>")
+    article.content = "<p>Rust notes.</p>"
+    article.save()
+    assert get_search_backend().name == 'fts5'
+
+    monkeypatch.setitem(SEARCH_SETTINGS, 'BACKEND', 'inverted')
+    backend = get_search_backend()
+    assert backend.search("python").total == 0
+    assert backend.search("rust").article_ids == [article.pk]
+
+    article.delete()
+    assert backend.search("rust").total == 0
+
+
+@pytest.mark.django_db
+def test_fts5_paginates_and_filters_unpublished():
+    articles = [create_article(f"Flask {i}", "<p>Same body.</p>") for i in range(3)]
+    create_article("Flask draft", "<p>Same body.</p>", is_published=False)
+    backend = get_search_backend()
+
+    first = backend.search("flask", page=1, per_page=2)
+    past_the_end = backend.search("flask", page=5, per_page=2)
+
+    assert first.total == 3
+    assert first.article_ids == [articles[2].pk, articles[1].pk]
+    assert past_the_end.article_ids == []
+    assert past_the_end.total == 3
+    assert backend.search("flask", published_only=False).total == 4
+
+
+@pytest.mark.django_db
+def test_query_syntax_is_not_interpreted():
+    article = create_article("Quotes", "<p>He said hello.</p>")
+
+    assert get_search_backend().search('"hello* OR NEAR(said').article_ids == [article.pk]
+
+
+def test_postgres_query_parameters_match_placeholders(monkeypatch):
+    monkeypatch.setitem(SEARCH_SETTINGS, 'POSTGRES_CONFIGS', {'en': 'english', 'sv': 'swedish'})
+    select, params = PostgresBackend().match_sql(['django', 'orm'])
+
+    assert select.count('%s') == len(params)
+    assert params.count('django | orm') == 6
+    assert PostgresBackend().match_sql(['django', 'orm'], match_all=True)[1].count('django & orm') == 6
+
+
+@pytest.mark.django_db
+def test_search_view(client):
+    article = create_article("Searchable title", "<p>Body.</p>")
+
+    response = client.get(reverse('search'), {'q': 'searchable'})
+
+    assert response.status_code == 200
+    assert list(response.context['article_list']) == [article]
+    assert response.context['results'].total == 1
+
+
+@pytest.mark.django_db
+def test_graphql_search_articles(client):
+    article = create_article("Graph search", "<p>Body.</p>")
+    query = '{ searchArticles(query: "graph") { total numPages hits { score article { id title } } } }'
+
+    response = client.post('/graphql/', json.dumps({'query': query}), content_type='application/json')
+    data = response.json()['data']['searchArticles']
+
+    assert data['total'] == 1
+    assert data['hits'][0]['article'] == {'id': str(article.pk), 'title': "Graph search"}
+    assert data['hits'][0]['score'] > 0
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('page, per_page, expected', [(-3, -5, (1, 1)), (0, 10 ** 6, (1, 100))])
+def test_graphql_search_bounds_the_page(client, monkeypatch, page, per_page, expected):
+    monkeypatch.setitem(PAGINATION_SETTINGS, 'MAX_CONNECTION_PAGE_SIZE', 100)
+    for i in range(3):
+        create_article(f"Bounded {i}", "<p>Body.</p>")
+    query = '{ searchArticles(query: "bounded", page: %d, perPage: %d) { total page numPages hits { score } } }'
+
+    response = client.post('/graphql/', json.dumps({'query': query % (page, per_page)}),
+                           content_type='application/json')
+    data = response.json()['data']['searchArticles']
+
+    assert (data['total'], data['page']) == (3, expected[0])
+    assert len(data['hits']) == min(expected[1], 3)
+    assert data['numPages'] == (3 if expected[1] == 1 else 1)
@@ -0,0 +1,125 @@
+# blog/tests/utils/test_search_index.py
+import pytest
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.search_index_model import SearchDocument, SearchPosting, SearchTerm
+from blog.settings import SEARCH_SETTINGS
+from blog.utils.search_index import document_terms, index_article, remove_article, search, tokenize
+
+
+@pytest.fixture(autouse=True)
+def inverted_backend(monkeypatch):
+    """Index saves into the BM25 tables whatever the test database supports natively"""
+    monkeypatch.setitem(SEARCH_SETTINGS, 'BACKEND', 'inverted')
+
+
+def create_article(title, content, is_published=True):
+    category, _ = Category.objects.get_or_create(name="General")
+    return Article.objects.create(
+        title=title, content=content, excerpt="x", meta_description="x",
+        category=category, is_published=is_published,
+    )
+
+
+def index_snapshot():
+    postings = sorted(SearchPosting.objects.values_list('document_id', 'term__term', 'frequency'))
+    counts = dict(SearchTerm.objects.filter(document_count__gt=0).values_list('term', 'document_count'))
+    lengths = dict(SearchDocument.objects.values_list('pk', 'length'))
+    return postings, counts, lengths
+
+
+def test_tokenize_lowercases_and_drops_single_characters():
+    assert tokenize("Django's ORM, a 2nd look") == ['django', 'orm', '2nd', 'look']
+
+
+def test_document_terms_weight_the_title():
+    article = Article(title="Django", content="<p>Django and <b>Python</b></p>")
+    terms = document_terms(article)
+
+    assert terms['django'] == 4
+    assert terms['python'] == 1
+
+
+@pytest.mark.django_db
+def test_incremental_updates_match_a_rebuild():
+    first = create_article("Django tips", "<p>Django forms and django views.</p>")
+    second = create_article("Python news", "<p>Python release notes.</p>")
+
+    first.content = "<p>Django views only.</p>"
+    first.save()
+    second.title = "Python and Django news"
+    second.save()
+    incremental = index_snapshot()
+
+    SearchDocument.objects.all().delete()
+    SearchTerm.objects.all().delete()
+    for article in Article.objects.order_by('pk'):
+        index_article(article)
+
+    assert index_snapshot() == incremental
+
+
+@pytest.mark.django_db
+def test_remove_article_releases_terms():
+    article = create_article("Rust", "<p>Borrow checker.</p>")
+    create_article("Rust again", "<p>Cargo.</p>")
+
+    remove_article(article.pk)
+
+    assert not SearchPosting.objects.filter(document_id=article.pk).exists()
+    assert SearchTerm.objects.get(term='rust').document_count == 1
+    assert SearchTerm.objects.get(term='borrow').document_count == 0
+
+
+@pytest.mark.django_db
+def test_deleting_an_article_removes_it_from_results():
+    article = create_article("Postgres", "<p>Indexes.</p>")
+    article.delete()
+
+    assert search("postgres").total == 0
+    assert not SearchDocument.objects.exists()
+
+
+@pytest.mark.django_db
+def test_search_ranks_by_bm25():
+    create_article("Cooking", "<p>Django mentioned once among many other words here.</p>")
+    best = create_article("Django", "<p>Django, django everywhere.</p>")
+    create_article("Gardening", "<p>Nothing relevant.</p>")
+
+    results = search("django")
+
+    assert results.total == 2
+    assert results.article_ids[0] == best.pk
+
+
+@pytest.mark.django_db
+def test_search_paginates():
+    articles = [create_article(f"Python {i}", "<p>Same body.</p>") for i in range(5)]
+    newest_first = [article.pk for article in reversed(articles)]
+
+    first = search("python", page=1, per_page=2)
+    last = search("python", page=3, per_page=2)
+
+    assert first.total == 5
+    assert first.num_pages == 3
+    assert first.has_next
+    assert first.article_ids == newest_first[:2]
+    assert last.article_ids == newest_first[4:]
+    assert not last.has_next
+
+
+@pytest.mark.django_db
+def test_search_skips_unpublished_articles():
+    published = create_article("Flask", "<p>Micro framework.</p>")
+    create_article("Flask draft", "<p>Unfinished.</p>", is_published=False)
+
+    assert search("flask").article_ids == [published.pk]
+    assert search("flask", published_only=False).total == 2
+
+
+@pytest.mark.django_db
+def test_search_without_matches_is_empty():
+    create_article("Go", "<p>Goroutines.</p>")
+
+    assert search("").total == 0
+    assert search("haskell").article_ids == []
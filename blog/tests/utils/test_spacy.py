@@ -0,0 +1,97 @@
+# blog/tests/utils/test_spacy.py
+import threading
+import spacy
+from blog.utils import spicy_utils
+from blog.utils.spicy_utils import SpacyModelRegistry
+
+
+def _fake_load(calls):
+    def load(name):
+        calls.append(name)
+        nlp = spacy.blank('en')
+        nlp.add_pipe('sentencizer')
+        return nlp
+    return load
+
+
+def test_registry_loads_model_once(monkeypatch):
+    """The same model instance is returned for every caller and thread."""
+    calls = []
+    monkeypatch.setattr(spicy_utils.spacy, 'load', _fake_load(calls))
+    registry = SpacyModelRegistry()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get_model('en_core_web_sm')))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ['en_core_web_sm']
+    assert all(nlp is results[0] for nlp in results)
+    assert registry.stats()['en_core_web_sm']['load_time_ms'] >= 0
+
+
+def test_pipeline_disables_task_components(monkeypatch):
+    """Task pipelines only disable components that exist in the model."""
+    monkeypatch.setattr(spicy_utils.spacy, 'load', _fake_load([]))
+    monkeypatch.setitem(
+        spicy_utils.SPACY_SETTINGS, 'TASK_DISABLED_PIPES', {'sentences': ['sentencizer', 'ner']}
+    )
+    registry = SpacyModelRegistry()
+
+    pipeline = registry.get_pipeline('sentences', 'en_core_web_sm')
+    assert pipeline.disable == ['sentencizer']
+    assert pipeline.nlp is registry.get_model('en_core_web_sm')
+
+    # The shared model keeps all of its components enabled
+    doc = registry.get_pipeline('analysis', 'en_core_web_sm')("One. Two.")
+    assert len(list(doc.sents)) == 2
+
+
+def test_language_routing():
+    assert spicy_utils.model_for_language('sv') == 'sv_core_news_sm'
+    assert spicy_utils.model_for_language('sr-latn') == 'blank:sr'
+    assert spicy_utils.model_for_language('de') == spicy_utils.SPACY_SETTINGS['MODEL_NAME']
+    assert spicy_utils.model_for_language(None) == spicy_utils.SPACY_SETTINGS['MODEL_NAME']
+
+
+def test_blank_model_for_languages_without_pipeline():
+    """Serbian has no trained spaCy model: a blank one still splits sentences."""
+    registry = SpacyModelRegistry()
+
+    nlp = registry.get_model(language='sr')
+
+    assert nlp.lang == 'sr'
+    assert len(list(nlp("Prva rečenica. Druga rečenica.").sents)) == 2
+
+
+def test_pool_evicts_least_recently_used_model(monkeypatch):
+    """Each fake model grows RSS by 400 MB; a 1000 MB cap keeps two of them."""
+    calls = []
+    rss = [0]
+
+    def load(name):
+        rss[0] += 400 * 1024 * 1024
+        return _fake_load(calls)(name)
+
+    monkeypatch.setattr(spicy_utils.spacy, 'load', load)
+    monkeypatch.setattr(spicy_utils, '_current_rss_bytes', lambda: rss[0])
+    monkeypatch.setitem(spicy_utils.SPACY_SETTINGS, 'MODEL_POOL_MAX_MB', 1000)
+    registry = SpacyModelRegistry()
+
+    registry.get_model('en_core_web_sm')
+    registry.get_model('sv_core_news_sm')
+    registry.get_model('en_core_web_sm')  # sv is now the least recently used
+    registry.get_model('de_core_news_sm')
+
+    assert registry.loaded_models() == ['en_core_web_sm', 'de_core_news_sm']
+    assert registry.evictions == 1
+    assert registry.memory_mb() <= 1000
+
+    # An evicted model is loaded again on demand
+    registry.get_model('sv_core_news_sm')
+    assert calls == ['en_core_web_sm', 'sv_core_news_sm', 'de_core_news_sm', 'sv_core_news_sm']
@@ -0,0 +1,101 @@
+# blog/tests/utils/test_suggestion_service.py
+import threading
+import pytest
+from django.core.cache import caches
+from django.urls import reverse
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.tag_model import Tag
+from blog.settings import SUGGESTION_SETTINGS
+from blog.utils import suggestion_service
+
+RESULT = {'tags': [{'type': 'new', 'info': {'id': None, 'name': 'django'}}], 'categories': []}
+
+
+@pytest.fixture
+def slow_suggestions(monkeypatch):
+    """Suggestion computation that blocks until the test releases it, counting runs"""
+    release = threading.Event()
+    calls = []
+
+    def compute(article_id):
+        calls.append(article_id)
+        release.wait(5)
+        return RESULT
+
+    monkeypatch.setattr(suggestion_service, 'compute_suggestions', compute)
+    monkeypatch.setitem(SUGGESTION_SETTINGS, 'CACHE_ALIAS', 'default')
+    caches['default'].clear()
+    yield release, calls
+    release.set()
+
+
+@pytest.fixture
+def article():
+    category = Category.objects.create(name="Suggestions")
+    return Article.objects.create(
+        title="Suggest me", content="<p>Django.</p>", excerpt="x", meta_description="x", category=category
+    )
+
+
+@pytest.mark.django_db
+def test_concurrent_requests_share_one_computation(article, slow_suggestions):
+    release, calls = slow_suggestions
+
+    first = suggestion_service.get_suggestions(article, wait=0)
+    second = suggestion_service.get_suggestions(article, wait=0)
+    assert first[0] == second[0] == suggestion_service.STATUS_PENDING
+    assert first[1] == second[1]
+
+    release.set()
+    status, _, payload = suggestion_service.get_suggestions(article, wait=5)
+    assert (status, payload) == (suggestion_service.STATUS_READY, RESULT)
+    assert calls == [article.pk]
+
+    # Served from the cache until the content changes
+    assert suggestion_service.get_suggestions(article, wait=0)[0] == suggestion_service.STATUS_READY
+    article.content = "<p>Flask.</p>"
+    assert suggestion_service.get_suggestions(article, wait=0)[0] == suggestion_service.STATUS_PENDING
+
+
+@pytest.mark.django_db
+def test_admin_endpoint_answers_202_then_poll_returns_result(admin_client, article, slow_suggestions):
+    release, _ = slow_suggestions
+
+    response = admin_client.post(reverse('admin:article-suggestions', args=[article.pk]))
+    assert response.status_code == 202
+    poll_url = response.json()['poll_url']
+    assert poll_url == reverse('admin:article-suggestions-status', args=[article.pk])
+
+    release.set()
+    future = suggestion_service._inflight.get((article.pk, response.json()['version']))
+    if future is not None:
+        future.result(5)
+
+    response = admin_client.get(poll_url)
+    assert response.status_code == 200
+    assert response.json() == RESULT
+
+
+@pytest.mark.django_db
+def test_computation_claimed_by_another_process_is_not_repeated(article, slow_suggestions):
+    release, calls = slow_suggestions
+    version = suggestion_service.content_version(article)
+    # Another web process sharing the cache is computing it
+    caches['default'].add(suggestion_service._key(article.pk, version, 'pending'), True)
+
+    assert suggestion_service.get_suggestions(article, wait=0)[0] == suggestion_service.STATUS_PENDING
+    assert calls == []
+
+    caches['default'].set(suggestion_service._key(article.pk, version), RESULT)
+    assert suggestion_service.get_suggestions(article, wait=0) == (suggestion_service.STATUS_READY, version, RESULT)
+
+
+@pytest.mark.django_db
+def test_version_follows_tags_and_category(article):
+    version = suggestion_service.content_version(article)
+    article.tags.add(Tag.objects.create(name="Django"))
+    tagged = suggestion_service.content_version(article)
+    article.category = Category.objects.create(name="Other")
+
+    assert len({version, tagged, suggestion_service.content_version(article)}) == 3
@@ -0,0 +1,58 @@
+# blog/tests/utils/test_taxonomy_index.py
+import pytest
+from django.db.models import Q
+from django.utils.text import slugify
+from blog.models.tag_model import Tag
+from blog.utils.taxonomy_index import TaxonomyIndex, get_taxonomy_index, resolve_candidates
+
+
+def orm_lookup(candidate):
+    """The per-candidate query the index replaces"""
+    return Tag.objects.filter(
+        Q(name__iexact=candidate) |
+        Q(name__icontains=candidate) |
+        Q(slug=slugify(candidate))
+    ).first()
+
+
+@pytest.mark.django_db
+def test_index_matches_orm_lookup():
+    for name, slug in [
+        ("Machine Learning", "machine-learning"),
+        ("Learning", "learning"),
+        ("Python", "py"),
+        ("Web Development", "web-dev"),
+        ("Django REST", "rest"),
+    ]:
+        Tag.objects.create(name=name, slug=slug)
+
+    candidates = ["learning", "python", "py", "rest", "web", "django rest", "golang", "ing", "web-dev"]
+    resolved = resolve_candidates(Tag, candidates)
+
+    assert resolved == {candidate: orm_lookup(candidate) for candidate in candidates}
+
+
+def test_overlapping_patterns_report_lowest_pk():
+    index = TaxonomyIndex([(1, "Data Science", "data-science"), (2, "Science", "science"), (3, "Sci", "sci")])
+
+    assert index.match_many(["science", "sci", "data", "art"]) == {
+        "science": 1,
+        "sci": 1,
+        "data": 1,
+        "art": None,
+    }
+
+
+@pytest.mark.django_db
+def test_index_is_invalidated_by_signals(django_assert_num_queries):
+    Tag.objects.create(name="Python")
+    index = get_taxonomy_index(Tag)
+
+    with django_assert_num_queries(0):
+        assert get_taxonomy_index(Tag) is index
+
+    tag = Tag.objects.create(name="Rust")
+    assert get_taxonomy_index(Tag).match_many(["rust"]) == {"rust": tag.pk}
+
+    tag.delete()
+    assert get_taxonomy_index(Tag).match_many(["rust"]) == {"rust": None}
@@ -0,0 +1,81 @@
+# blog/tests/utils/test_term_stats.py
+from collections import Counter
+import pytest
+from django.core.management import call_command
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.term_stats_model import ArticleTermStats, TermDocumentFrequency
+from blog.settings import JOB_QUEUE_SETTINGS
+from blog.utils import term_stats
+
+
+@pytest.fixture
+def fixed_terms(monkeypatch):
+    """Serve each article's terms from a dict keyed by title instead of spaCy"""
+    terms = {}
+    monkeypatch.setitem(JOB_QUEUE_SETTINGS, 'ENABLED', False)
+    monkeypatch.setattr(term_stats, 'article_terms', lambda article: Counter(terms.get(article.title, {})))
+    return terms
+
+
+def document_counts():
+    return dict(TermDocumentFrequency.objects.values_list('term', 'document_count'))
+
+
+def create_article(title):
+    category, _ = Category.objects.get_or_create(name="Terms")
+    return Article.objects.create(
+        title=title, content="<p>Body.</p>", excerpt="x", meta_description="x", category=category
+    )
+
+
+@pytest.mark.django_db
+def test_frequencies_follow_save_and_delete(fixed_terms, django_capture_on_commit_callbacks):
+    fixed_terms["One"] = {"python": 3, "django": 1}
+    fixed_terms["Two"] = {"python": 1, "numpy": 2}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        first = create_article("One")
+        create_article("Two")
+    assert document_counts() == {"python": 2, "django": 1, "numpy": 1}
+
+    fixed_terms["One"] = {"python": 1, "flask": 1}
+    with django_capture_on_commit_callbacks(execute=True):
+        first.save()
+    assert document_counts() == {"python": 2, "flask": 1, "numpy": 1}
+
+    first.delete()
+    assert document_counts() == {"python": 1, "numpy": 1}
+    assert ArticleTermStats.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_rebuild_matches_incremental_counts(fixed_terms, django_capture_on_commit_callbacks):
+    fixed_terms["One"] = {"python": 2}
+    fixed_terms["Two"] = {"python": 1, "numpy": 1}
+    with django_capture_on_commit_callbacks(execute=True):
+        create_article("One")
+        create_article("Two")
+    incremental = document_counts()
+
+    TermDocumentFrequency.objects.all().delete()
+    call_command('rebuild_term_stats')
+
+    assert document_counts() == incremental
+
+
+@pytest.mark.django_db
+def test_tfidf_demotes_corpus_wide_terms(fixed_terms, django_capture_on_commit_callbacks):
+    # Empty corpus: plain frequency order, ties in first-seen order
+    assert [term for term, _ in term_stats.rank_by_tfidf(Counter({"article": 3, "django": 2, "orm": 2}))] == [
+        "article", "django", "orm"
+    ]
+
+    for number in range(5):
+        fixed_terms[f"Article {number}"] = {"article": 1}
+    with django_capture_on_commit_callbacks(execute=True):
+        for number in range(5):
+            create_article(f"Article {number}")
+
+    ranked = term_stats.rank_by_tfidf(Counter({"article": 3, "django": 2, "orm": 2}))
+    assert [term for term, _ in ranked] == ["django", "orm", "article"]
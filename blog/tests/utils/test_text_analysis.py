@@ -0,0 +1,93 @@
+# blog/tests/utils/test_text_analysis.py
+import pytest
+import spacy
+from spacy.tokens import Doc
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.settings import JOB_QUEUE_SETTINGS
+from blog.utils import text_analysis
+from blog.utils.nlp_cache import analysis_cache
+from blog.benchmarks import synthetic_doc
+from blog.benchmarks.excerpt import legacy_sentence_importance
+from blog.utils.spicy_utils import get_sentence_importance
+from blog.utils.text_analysis import ContentAnalysis
+
+
+def test_from_doc_collects_entities_and_keywords():
+    """Entities keep the index of the sentence they appear in."""
+    nlp = spacy.blank('en')
+    doc = Doc(
+        nlp.vocab,
+        words=['Django', 'powers', 'blogs', '.', 'Python', 'helps', '.'],
+        sent_starts=[True, False, False, False, True, False, False],
+        pos=['PROPN', 'VERB', 'NOUN', 'PUNCT', 'PROPN', 'VERB', 'PUNCT'],
+        ents=['B-ORG', 'O', 'O', 'O', 'B-PRODUCT', 'O', 'O'],
+    )
+
+    analysis = ContentAnalysis.from_doc(doc)
+
+    assert analysis.sentences == ['Django powers blogs .', 'Python helps .']
+    assert analysis.entities == [('Django', 'ORG', 0), ('Python', 'PRODUCT', 1)]
+    assert analysis.keywords == ['django', 'blogs', 'python']
+    assert analysis.word_count == 7
+
+
+def test_topic_entity_labels_follow_the_model_language():
+    entities = [('Stockholm', 'LOC', 0), ('Anna', 'PRS', 0), ('Mozilla', 'ORG', 0)]
+    english = ContentAnalysis(sentences=['One.'], entities=entities, language='en')
+    swedish = ContentAnalysis.from_dict(ContentAnalysis(sentences=['En.'], entities=entities, language='sv').to_dict())
+
+    assert text_analysis.tag_candidate_terms([english]) == ['mozilla']
+    assert text_analysis.tag_candidate_terms([swedish]) == ['stockholm', 'anna', 'mozilla']
+
+
+def test_excerpt_and_meta_description_from_one_analysis():
+    analysis = ContentAnalysis(sentences=['One two three.', 'Four five.', 'Six seven eight nine.'])
+
+    assert analysis.excerpt(max_words=5) == 'One two three. Four five.'
+    assert analysis.meta_description(max_chars=12) == 'Four five.'
+    assert analysis.meta_description(max_chars=8) == 'One t...'
+
+
+def test_sentence_importance_matches_span_loop():
+    doc = synthetic_doc(200, seed=3)
+
+    assert get_sentence_importance(doc).tolist() == legacy_sentence_importance(doc)
+
+
+def test_excerpt_prefers_important_sentences():
+    analysis = ContentAnalysis(
+        sentences=['Well, here we go again.', 'Django ships async views.', 'Thanks.', 'Python 3.13 drops the GIL.'],
+        sentence_scores=[1.0, 6.0, 0.0, 7.0],
+    )
+
+    assert analysis.excerpt(max_words=9) == 'Django ships async views. Python 3.13 drops the GIL.'
+    assert analysis.meta_description(max_chars=26) == 'Django ships async views.'
+
+
+@pytest.mark.django_db
+def test_article_save_parses_content_once(nlp_pipeline, monkeypatch):
+    monkeypatch.setitem(JOB_QUEUE_SETTINGS, 'ENABLED', False)
+    category = Category.objects.create(name="Technology")
+    article = Article.objects.create(
+        title="Parsing once",
+        content="<p>First sentence here.</p><p>Second sentence follows.</p>",
+        category=category,
+    )
+
+    assert nlp_pipeline.calls == 1
+    assert article.excerpt == "First sentence here. Second sentence follows."
+    assert article.meta_description == "First sentence here."
+
+
+def test_unchanged_content_is_served_from_cache(nlp_pipeline):
+    first = text_analysis.analyze_content("<p>Cached text. Still cached.</p>")
+    second = text_analysis.analyze_content("<div>Cached text.  Still cached.</div>")
+
+    assert nlp_pipeline.calls == 1
+    assert second.sentences == first.sentences
+    assert second.doc is None
+    assert analysis_cache.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+    text_analysis.analyze_content("<p>Different text.</p>")
+    assert nlp_pipeline.calls == 2
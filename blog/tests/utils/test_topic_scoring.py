@@ -0,0 +1,25 @@
+# blog/tests/utils/test_topic_scoring.py
+from blog.benchmarks import synthetic_doc
+from blog.benchmarks.topic_scoring import previous_analysis, previous_topic_scores, vectorized_topic_scores
+from blog.utils.text_analysis import ContentAnalysis
+from blog.utils.topic_scoring import score_topics
+
+
+def test_vectorized_scores_match_sentence_loop():
+    for seed in range(3):
+        doc = synthetic_doc(900, seed=seed)
+        expected = previous_topic_scores(previous_analysis(doc))
+        assert vectorized_topic_scores(ContentAnalysis.from_doc(doc)) == expected
+
+
+def test_ties_keep_first_appearance_order():
+    title = ContentAnalysis(sentences=['Title'], entities=[('Beta', 'ORG', 0)])
+    content = ContentAnalysis(
+        sentences=['One', 'Two', 'Three'],
+        entities=[('Alpha', 'ORG', 0), ('Gamma', 'GPE', 2), ('Ignored', 'DATE', 2)],
+        noun_chunks=[('beta', 2), ('alpha', 2), ('a very long phrase', 2)],
+    )
+
+    scores = score_topics([(title, 0, None, 2.0), (content, 0, 2, 1.5), (content, 2, None, 1.0)])
+
+    assert scores == [('beta', 2.5), ('alpha', 2.0), ('gamma', 1.0)]
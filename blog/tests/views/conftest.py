@@ -0,0 +1,39 @@
+# blog/tests/views/conftest.py
+import pytest
+from django.urls import reverse
+from blog.models import Article, Category, RelatedArticle, Tag
+
+
+@pytest.fixture
+def site(db):
+    """Two published articles in two categories; the second lists the first as related."""
+    python = Category.objects.create(name="Python", slug="python")
+    rust = Category.objects.create(name="Rust", slug="rust")
+    django = Tag.objects.create(name="Django", slug="django")
+    flask = Tag.objects.create(name="Flask", slug="flask")
+    first = Article.objects.create(
+        title="First post", content="<p>Body.</p>", excerpt="x", meta_description="x",
+        category=python, is_published=True,
+    )
+    second = Article.objects.create(
+        title="Second post", content="<p>Body.</p>", excerpt="x", meta_description="x",
+        category=rust, is_published=True,
+    )
+    first.tags.add(django)
+    RelatedArticle.objects.create(article=second, related=first, rank=1, score=1.0)
+    return {'first': first, 'second': second, 'python': python, 'rust': rust, 'django': django, 'flask': flask}
+
+
+# The public pages of the site fixture
+PAGES = {
+    'home': lambda s: reverse('home'),
+    'articles': lambda s: reverse('articles-list'),
+    'categories': lambda s: reverse('categories-list'),
+    'tags': lambda s: reverse('tags-list'),
+    'first': lambda s: s['first'].get_absolute_url(),
+    'second': lambda s: s['second'].get_absolute_url(),
+    'python': lambda s: s['python'].get_absolute_url(),
+    'rust': lambda s: s['rust'].get_absolute_url(),
+    'django': lambda s: s['django'].get_absolute_url(),
+    'sitemap': lambda s: reverse('sitemap'),
+}
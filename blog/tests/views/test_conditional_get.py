@@ -0,0 +1,108 @@
+# blog/tests/views/test_conditional_get.py
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from blog.models import Article
+from blog.tests.views.conftest import PAGES
+
+# The home page has no validators
+PAGES = {name: url for name, url in PAGES.items() if name != 'home'}
+
+# Validator queries per page; the sitemap aggregates articles, categories and tags separately
+QUERIES = {'sitemap': 3}
+
+
+def etag(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response['Last-Modified']
+    return response['ETag']
+
+
+@pytest.mark.parametrize('name', PAGES)
+def test_matching_etag_is_not_modified_without_rendering(client, site, name, django_assert_num_queries):
+    url = PAGES[name](site)
+    tag = etag(client, url)
+    with django_assert_num_queries(QUERIES.get(name, 1)):
+        response = client.get(url, HTTP_IF_NONE_MATCH=tag)
+    assert response.status_code == 304
+    assert not response.templates
+    assert not response.content
+
+
+@pytest.mark.parametrize('name', PAGES)
+def test_last_modified_is_honoured(client, site, name):
+    url = PAGES[name](site)
+    last_modified = client.get(url)['Last-Modified']
+    assert client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code == 304
+
+
+def test_editing_the_article_changes_its_pages(client, site):
+    urls = {name: PAGES[name](site) for name in ('articles', 'first', 'python', 'django', 'sitemap')}
+    before = {name: etag(client, url) for name, url in urls.items()}
+    site['first'].title = "First post, revised"
+    site['first'].save()
+    for name, url in urls.items():
+        assert client.get(url, HTTP_IF_NONE_MATCH=before[name]).status_code == 200, name
+
+
+def test_linking_a_tag_changes_the_article(client, site):
+    url = site['first'].get_absolute_url()
+    before = etag(client, url)
+    site['first'].tags.add(site['flask'])
+    assert etag(client, url) != before
+
+
+def test_editing_a_related_article_changes_the_page_listing_it(client, site):
+    url = site['second'].get_absolute_url()
+    before = etag(client, url)
+    site['first'].title = "First post, revised"
+    site['first'].save()
+    assert client.get(url, HTTP_IF_NONE_MATCH=before).status_code == 200
+
+
+def test_fields_derived_by_the_job_queue_change_the_article(
+    client, site, nlp_pipeline, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        article = Article.objects.create(
+            title="Queued post", content="<p>Queued first sentence.</p><p>Then more.</p>",
+            category=site['python'], is_published=True,
+        )
+    url = article.get_absolute_url()
+    before = etag(client, url)
+    # Served before the worker ran: the fallback description
+    assert b'content="Discover insights on Queued post"' in client.get(url).content
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command('run_worker', once=True)
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=before)
+    assert response.status_code == 200
+    assert b'content="Queued first sentence.' in response.content
+    assert Article.objects.get(pk=article.pk).updated_at > article.updated_at
+
+
+def test_deleting_an_older_article_changes_the_lists(client, site, django_capture_on_commit_callbacks):
+    urls = {name: PAGES[name](site) for name in ('articles', 'categories', 'python', 'sitemap')}
+    before = {name: etag(client, url) for name, url in urls.items()}
+    # The newest updated_at stays the same; the stored counts and the purged group versions move
+    with django_capture_on_commit_callbacks(execute=True):
+        site['first'].delete()
+    for name, url in urls.items():
+        assert etag(client, url) != before[name], name
+
+
+def test_missing_article_is_not_found(client, db):
+    response = client.get(reverse('article-detail', kwargs={'slug': 'missing'}), HTTP_IF_NONE_MATCH='"x"')
+    assert response.status_code == 404
+
+
+def test_cached_page_answers_not_modified_without_queries(client, site, page_cache, django_assert_num_queries):
+    url = site['first'].get_absolute_url()
+    tag = etag(client, url)
+    with django_assert_num_queries(0):
+        response = client.get(url, HTTP_IF_NONE_MATCH=tag)
+    assert response.status_code == 304
+    with django_assert_num_queries(0):
+        assert client.get(url, HTTP_IF_NONE_MATCH='"stale"').status_code == 200
@@ -0,0 +1,66 @@
+# blog/tests/views/test_keyset_pagination.py
+import json
+import pytest
+from django.urls import reverse
+from blog.models import Article, Category
+from blog.settings import PAGINATION_SETTINGS
+
+
+@pytest.fixture
+def keyset(monkeypatch):
+    monkeypatch.setitem(PAGINATION_SETTINGS, 'KEYSET', True)
+
+
+@pytest.fixture
+def articles(db):
+    category, _ = Category.objects.get_or_create(name="General")
+    Article.objects.bulk_create([
+        Article(title=f"Article {i}", slug=f"article-{i}", content="Body", excerpt="Excerpt",
+                category=category, is_published=True)
+        for i in range(5)
+    ])
+    return list(Article.objects.order_by('-created_at', '-id'))
+
+
+def test_article_list_follows_cursors(client, keyset, articles, django_assert_max_num_queries):
+    response = client.get(reverse('articles-list'))
+    assert [a.pk for a in response.context['article_list']] == [a.pk for a in articles[:2]]
+
+    page = response.context['page_obj']
+    assert f'?after={page.next_cursor}' in response.content.decode()
+    # The conditional GET validators, then the page: no COUNT
+    with django_assert_max_num_queries(2):
+        response = client.get(reverse('articles-list'), {'after': page.next_cursor})
+    assert [a.pk for a in response.context['article_list']] == [a.pk for a in articles[2:4]]
+
+
+def test_article_list_rejects_bad_cursor(client, keyset, articles):
+    assert client.get(reverse('articles-list'), {'after': 'bogus'}).status_code == 404
+
+
+def test_numbered_pages_are_not_served(client, keyset, articles):
+    assert client.get(reverse('article-list-paginated', kwargs={'page': 2})).status_code == 404
+    assert client.get(reverse('articles-list'), {'page': 2}).status_code == 404
+
+
+def graphql(client, query):
+    response = client.post('/graphql/', json.dumps({'query': query}), content_type='application/json')
+    return response.json()
+
+
+def test_all_articles_connection_pages_by_cursor(client, keyset, articles):
+    query = '{ allArticles(first: 3%s) { edges { cursor node { slug } } pageInfo { hasNextPage endCursor } } }'
+    first = graphql(client, query % '')['data']['allArticles']
+    assert [edge['node']['slug'] for edge in first['edges']] == [a.slug for a in articles[:3]]
+    assert first['pageInfo']['hasNextPage']
+
+    rest = graphql(client, query % f', after: "{first["pageInfo"]["endCursor"]}"')['data']['allArticles']
+    assert [edge['node']['slug'] for edge in rest['edges']] == [a.slug for a in articles[3:]]
+    assert not rest['pageInfo']['hasNextPage']
+
+
+def test_all_articles_last(client, keyset, articles):
+    data = graphql(client, '{ allArticles(last: 2) { edges { node { slug } } pageInfo { hasPreviousPage } } }')
+    connection = data['data']['allArticles']
+    assert [edge['node']['slug'] for edge in connection['edges']] == [a.slug for a in articles[-2:]]
+    assert connection['pageInfo']['hasPreviousPage']
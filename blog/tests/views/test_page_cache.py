@@ -0,0 +1,140 @@
+# blog/tests/views/test_page_cache.py
+import pytest
+from django.db import transaction
+from django.urls import reverse
+from blog.models import Article
+from blog.tasks import generate_article_summaries
+from blog.tests.views.conftest import PAGES
+from blog.utils.related_articles import _store
+
+
+# Every test here runs with the page cache on
+pytestmark = pytest.mark.usefixtures('page_cache')
+
+
+def warm(client, site):
+    for name, url in PAGES.items():
+        assert client.get(url(site)).status_code == 200, name
+
+
+def cached(client, site):
+    """Names of the pages still served from the cache (nothing rendered)"""
+    return {name for name, url in PAGES.items() if not client.get(url(site)).templates}
+
+
+def test_second_request_is_served_from_the_cache(client, site, django_assert_num_queries):
+    warm(client, site)
+    assert cached(client, site) == set(PAGES)
+    with django_assert_num_queries(0):
+        client.get(site['first'].get_absolute_url())
+
+
+def test_language_is_part_of_the_key(client, site):
+    url = site['first'].get_absolute_url()
+    client.get(url, HTTP_ACCEPT_LANGUAGE='en')
+    assert client.get(url, HTTP_ACCEPT_LANGUAGE='sv').templates
+    assert not client.get(url, HTTP_ACCEPT_LANGUAGE='en').templates
+
+
+def test_article_save_purges_its_pages(client, site, django_capture_on_commit_callbacks):
+    warm(client, site)
+    with django_capture_on_commit_callbacks(execute=True):
+        site['first'].title = "First post, revised"
+        site['first'].save()
+    # Its page, its category and tag, the lists, the sitemap and the page listing it as related
+    assert cached(client, site) == {'rust'}
+    assert b"First post, revised" in client.get(site['second'].get_absolute_url()).content
+
+
+def test_category_move_purges_both_categories(client, site, django_capture_on_commit_callbacks):
+    warm(client, site)
+    with django_capture_on_commit_callbacks(execute=True):
+        site['second'].category = site['python']
+        site['second'].save()
+    assert {'python', 'rust', 'second'}.isdisjoint(cached(client, site))
+
+
+def test_draft_edits_purge_nothing(client, site, django_capture_on_commit_callbacks):
+    draft = Article.objects.create(
+        title="Draft", content="<p>Body.</p>", excerpt="x", meta_description="x", category=site['python'],
+    )
+    warm(client, site)
+    with django_capture_on_commit_callbacks(execute=True):
+        draft.content = "<p>Still a draft.</p>"
+        draft.save()
+    assert cached(client, site) == set(PAGES)
+
+
+def test_tag_links_purge_article_and_tag(client, site, django_capture_on_commit_callbacks):
+    warm(client, site)
+    with django_capture_on_commit_callbacks(execute=True):
+        site['second'].tags.add(site['django'])
+    assert cached(client, site) == {'first', 'python', 'rust', 'sitemap'}
+
+    warm(client, site)
+    with django_capture_on_commit_callbacks(execute=True):
+        site['django'].articles.clear()
+    assert cached(client, site) == {'python', 'rust', 'sitemap'}
+
+
+def test_taxonomy_rename_purges_pages_showing_it(client, site, django_capture_on_commit_callbacks):
+    warm(client, site)
+    with django_capture_on_commit_callbacks(execute=True):
+        site['python'].name = "Python 3"
+        site['python'].save()
+    assert cached(client, site) == {'second', 'rust', 'django'}
+    assert b"Python 3" in client.get(site['first'].get_absolute_url()).content
+
+
+def test_purges_wait_for_the_commit(client, site, django_capture_on_commit_callbacks):
+    warm(client, site)
+    with django_capture_on_commit_callbacks() as callbacks:
+        site['first'].title = "First post, revised"
+        site['first'].save()
+        # Until the commit, readers still see the old row: keep serving the old page
+        assert cached(client, site) == set(PAGES)
+    for callback in callbacks:
+        callback()
+    assert 'first' not in cached(client, site)
+
+
+def test_rolled_back_changes_purge_nothing(client, site, django_capture_on_commit_callbacks):
+    warm(client, site)
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                site['second'].title = "Never saved"
+                site['second'].save()
+                raise RuntimeError
+    assert callbacks == []
+    assert cached(client, site) == set(PAGES)
+
+
+def test_authenticated_requests_bypass_the_cache(client, site, django_user_model, page_cache):
+    client.force_login(django_user_model.objects.create_user('editor', password='x'))
+    client.get(reverse('home'))
+    assert not [key for key in page_cache._cache if ':page:' in key]
+
+
+def test_worker_writes_purge_pages(client, site, nlp_pipeline, django_capture_on_commit_callbacks):
+    Article.objects.filter(pk=site['first'].pk).update(excerpt="")
+    before = Article.objects.get(pk=site['first'].pk).updated_at
+    warm(client, site)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        generate_article_summaries(site['first'].pk)
+
+    first = Article.objects.get(pk=site['first'].pk)
+    assert first.excerpt and first.updated_at > before
+    assert cached(client, site) == {'rust'}
+
+
+def test_related_list_changes_purge_only_changed_articles(client, site, django_capture_on_commit_callbacks):
+    warm(client, site)
+    with django_capture_on_commit_callbacks(execute=True):
+        _store({site['second'].pk: [(site['first'].pk, 0.5)]})
+    assert cached(client, site) == set(PAGES)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _store({site['second'].pk: []})
+    assert 'second' not in cached(client, site)
@@ -0,0 +1,98 @@
+# blog/tests/views/test_query_budgets.py
+import pytest
+from django.urls import reverse
+from blog.models import Article, Category, RelatedArticle, Tag
+from blog.utils.article_counts import recount
+
+SIZES = [10, 100, 1000]
+
+# Queries per page, whatever the number of articles (validators: see blog/utils/conditional.py)
+BUDGETS = {
+    'articles-list': 3,      # validators + count + page
+    'article-detail': 4,     # validators + article with category + tags + related articles
+    'category-detail': 3,    # validators + category with its stored count + page of its articles
+    'tag-detail': 3,         # validators + tag with its stored count + page of its articles
+    'categories-list': 2,    # validators + categories
+    'tags-list': 2,          # validators + tags
+}
+
+
+def build_corpus(size):
+    """`size` published articles over a few categories, each with two tags and three neighbours"""
+    categories = Category.objects.bulk_create([
+        Category(name=f"Category {i}", slug=f"category-{i}") for i in range(3)
+    ])
+    tags = Tag.objects.bulk_create([Tag(name=f"Tag {i}", slug=f"tag-{i}") for i in range(4)])
+    articles = Article.objects.bulk_create([
+        Article(
+            title=f"Article {i}",
+            slug=f"article-{i}",
+            content=f"<p>Body of article {i} with a few words.</p>",
+            excerpt="Excerpt",
+            category=categories[i % len(categories)],
+            is_published=True,
+        )
+        for i in range(size)
+    ])
+    Article.tags.through.objects.bulk_create([
+        Article.tags.through(article_id=article.pk, tag_id=tags[(i + offset) % len(tags)].pk)
+        for i, article in enumerate(articles)
+        for offset in range(2)
+    ])
+    RelatedArticle.objects.bulk_create([
+        RelatedArticle(article=article, related=articles[(i + rank + 1) % size], rank=rank, score=1.0)
+        for i, article in enumerate(articles)
+        for rank in range(3)
+    ])
+    # bulk_create skips the signals that keep the stored counts
+    recount(Category)
+    recount(Tag)
+    return articles, categories, tags
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: f"{size}-articles")
+def corpus(request, db):
+    return build_corpus(request.param)
+
+
+def get(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    return response
+
+
+def test_article_list_budget(client, corpus, django_assert_max_num_queries):
+    with django_assert_max_num_queries(BUDGETS['articles-list']):
+        response = get(client, reverse('articles-list'))
+    assert b'articles-list__item' in response.content
+
+
+def test_article_detail_budget(client, corpus, django_assert_max_num_queries):
+    articles, categories, tags = corpus
+    with django_assert_max_num_queries(BUDGETS['article-detail']):
+        response = get(client, articles[0].get_absolute_url())
+
+    content = response.content.decode()
+    assert categories[0].get_absolute_url() in content
+    assert tags[0].get_absolute_url() in content and tags[1].get_absolute_url() in content
+    assert articles[1].get_absolute_url() in content
+
+
+def test_category_detail_budget(client, corpus, django_assert_max_num_queries):
+    articles, categories, _ = corpus
+    with django_assert_max_num_queries(BUDGETS['category-detail']):
+        response = get(client, categories[0].get_absolute_url())
+    assert response.content.count(b'articles-list__item') == min(len(articles[::len(categories)]), 10)
+
+
+def test_tag_detail_budget(client, corpus, django_assert_max_num_queries):
+    articles, _, tags = corpus
+    with django_assert_max_num_queries(BUDGETS['tag-detail']):
+        response = get(client, tags[0].get_absolute_url())
+    assert response.content.count(b'articles-list__item') == min(len(articles) // 2, 10)
+
+
+@pytest.mark.parametrize('name', ['categories-list', 'tags-list'])
+def test_taxonomy_list_budget(client, corpus, django_assert_max_num_queries, name):
+    with django_assert_max_num_queries(BUDGETS[name]):
+        get(client, reverse(name))
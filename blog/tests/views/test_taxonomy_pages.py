@@ -0,0 +1,76 @@
+# blog/tests/views/test_taxonomy_pages.py
+import pytest
+from django.urls import reverse
+from blog.models import Article, Category, Tag
+from blog.settings import PAGINATION_SETTINGS
+from blog.utils.article_counts import recount
+
+
+@pytest.fixture
+def category(db):
+    category = Category.objects.create(name="Python", slug="python")
+    tag = Tag.objects.create(name="Django", slug="django")
+    Article.objects.bulk_create([
+        Article(title=f"Article {i}", slug=f"article-{i}", content="Body", excerpt="Excerpt",
+                category=category, is_published=i != 0)
+        for i in range(26)
+    ])
+    Article.tags.through.objects.bulk_create([
+        Article.tags.through(article_id=pk, tag_id=tag.pk) for pk in Article.objects.values_list('pk', flat=True)
+    ])
+    recount(Category)
+    recount(Tag)
+    return category
+
+
+def slugs(response):
+    return [article.slug for article in response.context['article_list']]
+
+
+@pytest.mark.parametrize('name', ['category-detail', 'tag-detail'])
+def test_detail_pages_are_paginated(client, category, name):
+    slug = 'python' if name == 'category-detail' else 'django'
+    newest = list(
+        Article.objects.filter(is_published=True).order_by('-created_at', '-id').values_list('slug', flat=True)
+    )
+
+    first = client.get(reverse(name, args=[slug]))
+    assert slugs(first) == newest[:10]
+    assert first.context['paginator'].num_pages == 3
+    assert reverse(f'{name}-paginated', kwargs={'slug': slug, 'page': 2}) in first.content.decode()
+
+    last = client.get(reverse(f'{name}-paginated', kwargs={'slug': slug, 'page': 3}))
+    assert slugs(last) == newest[20:]
+    # Page 1 links back to the plain detail URL
+    assert f'href="{reverse(name, args=[slug])}"' in last.content.decode()
+
+    assert client.get(reverse(f'{name}-paginated', kwargs={'slug': slug, 'page': 4})).status_code == 404
+
+
+@pytest.mark.parametrize('stored', [0, 40])
+def test_drifted_article_count_falls_back_to_counting(client, category, stored):
+    Category.objects.filter(pk=category.pk).update(article_count=stored)
+    newest = list(
+        Article.objects.filter(is_published=True).order_by('-created_at', '-id').values_list('slug', flat=True)
+    )
+
+    first = client.get(reverse('category-detail', args=['python']))
+    assert slugs(first) == newest[:10]
+
+    # The last page reads past its end, so an overcount is caught there too
+    last = client.get(reverse('category-detail-paginated', kwargs={'slug': 'python', 'page': 3}))
+    assert slugs(last) == newest[20:]
+    assert last.context['paginator'].num_pages == 3
+    assert client.get(reverse('category-detail-paginated', kwargs={'slug': 'python', 'page': 4})).status_code == 404
+
+
+def test_detail_page_unknown_slug(client, category):
+    assert client.get(reverse('category-detail', args=['missing'])).status_code == 404
+
+
+def test_category_detail_keyset(client, category, monkeypatch):
+    monkeypatch.setitem(PAGINATION_SETTINGS, 'KEYSET', True)
+    first = client.get(reverse('category-detail', args=['python']))
+    cursor = first.context['page_obj'].next_cursor
+    second = client.get(reverse('category-detail', args=['python']), {'after': cursor})
+    assert len(slugs(second)) == 10 and not set(slugs(first)) & set(slugs(second))
@@ -3,9 +3,15 @@ from django.urls import path
 from .views.category_view import CategoryListView, CategoryDetailView
 from .views.tag_view import TagListView, TagDetailView
 from .views.article_view import ArticleListView, ArticleDetailView
+from .views.search_view import SearchView, autocomplete_view
 from .sitemaps import CategorySitemap, TagSitemap, ArticleSitemap
 from django.contrib.sitemaps.views import sitemap
 from .views.pages_view import home, about, contact
+from .utils.conditional import (
+    article_list_state, article_state, category_list_state, category_state,
+    public_page, sitemap_state, tag_list_state, tag_state,
+)
+from .utils.page_cache import LISTS, SITEMAP, cache_page
 
 sitemaps = {
     'categories': CategorySitemap,
@@ -14,18 +20,21 @@ sitemaps = {
 }
 
 urlpatterns = [
-    path('', home, name='home'),
+    path('', cache_page(LISTS)(home), name='home'),
     path('about/', about, name='about'),
     path('contact/', contact, name='contact'),
     path('privacy/', contact, name='privacy'),
     path('terms/', contact, name='terms'),
-    path('categories/', CategoryListView.as_view(), name='categories-list'),
-    path('tags/', TagListView.as_view(), name='tags-list'),
-    path('articles/', ArticleListView.as_view(), name='articles-list'),
-    path('articles/page-<int:page>/', ArticleListView.as_view(), name='article-list-paginated'),
-    path('categories/<slug:slug>/page-<int:page>/', CategoryDetailView.as_view(), name='category-detail-paginated'),
-    path('categories/<slug:slug>/', CategoryDetailView.as_view(), name='category-detail'),
-    path('tags/<slug:slug>/', TagDetailView.as_view(), name='tag-detail'),
-    path('articles/<slug:slug>/', ArticleDetailView.as_view(), name='article-detail'),
-    path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='sitemap'),
+    path('categories/', public_page(CategoryListView.as_view(), category_list_state, LISTS), name='categories-list'),
+    path('tags/', public_page(TagListView.as_view(), tag_list_state, LISTS), name='tags-list'),
+    path('articles/', public_page(ArticleListView.as_view(), article_list_state, LISTS), name='articles-list'),
+    path('articles/page-<int:page>/', public_page(ArticleListView.as_view(), article_list_state, LISTS), name='article-list-paginated'),
+    path('categories/<slug:slug>/page-<int:page>/', public_page(CategoryDetailView.as_view(), category_state, 'category:{slug}'), name='category-detail-paginated'),
+    path('categories/<slug:slug>/', public_page(CategoryDetailView.as_view(), category_state, 'category:{slug}'), name='category-detail'),
+    path('tags/<slug:slug>/page-<int:page>/', public_page(TagDetailView.as_view(), tag_state, 'tag:{slug}'), name='tag-detail-paginated'),
+    path('tags/<slug:slug>/', public_page(TagDetailView.as_view(), tag_state, 'tag:{slug}'), name='tag-detail'),
+    path('articles/<slug:slug>/', public_page(ArticleDetailView.as_view(), article_state, 'article:{slug}'), name='article-detail'),
+    path('search/', SearchView.as_view(), name='search'),
+    path('search/autocomplete/', autocomplete_view, name='search-autocomplete'),
+    path('sitemap.xml', public_page(sitemap, sitemap_state, SITEMAP), {'sitemaps': sitemaps}, name='sitemap'),
 ]
\ No newline at end of file
@@ -0,0 +1,91 @@
+# blog/utils/article_counts.py
+import logging
+from django.db import transaction
+from django.db.models import Count, F, Q
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.tag_model import Tag
+
+logger = logging.getLogger(__name__)
+
+
+def adjust(model, pks, delta):
+    """Add `delta` to the published article count of these categories or tags"""
+    pks = [pk for pk in pks if pk is not None]
+    if pks and delta:
+        model.objects.filter(pk__in=pks).update(article_count=F('article_count') + delta)
+
+
+def stored_state(article):
+    """
+    Slug, category_id and is_published of the article as it is in the
+    database, or None. The row stays locked until the save's transaction
+    ends (see Article.save), so a concurrent save of the same article waits
+    and then reads the state this one leaves behind.
+    """
+    if article.pk is None:
+        return None
+    return (
+        Article.objects.select_for_update()
+        .filter(pk=article.pk)
+        .values('slug', 'category_id', 'is_published')
+        .first()
+    )
+
+
+def article_saved(article, previous):
+    """
+    Move the article's contribution from its previous category and publication
+    state (see stored_state) to the current one. Tags only change when
+    publication does: their links are counted by tags_linked.
+    """
+    was_published = bool(previous and previous['is_published'])
+    old_category = previous['category_id'] if previous else None
+    if was_published == article.is_published and (old_category == article.category_id or not was_published):
+        return
+
+    with transaction.atomic():
+        if was_published:
+            adjust(Category, [old_category], -1)
+        if article.is_published:
+            adjust(Category, [article.category_id], 1)
+        if was_published != article.is_published:
+            tag_ids = list(article.tags.values_list('pk', flat=True))
+            adjust(Tag, tag_ids, 1 if article.is_published else -1)
+
+
+def article_deleted(article):
+    """An article about to be deleted, while its tags are still linked"""
+    if not article.is_published:
+        return
+    with transaction.atomic():
+        adjust(Category, [article.category_id], -1)
+        adjust(Tag, list(article.tags.values_list('pk', flat=True)), -1)
+
+
+def tags_linked(article_ids, tag_ids, delta):
+    """
+    Links between these articles and tags were added (delta=1) or removed
+    (delta=-1); every published article counts once for every tag.
+    """
+    published = Article.objects.filter(pk__in=article_ids, is_published=True).count()
+    adjust(Tag, tag_ids, published * delta)
+
+
+def recount(model):
+    """
+    Recompute every stored count of a model (Category or Tag) from the
+    articles; returns {pk: (stored, actual)} for the rows that had drifted.
+    """
+    rows = model.objects.annotate(
+        actual=Count('articles', filter=Q(articles__is_published=True))
+    ).values_list('pk', 'article_count', 'actual')
+    drifted = {pk: (stored, actual) for pk, stored, actual in rows if stored != actual}
+    if drifted:
+        model.objects.bulk_update(
+            [model(pk=pk, article_count=actual) for pk, (_, actual) in drifted.items()],
+            ['article_count'],
+            batch_size=500,
+        )
+        logger.warning(f"Repaired {len(drifted)} {model._meta.verbose_name_plural} article counts")
+    return drifted
@@ -0,0 +1,498 @@
+# blog/utils/autocomplete.py
+import gc
+import re
+from bisect import bisect_left
+import threading
+import time
+import unicodedata
+from django.core.cache import caches
+from django.db import transaction
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.tag_model import Tag
+from blog.settings import AUTOCOMPLETE_SETTINGS
+
+KIND_ARTICLE = 'article'
+KIND_CATEGORY = 'category'
+KIND_TAG = 'tag'
+
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+VERSION_KEY = 'autocomplete-trie-version'
+
+
+def normalize(text):
+    """Lowercase, strip accents and collapse whitespace, so 'Čevapi  Recipes' matches 'cevapi r'"""
+    text = text.lower()
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)
+        text = ''.join(char for char in text if not unicodedata.combining(char))
+    return ' '.join(text.split())
+
+
+def completion_keys(label, max_words=None):
+    """
+    Keys a label is reachable under: the whole label and the label from each
+    later word on, so 'Intro to Django' completes 'dja' as well as 'intro'.
+    """
+    max_words = max_words or AUTOCOMPLETE_SETTINGS['MAX_WORD_STARTS']
+    max_length = AUTOCOMPLETE_SETTINGS['MAX_KEY_LENGTH']
+    text = normalize(label)
+    starts = [match.start() for match in WORD_RE.finditer(text)][:max_words] or [0]
+    return list(dict.fromkeys(text[start:start + max_length] for start in starts))
+
+
+class Entry:
+    """Something a prefix can complete to; higher score ranks first"""
+    __slots__ = ('kind', 'pk', 'label', 'slug', 'score', 'rank')
+
+    def __init__(self, kind, pk, label, slug, score):
+        self.kind = kind
+        self.pk = pk
+        self.label = label
+        self.slug = slug
+        self.score = score
+        # Sort key: best first, then alphabetical, then stable by identity
+        self.rank = (-score, label.lower(), kind, pk)
+
+    @property
+    def key(self):
+        return (self.kind, self.pk)
+
+
+class Node:
+    """
+    Radix trie node. Edges carry whole substrings; `top` caches the best
+    entries of the subtree so a lookup never walks below the prefix.
+    Most nodes are leaves, so `children` and `entries` stay None until used.
+    """
+    __slots__ = ('children', 'entries', 'top', 'dirty')
+
+    def __init__(self, top=None):
+        # first character -> [edge label, child node]
+        self.children = None
+        # Ranks of the entries whose key ends here
+        self.entries = None
+        # Sorted ranks of the best entries in this subtree
+        self.top = top if top is not None else []
+        self.dirty = False
+
+
+class CompletionTrie:
+    """
+    Compressed prefix trie over entry keys with per-node top-k lists.
+
+    Lookups cost O(len(prefix) + k). Inserting merges the entry into the top
+    lists along its path. Removing drops it from them and marks full lists
+    dirty; a dirty list is rebuilt from the children's lists on next lookup.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.root = Node()
+        self.entries = {}
+        self.keys = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    @classmethod
+    def build(cls, capacity, items):
+        """
+        Bulk-load [(entry, keys)]: sort every key once and build the trie and
+        its top lists bottom-up, much faster than inserting one by one.
+        """
+        trie = cls(capacity)
+        pairs = []
+        for entry, keys in items:
+            trie.entries[entry.key] = entry
+            trie.keys[entry.key] = keys
+            pairs.extend((key, entry.rank) for key in keys)
+        pairs.sort()
+        keys = [key for key, _ in pairs]
+        ranks = [rank for _, rank in pairs]
+        # Hundreds of thousands of new container objects would trigger the cyclic
+        # collector over and over, roughly doubling the build time
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            trie.root = trie._build_node(keys, ranks, 0, len(keys), 0)
+        finally:
+            if collecting:
+                gc.enable()
+        return trie
+
+    def _build_node(self, keys, ranks, low, high, depth):
+        """Node for keys[low:high] (sorted), which share their first `depth` characters"""
+        node = Node()
+        tops = []
+        # Keys ending here sort first
+        position = low
+        while position < high and len(keys[position]) == depth:
+            position += 1
+        if position > low:
+            node.entries = ranks[low:position]
+            tops.append(sorted(node.entries))
+
+        if position < high:
+            node.children = {}
+        while position < high:
+            first_key = keys[position]
+            char = first_key[depth]
+            # Keys continuing with `char` are contiguous and end before prefix + next char
+            end = bisect_left(keys, first_key[:depth] + chr(ord(char) + 1), position + 1, high)
+            if end - position == 1:
+                common = len(first_key)
+            else:
+                # Sorted, so the group's common prefix is that of its first and last keys
+                last_key = keys[end - 1]
+                common, limit = depth + 1, min(len(first_key), len(last_key))
+                # Binary search on slice equality: a few C-level compares instead of a char loop
+                while common < limit:
+                    middle = (common + limit + 1) // 2
+                    if first_key[:middle] == last_key[:middle]:
+                        common = middle
+                    else:
+                        limit = middle - 1
+            child = self._build_node(keys, ranks, position, end, common)
+            node.children[char] = [first_key[depth:common], child]
+            tops.append(child.top)
+            position = end
+
+        node.top = self._merge(tops)
+        return node
+
+    def _merge(self, lists):
+        """Best `capacity` distinct ranks of several sorted lists"""
+        if len(lists) == 1:
+            return lists[0][:self.capacity]
+        return sorted(set().union(*lists))[:self.capacity]
+
+    def add(self, entry, keys):
+        """Insert (or replace) an entry reachable under `keys`"""
+        if entry.key in self.entries:
+            self.remove(entry.kind, entry.pk)
+        self.entries[entry.key] = entry
+        self.keys[entry.key] = keys
+        for key in keys:
+            for node in self._insert_path(key):
+                self._offer(node, entry.rank)
+            if node.entries is None:
+                node.entries = []
+            if entry.rank not in node.entries:
+                node.entries.append(entry.rank)
+
+    def remove(self, kind, pk):
+        entry = self.entries.pop((kind, pk), None)
+        if entry is None:
+            return
+        for key in self.keys.pop((kind, pk)):
+            path = self._find_path(key)
+            if path is None:
+                continue
+            end = path[-1][0]
+            if end.entries and entry.rank in end.entries:
+                end.entries.remove(entry.rank)
+            for node, _ in path:
+                if entry.rank in node.top:
+                    if len(node.top) >= self.capacity:
+                        node.dirty = True
+                    node.top.remove(entry.rank)
+            self._prune(path)
+
+    def complete(self, prefix, limit):
+        node = self._prefix_node(prefix)
+        if node is None:
+            return []
+        self._clean(node)
+        return [self.entries[rank[2], rank[3]] for rank in node.top[:limit]]
+
+    def _offer(self, node, rank):
+        top = node.top
+        # A label can reach the same node under two keys ('django django')
+        if rank in top:
+            return
+        if len(top) < self.capacity or rank < top[-1]:
+            position = 0
+            while position < len(top) and top[position] < rank:
+                position += 1
+            top.insert(position, rank)
+            del top[self.capacity:]
+
+    def _insert_path(self, key):
+        """Nodes from the root to `key`'s node, splitting an edge if needed"""
+        node = self.root
+        path = [node]
+        while key:
+            edge = node.children.get(key[0]) if node.children else None
+            if edge is None:
+                child = Node()
+                if node.children is None:
+                    node.children = {}
+                node.children[key[0]] = [key, child]
+                path.append(child)
+                return path
+
+            label, child = edge
+            common = 0
+            limit = min(len(label), len(key))
+            while common < limit and label[common] == key[common]:
+                common += 1
+
+            if common < len(label):
+                # Split: node -label[:common]-> middle -label[common:]-> child
+                middle = Node(list(child.top))
+                middle.children = {label[common]: [label[common:], child]}
+                middle.dirty = child.dirty
+                node.children[key[0]] = [label[:common], middle]
+                child = middle
+
+            node = child
+            path.append(node)
+            key = key[common:]
+        return path
+
+    def _find_path(self, key):
+        """[(node, first char of the edge into it)] down to `key`, or None"""
+        node = self.root
+        path = [(node, None)]
+        while key:
+            edge = node.children.get(key[0]) if node.children else None
+            if edge is None or not key.startswith(edge[0]):
+                return None
+            path.append((edge[1], key[0]))
+            node = edge[1]
+            key = key[len(edge[0]):]
+        return path
+
+    def _prune(self, path):
+        """Drop nodes the removal left without entries or children"""
+        for position in range(len(path) - 1, 0, -1):
+            node, char = path[position]
+            if node.entries or node.children:
+                break
+            parent = path[position - 1][0]
+            del parent.children[char]
+            if not parent.children:
+                parent.children = None
+
+    def _prefix_node(self, prefix):
+        node = self.root
+        while prefix:
+            edge = node.children.get(prefix[0]) if node.children else None
+            if edge is None:
+                return None
+            label, child = edge
+            if label.startswith(prefix):
+                return child
+            if not prefix.startswith(label):
+                return None
+            node = child
+            prefix = prefix[len(label):]
+        return node
+
+    def _clean(self, node):
+        """Rebuild a dirty top list from the node's own entries and its children's lists"""
+        if not node.dirty:
+            return
+        lists = [sorted(node.entries or ())[:self.capacity]]
+        for _, child in (node.children or {}).values():
+            self._clean(child)
+            lists.append(child.top)
+        node.top = self._merge(lists)
+        node.dirty = False
+
+
+def article_score(is_featured):
+    return AUTOCOMPLETE_SETTINGS['FEATURED_ARTICLE_SCORE'] if is_featured else AUTOCOMPLETE_SETTINGS['ARTICLE_SCORE']
+
+
+def taxonomy_kind(model):
+    return KIND_CATEGORY if model._meta.model_name == 'category' else KIND_TAG
+
+
+def taxonomy_rows(model, pks=None):
+    """
+    (pk, name, slug, published article count) for Tag or Category. The count
+    is the stored article_count (see blog/utils/article_counts.py); the
+    signals patching the trie run after the ones moving it.
+    """
+    queryset = model.objects.all() if pks is None else model.objects.filter(pk__in=pks)
+    return queryset.values_list('pk', 'name', 'slug', 'article_count')
+
+
+def taxonomy_entries(model, pks):
+    """Fresh entries for these tags or categories (read before taking the trie lock)"""
+    if not pks:
+        return []
+    kind = taxonomy_kind(model)
+    return [
+        (Entry(kind, pk, name, slug, published), completion_keys(name))
+        for pk, name, slug, published in taxonomy_rows(model, pks)
+    ]
+
+
+def build_trie():
+    """Every published article title, tag and category name"""
+    items = []
+    articles = Article.objects.filter(is_published=True).values_list('pk', 'title', 'slug', 'is_featured')
+    for pk, title, slug, is_featured in articles.iterator(chunk_size=2000):
+        items.append((Entry(KIND_ARTICLE, pk, title, slug, article_score(is_featured)), completion_keys(title)))
+    for model in (Category, Tag):
+        kind = taxonomy_kind(model)
+        for pk, name, slug, published in taxonomy_rows(model):
+            items.append((Entry(kind, pk, name, slug, published), completion_keys(name)))
+    return CompletionTrie.build(AUTOCOMPLETE_SETTINGS['TOP_CAPACITY'], items)
+
+
+class AutocompleteIndex:
+    """
+    The process-wide trie. Built lazily; patched in place by the signals of
+    the process that made a change, and rebuilt by the others when the
+    version in the shared cache moves or MAX_AGE passes. Patches and
+    invalidations wait for the surrounding transaction to commit, so a
+    rollback leaves the trie alone and no process rebuilds from rows it
+    cannot see yet.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._trie = None
+        self._version = None
+        self._built_at = 0.0
+
+    def _cache(self):
+        return caches[AUTOCOMPLETE_SETTINGS['CACHE_ALIAS']]
+
+    def _shared_version(self):
+        return self._cache().get(VERSION_KEY, 0)
+
+    def _bump(self):
+        cache = self._cache()
+        try:
+            return cache.incr(VERSION_KEY)
+        except ValueError:
+            cache.set(VERSION_KEY, 1, None)
+            return 1
+
+    def trie(self):
+        version = self._shared_version()
+        with self._lock:
+            fresh = time.monotonic() - self._built_at < AUTOCOMPLETE_SETTINGS['MAX_AGE']
+            if self._trie is None or self._version != version or not fresh:
+                self._trie = build_trie()
+                self._version = version
+                self._built_at = time.monotonic()
+            return self._trie
+
+    def complete(self, query, limit=None):
+        prefix = normalize(query)[:AUTOCOMPLETE_SETTINGS['MAX_KEY_LENGTH']]
+        if len(prefix) < AUTOCOMPLETE_SETTINGS['MIN_PREFIX']:
+            return []
+        limit = min(limit or AUTOCOMPLETE_SETTINGS['LIMIT'], AUTOCOMPLETE_SETTINGS['TOP_CAPACITY'])
+        trie = self.trie()
+        with self._lock:
+            return trie.complete(prefix, limit)
+
+    def patch(self, apply):
+        """
+        Apply `apply(trie)` to the loaded trie and publish a new version, once
+        the transaction commits. If another process changed the data since our
+        build, drop the trie instead, so the next lookup rebuilds from the database.
+        """
+        transaction.on_commit(lambda: self._patch(apply))
+
+    def _patch(self, apply):
+        with self._lock:
+            version = self._bump()
+            if self._trie is not None and self._version == version - 1:
+                apply(self._trie)
+                self._version = version
+            else:
+                self._trie = None
+
+    @property
+    def loaded(self):
+        return self._trie is not None
+
+    def invalidate(self):
+        """Publish a new version without patching, on commit: every process rebuilds on next use"""
+        transaction.on_commit(self._invalidate)
+
+    def _invalidate(self):
+        with self._lock:
+            self._bump()
+            self._trie = None
+
+    def clear(self):
+        with self._lock:
+            self._trie = None
+            self._version = None
+
+
+autocomplete_index = AutocompleteIndex()
+
+
+def update_article(article, previous=None):
+    """
+    A saved article: its own entry plus the popularity of its category (and
+    of the one it left; previous is its stored state, see
+    article_counts.stored_state) and tags, in one patch
+    """
+    if not autocomplete_index.loaded:
+        return autocomplete_index.invalidate()
+    tag_ids = list(article.tags.values_list('pk', flat=True))
+    category_ids = {article.category_id} | ({previous['category_id']} if previous else set())
+    entries = taxonomy_entries(Category, category_ids - {None}) + taxonomy_entries(Tag, tag_ids)
+    # Read now: the patch runs on commit, when the instance may have changed again
+    pk = article.pk
+    own = None
+    if article.is_published:
+        own = (Entry(KIND_ARTICLE, pk, article.title, article.slug, article_score(article.is_featured)),
+               completion_keys(article.title))
+
+    def apply(trie):
+        if own:
+            trie.add(*own)
+        else:
+            trie.remove(KIND_ARTICLE, pk)
+        for entry, keys in entries:
+            trie.add(entry, keys)
+    autocomplete_index.patch(apply)
+
+
+def remove_article(article):
+    """An article about to be deleted, its counts already released; its tags are still linked"""
+    if not autocomplete_index.loaded:
+        return autocomplete_index.invalidate()
+    tag_ids = list(article.tags.values_list('pk', flat=True))
+    entries = taxonomy_entries(Category, [article.category_id]) + taxonomy_entries(Tag, tag_ids)
+    # The deleted instance has no pk by the time the patch runs
+    pk = article.pk
+
+    def apply(trie):
+        trie.remove(KIND_ARTICLE, pk)
+        for entry, keys in entries:
+            trie.add(entry, keys)
+    autocomplete_index.patch(apply)
+
+
+def update_taxonomies(model, pks):
+    """Re-read names and published article counts of these tags or categories"""
+    if not autocomplete_index.loaded:
+        return autocomplete_index.invalidate()
+    entries = taxonomy_entries(model, list(pks))
+
+    def apply(trie):
+        for entry, keys in entries:
+            trie.add(entry, keys)
+    autocomplete_index.patch(apply)
+
+
+def remove_taxonomy(model, pk):
+    kind = taxonomy_kind(model)
+    autocomplete_index.patch(lambda trie: trie.remove(kind, pk))
+
+
+def complete(query, limit=None):
+    """Top completions for a typed prefix, best first"""
+    return autocomplete_index.complete(query, limit)
@@ -0,0 +1,110 @@
+# blog/utils/conditional.py
+import hashlib
+from django.db.models import Count, Max, Q, Sum
+from django.utils import translation
+from django.views.decorators.http import condition
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.tag_model import Tag
+from blog.utils import page_cache
+
+
+def latest(*values):
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
+
+
+# Validators: one query for a page's (last_modified, state), or None when there is no such page
+
+def article_state(request, slug, **kwargs):
+    # Worker writes (summaries, images, a new related list) move updated_at too
+    # (see page_cache.update_derived); edits to a listed article move its own
+    row = (
+        Article.objects.filter(slug=slug, is_published=True)
+        .annotate(
+            tags_updated_at=Max('tags__updated_at'),
+            related_updated_at=Max('related_links__related__updated_at'),
+        )
+        .values_list('updated_at', 'category__updated_at', 'tags_updated_at', 'related_updated_at')
+        .first()
+    )
+    return (latest(*row), row) if row else None
+
+
+def taxonomy_state(model):
+    def state(request, slug, **kwargs):
+        row = (
+            model.objects.filter(slug=slug)
+            .annotate(articles_updated_at=Max('articles__updated_at', filter=Q(articles__is_published=True)))
+            .values_list('updated_at', 'articles_updated_at', 'article_count')
+            .first()
+        )
+        return (latest(row[0], row[1]), row) if row else None
+    return state
+
+
+category_state = taxonomy_state(Category)
+tag_state = taxonomy_state(Tag)
+
+
+def article_list_state(request, **kwargs):
+    # One probe of the partial updated_at index, no COUNT(*). Deleted and unpublished
+    # articles leave the maximum alone; their purge of the lists group moves the ETag.
+    updated_at = Article.objects.filter(is_published=True).aggregate(updated_at=Max('updated_at'))['updated_at']
+    return updated_at, (updated_at,)
+
+
+def taxonomy_list_state(model):
+    def state(request, **kwargs):
+        row = model.objects.aggregate(updated_at=Max('updated_at'), count=Count('pk'), articles=Sum('article_count'))
+        return row['updated_at'], tuple(row.values())
+    return state
+
+
+category_list_state = taxonomy_list_state(Category)
+tag_list_state = taxonomy_list_state(Tag)
+
+
+def sitemap_state(request, **kwargs):
+    rows = [
+        # Like article_list_state: the sitemap group version covers deletions
+        Article.objects.filter(is_published=True).aggregate(updated_at=Max('updated_at')),
+        Category.objects.aggregate(updated_at=Max('updated_at'), count=Count('pk')),
+        Tag.objects.aggregate(updated_at=Max('updated_at'), count=Count('pk')),
+    ]
+    return latest(*(row['updated_at'] for row in rows)), tuple(tuple(row.values()) for row in rows)
+
+
+def conditional_page(state, *groups):
+    """
+    Send Last-Modified and an ETag, and answer 304 Not Modified before the
+    view runs. `state` is one of the validators above, run once per request.
+    The ETag also covers the language and the page cache versions of
+    `groups` (same syntax as page_cache.cache_page), which move on changes
+    that leave no timestamp, such as a tag linked to an article.
+    """
+    def validators(request, *args, **kwargs):
+        if not hasattr(request, '_page_validators'):
+            found = state(request, *args, **kwargs)
+            if found is None:
+                request._page_validators = (None, None)
+            else:
+                last_modified, values = found
+                versions = page_cache.group_versions([group.format(**kwargs) for group in groups])
+                source = repr((values, translation.get_language(), versions))
+                request._page_validators = (last_modified, f'"{hashlib.md5(source.encode()).hexdigest()}"')
+        return request._page_validators
+
+    return condition(
+        etag_func=lambda request, *args, **kwargs: validators(request, *args, **kwargs)[1],
+        last_modified_func=lambda request, *args, **kwargs: validators(request, *args, **kwargs)[0],
+    )
+
+
+def public_page(view, state, *groups):
+    """
+    A public view behind the page cache and conditional GET. The cache is
+    outermost: a miss pays the validator query, a hit answers from the
+    stored headers without touching the database.
+    """
+    return page_cache.cache_page(*groups)(conditional_page(state, *groups)(view))
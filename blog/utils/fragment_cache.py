@@ -0,0 +1,55 @@
+# blog/utils/fragment_cache.py
+import hashlib
+from django.core.cache import caches
+from django.utils import translation
+from blog.settings import FRAGMENT_CACHE_SETTINGS
+
+
+def _cache():
+    return caches[FRAGMENT_CACHE_SETTINGS['CACHE_ALIAS']]
+
+
+def _stamp(value):
+    return format(value.timestamp(), '.6f') if value else '-'
+
+
+def fragment_key(template_name, obj, language=None):
+    """
+    Key of one object's fragment: the template, the object's pk and
+    updated_at and the language. Saving the object gives it a new key, so
+    nothing is ever invalidated; stale fragments just age out. An object's
+    category (shown on article cards) is part of the version too, and so is
+    its featured image file, which image processing renames.
+    """
+    category = getattr(obj, 'category', None)
+    image = getattr(obj, 'featured_image', None)
+    parts = [
+        template_name, str(obj.pk), _stamp(obj.updated_at),
+        _stamp(category.updated_at) if category else '-',
+        image.name if image else '-',
+        language or translation.get_language() or '',
+    ]
+    return f"fragment:{hashlib.md5(':'.join(parts).encode()).hexdigest()}"
+
+
+def render_many(template_name, objects, render):
+    """
+    The fragments of `objects`, in order: all of them are looked up with one
+    get_many, render(obj) runs only for the misses, which are stored with one
+    set_many.
+    """
+    cache = _cache()
+    keys = [fragment_key(template_name, obj) for obj in objects]
+    found = cache.get_many(keys)
+
+    missing = {}
+    fragments = []
+    for key, obj in zip(keys, objects):
+        fragment = found.get(key)
+        if fragment is None:
+            fragment = missing[key] = render(obj)
+        fragments.append(fragment)
+
+    if missing:
+        cache.set_many(missing, FRAGMENT_CACHE_SETTINGS['TIMEOUT'])
+    return fragments
@@ -0,0 +1,60 @@
+# blog/utils/html_utils.py
+from html.parser import HTMLParser
+
+# Elements whose text never reaches the reader
+SKIPPED_TAGS = {'script', 'style', 'template'}
+
+
+class HTMLTextExtractor(HTMLParser):
+    """
+    Streaming HTML to plain text converter.
+
+    Text nodes are joined with single spaces as they are parsed, so tags,
+    entities and whitespace are all handled in one pass without building
+    a document tree. Output matches BeautifulSoup's
+    ``get_text(separator=' ')`` followed by whitespace collapsing.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skip_depth = 0
+        self.pending_space = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self.skip_depth += 1
+        # Every tag boundary separates text nodes
+        self.pending_space = True
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+        self.pending_space = True
+
+    def handle_data(self, data):
+        if self.skip_depth:
+            return
+
+        words = data.split()
+        if not words:
+            return
+
+        if self.parts and (self.pending_space or data[0].isspace()):
+            self.parts.append(' ')
+        self.parts.append(' '.join(words))
+        self.pending_space = data[-1].isspace()
+
+    def get_text(self):
+        return ''.join(self.parts)
+
+
+def html_to_text(html):
+    """Extract readable text from HTML with whitespace collapsed"""
+    if not html:
+        return ''
+
+    extractor = HTMLTextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.get_text()
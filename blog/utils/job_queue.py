@@ -0,0 +1,129 @@
+# blog/utils/job_queue.py
+import logging
+import os
+import socket
+import traceback
+from datetime import timedelta
+from django.db import transaction
+from django.utils import timezone
+from blog.models.job_model import Job
+from blog.settings import JOB_QUEUE_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+_tasks = {}
+
+
+def register_task(name):
+    """Decorator registering a function as a background task"""
+    def decorator(func):
+        _tasks[name] = func
+        return func
+    return decorator
+
+
+def get_task(name):
+    try:
+        return _tasks[name]
+    except KeyError:
+        raise LookupError(f"Unknown background task: {name}")
+
+
+def queue_enabled():
+    return JOB_QUEUE_SETTINGS['ENABLED']
+
+
+def enqueue(task, **payload):
+    """
+    Queue a task once the current transaction commits.
+    In eager mode the task runs in this process instead of a worker.
+    """
+    get_task(task)  # Fail early on typos
+
+    if JOB_QUEUE_SETTINGS['ALWAYS_EAGER']:
+        transaction.on_commit(lambda: get_task(task)(**payload))
+    else:
+        transaction.on_commit(lambda: _create_job(task, payload))
+
+
+def run_or_enqueue(task, **payload):
+    """Queue a task, or run it after commit in this process when the queue is disabled"""
+    if queue_enabled():
+        enqueue(task, **payload)
+    else:
+        transaction.on_commit(lambda: get_task(task)(**payload))
+
+
+def _create_job(task, payload):
+    # A job that has not started yet will see the latest data anyway
+    if Job.objects.filter(task=task, payload=payload, status=Job.STATUS_PENDING).exists():
+        return None
+    return Job.objects.create(task=task, payload=payload)
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim_next_job(worker=None):
+    """
+    Atomically claim the oldest runnable job.
+    The conditional UPDATE makes this safe with several workers on any database.
+    """
+    now = timezone.now()
+    candidates = (
+        Job.objects
+        .filter(status=Job.STATUS_PENDING, run_after__lte=now)
+        .order_by('run_after', 'pk')
+        .values_list('pk', flat=True)[:10]
+    )
+    for pk in candidates:
+        claimed = Job.objects.filter(pk=pk, status=Job.STATUS_PENDING).update(
+            status=Job.STATUS_RUNNING,
+            started_at=now,
+            finished_at=None,
+            worker=worker or worker_name(),
+        )
+        if claimed:
+            return Job.objects.get(pk=pk)
+    return None
+
+
+def run_job(job):
+    """Run a claimed job and record the outcome"""
+    attempts = job.attempts + 1
+    try:
+        get_task(job.task)(**job.payload)
+    except Exception as e:
+        logger.error(f"Job {job} failed: {e}")
+        if attempts < JOB_QUEUE_SETTINGS['MAX_ATTEMPTS']:
+            status = Job.STATUS_PENDING
+            run_after = timezone.now() + timedelta(seconds=JOB_QUEUE_SETTINGS['RETRY_DELAY'] * attempts)
+        else:
+            status = Job.STATUS_FAILED
+            run_after = job.run_after
+        Job.objects.filter(pk=job.pk).update(
+            status=status,
+            attempts=attempts,
+            last_error=traceback.format_exc(),
+            run_after=run_after,
+            finished_at=timezone.now(),
+        )
+        return False
+
+    Job.objects.filter(pk=job.pk).update(
+        status=Job.STATUS_DONE,
+        attempts=attempts,
+        last_error='',
+        finished_at=timezone.now(),
+    )
+    return True
+
+
+def requeue_stale_jobs():
+    """Put back jobs left running by a worker that died"""
+    cutoff = timezone.now() - timedelta(seconds=JOB_QUEUE_SETTINGS['STALE_AFTER'])
+    return Job.objects.filter(status=Job.STATUS_RUNNING, started_at__lt=cutoff).update(
+        status=Job.STATUS_PENDING,
+        worker='',
+    )
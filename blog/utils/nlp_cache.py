@@ -0,0 +1,86 @@
+# blog/utils/nlp_cache.py
+import hashlib
+import json
+import threading
+from django.conf import settings
+from django.core.cache import caches
+from blog.settings import NLP_CACHE_SETTINGS, SPACY_SETTINGS
+
+# Bump whenever the shape of a cached analysis changes
+ANALYSIS_VERSION = 3
+
+
+class AnalysisCache:
+    """
+    Persistent cache of spaCy analysis results.
+
+    Entries are keyed by a hash of the cleaned text, the model name and the
+    NLP settings, so unchanged content is never parsed twice. Eviction is
+    left to the cache backend (TIMEOUT / MAX_ENTRIES / CULL_FREQUENCY).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self):
+        return NLP_CACHE_SETTINGS['ENABLED']
+
+    @property
+    def cache(self):
+        alias = NLP_CACHE_SETTINGS['CACHE_ALIAS']
+        if alias not in settings.CACHES:
+            alias = 'default'
+        return caches[alias]
+
+    def make_key(self, clean_text, model_name=None, task='analysis'):
+        """Build the cache key for a cleaned text"""
+        model_name = model_name or SPACY_SETTINGS['MODEL_NAME']
+        fingerprint = json.dumps([
+            ANALYSIS_VERSION,
+            model_name,
+            task,
+            SPACY_SETTINGS.get('TASK_DISABLED_PIPES', {}).get(task, []),
+        ])
+        digest = hashlib.sha256()
+        digest.update(fingerprint.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(clean_text.encode('utf-8'))
+        return f"{NLP_CACHE_SETTINGS['KEY_PREFIX']}:{digest.hexdigest()}"
+
+    def get(self, key):
+        """Return the cached payload for a key, or None"""
+        if not self.enabled:
+            return None
+
+        payload = self.cache.get(key)
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return payload
+
+    def set(self, key, payload):
+        if self.enabled:
+            self.cache.set(key, payload, NLP_CACHE_SETTINGS['TIMEOUT'])
+
+    def stats(self):
+        """Hit and miss counters for this process"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+analysis_cache = AnalysisCache()
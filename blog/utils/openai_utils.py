@@ -1,20 +1,152 @@
 # blog/utils/article_utils.py
+import asyncio
+import hashlib
+import json
+import logging
+import random
 import openai
 from django.conf import settings
-    
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from blog.settings import OPENAI_SETTINGS
+
+logger = logging.getLogger(__name__)
+
 openai.api_key = settings.OPENAI_API_KEY
 
+SYSTEM_PROMPT = 'You are a helpful assistant for generating blog articles.'
+
+# Worth another attempt: rate limits, timeouts, dropped connections and 5xx responses
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+
+def _messages(prompt):
+    return [
+        {'role': 'system', 'content': SYSTEM_PROMPT},
+        {'role': 'user', 'content': prompt}
+    ]
+
+
+def article_prompt(title):
+    return f'Write a detailed blog article on the topic: {title}'
+
+
+def api_key():
+    """The configured API key; without one every request would fail with a 401"""
+    key = getattr(settings, 'OPENAI_API_KEY', None)
+    if not key:
+        raise ImproperlyConfigured("OPENAI_API_KEY is not set")
+    return key
+
+
+def _client_options():
+    return {
+        'api_key': api_key(),
+        'base_url': OPENAI_SETTINGS['BASE_URL'] or getattr(settings, 'OPENAI_BASE_URL', None),
+        'timeout': OPENAI_SETTINGS['TIMEOUT'],
+        # Retries are handled here, with our own backoff and logging
+        'max_retries': 0,
+    }
+
+
 def generate_article(prompt):
-    
-    response = openai.chat.completions.create(
-        model='gpt-3.5-turbo', 
-        messages=[
-            {'role': 'system', 'content': 'You are a helpful assistant for generating blog articles.'},
-            {'role': 'user', 'content': prompt}
-        ],
-        max_tokens=1500,
-        temperature=0.7
+    client = openai.OpenAI(**_client_options())
+    response = client.chat.completions.create(
+        model=OPENAI_SETTINGS['MODEL'],
+        messages=_messages(prompt),
+        max_tokens=OPENAI_SETTINGS['MAX_TOKENS'],
+        temperature=OPENAI_SETTINGS['TEMPERATURE']
     )
 
     return response
-    
\ No newline at end of file
+
+
+def prompt_key(prompt):
+    """Cache key for a prompt and the parameters that shape the response"""
+    source = json.dumps([
+        OPENAI_SETTINGS['MODEL'],
+        OPENAI_SETTINGS['MAX_TOKENS'],
+        OPENAI_SETTINGS['TEMPERATURE'],
+        SYSTEM_PROMPT,
+        prompt,
+    ])
+    return f"{OPENAI_SETTINGS['KEY_PREFIX']}:{hashlib.sha256(source.encode('utf-8')).hexdigest()}"
+
+
+def backoff_delay(attempt):
+    """Exponential backoff with full jitter, capped at BACKOFF_MAX seconds"""
+    delay = min(OPENAI_SETTINGS['BACKOFF_BASE'] * (2 ** attempt), OPENAI_SETTINGS['BACKOFF_MAX'])
+    return random.uniform(0, delay)
+
+
+async def _stream_completion(client, prompt, on_token):
+    stream = await client.chat.completions.create(
+        model=OPENAI_SETTINGS['MODEL'],
+        messages=_messages(prompt),
+        max_tokens=OPENAI_SETTINGS['MAX_TOKENS'],
+        temperature=OPENAI_SETTINGS['TEMPERATURE'],
+        stream=True,
+    )
+    parts = []
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        token = chunk.choices[0].delta.content
+        if token:
+            parts.append(token)
+            if on_token:
+                on_token(prompt, token)
+    return ''.join(parts)
+
+
+async def agenerate_article(client, prompt, semaphore, on_token=None):
+    """
+    Generate one article, streaming tokens to `on_token(prompt, token)`.
+    Cached responses are returned without a request.
+    """
+    cache = caches[OPENAI_SETTINGS['CACHE_ALIAS']]
+    key = prompt_key(prompt)
+    cached = await cache.aget(key)
+    if cached is not None:
+        return cached
+
+    attempt = 0
+    while True:
+        try:
+            async with semaphore:
+                text = await _stream_completion(client, prompt, on_token)
+            break
+        except RETRYABLE_ERRORS as e:
+            if attempt >= OPENAI_SETTINGS['MAX_RETRIES']:
+                raise
+            delay = backoff_delay(attempt)
+            attempt += 1
+            logger.warning(f"Article generation failed ({e.__class__.__name__}), retry {attempt} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    await cache.aset(key, text, OPENAI_SETTINGS['CACHE_TIMEOUT'])
+    return text
+
+
+async def agenerate_articles(prompts, concurrency=None, on_token=None):
+    """
+    Generate articles for many prompts with at most `concurrency` requests
+    in flight. Returns one entry per prompt: the text, or the exception
+    that made it fail after all retries.
+    """
+    semaphore = asyncio.Semaphore(concurrency or OPENAI_SETTINGS['CONCURRENCY'])
+    async with openai.AsyncOpenAI(**_client_options()) as client:
+        return await asyncio.gather(
+            *(agenerate_article(client, prompt, semaphore, on_token) for prompt in prompts),
+            return_exceptions=True,
+        )
+
+
+def generate_articles(prompts, concurrency=None, on_token=None):
+    """Synchronous entry point for agenerate_articles (background jobs, commands)"""
+    return asyncio.run(agenerate_articles(prompts, concurrency, on_token))
@@ -0,0 +1,210 @@
+# blog/utils/page_cache.py
+import hashlib
+import logging
+import time
+from functools import wraps
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from blog.models.article_model import Article
+from blog.models.category_model import Category
+from blog.models.tag_model import Tag
+from blog.settings import PAGE_CACHE_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+# Every list of articles or taxonomies (home, article list, category and tag lists)
+LISTS = 'lists'
+SITEMAP = 'sitemap'
+
+
+def article_group(slug):
+    return f'article:{slug}'
+
+
+def category_group(slug):
+    return f'category:{slug}'
+
+
+def tag_group(slug):
+    return f'tag:{slug}'
+
+
+def _cache():
+    return caches[PAGE_CACHE_SETTINGS['CACHE_ALIAS']]
+
+
+def _version_key(group):
+    return f'page-version:{group}'
+
+
+def _new_version():
+    return format(time.time_ns(), 'x')
+
+
+def group_versions(groups):
+    """
+    Current version token of each content group. A group without one (never
+    purged, or evicted) gets a fresh token, so a lost version can only cause
+    misses, never bring back a page cached under an older one.
+    """
+    cache = _cache()
+    keys = [_version_key(group) for group in groups]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _new_version(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def purge(*groups):
+    """
+    Retire every cached page of these content groups with one write, once the
+    surrounding transaction commits: a request served in between would cache
+    the old content under the new version, and a rollback changes nothing.
+    """
+    groups = set(groups)
+    if groups:
+        transaction.on_commit(lambda: _retire(groups))
+
+
+def _retire(groups):
+    version = _new_version()
+    _cache().set_many({_version_key(group): version for group in groups}, None)
+    logger.debug(f"Purged cached pages of {sorted(groups)}")
+
+
+def purge_article(article, previous=None):
+    """
+    An article was saved (previous: its stored state before, see
+    article_counts.stored_state) or is about to be deleted. Drafts are on
+    no public page, so only changes to or from a published article count.
+    """
+    purge(*article_groups(article, previous))
+
+
+def article_groups(article, previous=None):
+    """The content groups of the pages showing an article (see purge_article)"""
+    if not (article.is_published or (previous and previous['is_published'])):
+        return []
+    slugs = {article.slug}
+    category_ids = {article.category_id}
+    if previous:
+        slugs.add(previous['slug'])
+        category_ids.add(previous['category_id'])
+
+    groups = [article_group(slug) for slug in slugs]
+    groups += [category_group(slug) for slug in Category.objects.filter(pk__in=category_ids).values_list('slug', flat=True)]
+    groups += [tag_group(slug) for slug in article.tags.values_list('slug', flat=True)]
+    # Pages that show it among their related articles
+    listed_by = Article.objects.filter(related_links__related=article).values_list('slug', flat=True)
+    groups += [article_group(slug) for slug in listed_by]
+    return [LISTS, SITEMAP, *groups]
+
+
+def purge_tag_links(article_ids, tag_ids):
+    """Tags were linked to or unlinked from articles"""
+    articles = list(Article.objects.filter(pk__in=article_ids, is_published=True).values_list('slug', flat=True))
+    if not articles:
+        return
+    tags = Tag.objects.filter(pk__in=tag_ids).values_list('slug', flat=True)
+    # The tag lists show per-tag counts
+    purge(LISTS, *[article_group(slug) for slug in articles], *[tag_group(slug) for slug in tags])
+
+
+def purge_taxonomy(instance, old_slug=None):
+    """
+    A category or tag was saved or is about to be deleted: its own pages, the
+    lists, the sitemap and the published articles that show its name.
+    """
+    purge(*taxonomy_groups(instance, old_slug))
+
+
+def taxonomy_groups(instance, old_slug=None):
+    """The content groups of the pages showing a category or tag (see purge_taxonomy)"""
+    group = category_group if isinstance(instance, Category) else tag_group
+    slugs = {instance.slug, old_slug} - {None}
+    articles = instance.articles.filter(is_published=True).values_list('slug', flat=True)
+    return [LISTS, SITEMAP, *[group(slug) for slug in slugs], *[article_group(slug) for slug in articles]]
+
+
+def update_derived(model, pks, **fields):
+    """
+    Write fields that are derived outside save() (generated summaries, a
+    processed image, a new related-articles list) with one queryset update,
+    then retire what showed the old values: updated_at moves, so
+    Last-Modified, ETags and cached article cards change, and the pages of
+    these articles, categories or tags are purged as after a save. With no
+    fields, only updated_at moves.
+    """
+    pks = list(pks)
+    if not pks:
+        return
+    model.objects.filter(pk__in=pks).update(updated_at=timezone.now(), **fields)
+    purge_rows(model, pks)
+
+
+def purge_rows(model, pks):
+    """
+    Purge the pages of these articles, categories or tags after a write that
+    sent no signals (see update_derived; bulk_update callers move updated_at
+    themselves).
+    """
+    if model is Article:
+        groups = [group for article in Article.objects.filter(pk__in=pks) for group in article_groups(article)]
+    else:
+        groups = [group for instance in model.objects.filter(pk__in=pks) for group in taxonomy_groups(instance)]
+    purge(*groups)
+
+
+def page_key(request, groups):
+    """Cache key of a page: its full path, the active language and its groups' versions"""
+    versions = group_versions(groups)
+    source = '\n'.join([request.get_full_path(), getattr(request, 'LANGUAGE_CODE', ''), *versions])
+    return f"page:{hashlib.md5(source.encode()).hexdigest()}"
+
+
+def cacheable(request):
+    return (
+        PAGE_CACHE_SETTINGS['ENABLED']
+        and request.method in ('GET', 'HEAD')
+        and not (hasattr(request, 'user') and request.user.is_authenticated)
+    )
+
+
+def cache_page(*groups):
+    """
+    Serve the view from the page cache. `groups` name the content the page
+    shows and may use the URL's keyword arguments, e.g. 'article:{slug}';
+    purging any of them retires the page (see blog/signals.py).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            if not cacheable(request):
+                return view(request, *args, **kwargs)
+
+            key = page_key(request, [group.format(**kwargs) for group in groups])
+            response = _cache().get(key)
+            if response is not None:
+                # Validators saved with the page (see blog/utils/conditional.py) still answer 304s
+                return get_conditional_response(
+                    request,
+                    etag=response.get('ETag'),
+                    last_modified=parse_http_date_safe(response.get('Last-Modified')),
+                    response=response,
+                )
+
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming and not response.cookies:
+                store = lambda r: _cache().set(key, r, PAGE_CACHE_SETTINGS['TIMEOUT'])
+                if hasattr(response, 'render') and callable(response.render):
+                    response.add_post_render_callback(store)
+                else:
+                    store(response)
+            return response
+        return wrapped
+    return decorator
@@ -0,0 +1,227 @@
+# blog/utils/pagination.py
+import base64
+import json
+from collections.abc import Sequence
+from django.core.exceptions import ValidationError
+from django.core.paginator import EmptyPage, InvalidPage, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from blog.settings import PAGINATION_SETTINGS
+
+
+def estimated_count(queryset):
+    """
+    A cheap estimate of queryset.count(), or None when there is no trustworthy
+    one: only whole tables are estimated, from the statistics the engine keeps
+    (PostgreSQL's reltuples, SQLite's sqlite_stat1 after ANALYZE). Planner
+    estimates for filters and full-text predicates are too far off to page by.
+    """
+    connection = connections[queryset.db]
+    if queryset.query.where or queryset.query.combinator:
+        return None
+    table = queryset.model._meta.db_table
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", [table])
+            row = cursor.fetchone()
+        # -1 until the table has been analyzed
+        return int(row[0]) if row and row[0] >= 0 else None
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            # No sqlite_stat1 until the database is first analyzed
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                return None
+            # The first number of each row is the table's row count
+            cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [table])
+            row = cursor.fetchone()
+        return int(row[0].split()[0]) if row else None
+    return None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that trusts the engine's estimate on big tables, so a page
+    costs one LIMIT query rather than a COUNT(*) over the whole table.
+    Small or unestimable querysets are counted exactly.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = estimated_count(self.object_list) if hasattr(self.object_list, 'query') else None
+        if estimate is None or estimate < PAGINATION_SETTINGS['ESTIMATE_COUNT_ABOVE']:
+            return super().count
+        return estimate
+
+
+class StoredCountPaginator(Paginator):
+    """
+    Paginator whose total is a stored counter (such as a tag's article_count)
+    instead of a COUNT(*). Each page reads a few rows past its end to check
+    the counter; a page that disagrees with it, or a number past its end,
+    falls back to an exact count, so a drifted counter never hides articles
+    or serves an empty page.
+    """
+
+    def __init__(self, object_list, per_page, stored_count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count = max(int(stored_count or 0), 0)
+        self.exact = False
+
+    def recount(self):
+        """Forget the stored counter and count the rows"""
+        del self.count
+        self.__dict__.pop('num_pages', None)
+        self.exact = True
+
+    def page(self, number):
+        if self.exact:
+            return super().page(number)
+        try:
+            number = self.validate_number(number)
+        except EmptyPage:
+            self.recount()
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        probe = self.per_page + self.orphans + 1
+        rows = list(self.object_list[bottom:bottom + probe])
+        if len(rows) != min(self.count - bottom, probe):
+            self.recount()
+            return super().page(number)
+        return self._get_page(rows[:top - bottom], number, self)
+
+
+class InvalidCursor(InvalidPage):
+    """A cursor that was not made by encode_cursor for this ordering"""
+
+
+def encode_cursor(values):
+    """Opaque, URL-safe cursor for a row's ordering key"""
+    values = [value.isoformat() if hasattr(value, 'isoformat') else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(',', ':')).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, fields):
+    """The ordering key in a cursor, converted back with each model field"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(fields):
+            raise ValueError(cursor)
+        return [field.to_python(value) for field, value in zip(fields, values)]
+    except (ValueError, TypeError, ValidationError):
+        raise InvalidCursor(_('That page cursor is not valid.'))
+
+
+class KeysetPage(Sequence):
+    """
+    One page of a KeysetPaginator. There are no page numbers: the cursors
+    of the first and last rows lead to the neighbouring pages.
+    """
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return f'<Keyset page of {len(self)}>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    def cursor(self, obj):
+        return self.paginator.cursor(obj)
+
+    @property
+    def next_cursor(self):
+        return self.cursor(self.object_list[-1]) if self._has_next else None
+
+    @property
+    def previous_cursor(self):
+        return self.cursor(self.object_list[0]) if self._has_previous else None
+
+
+class KeysetPaginator:
+    """
+    Seek pagination over a unique ordering such as (created_at, id): each
+    page is an indexed range read of per_page + 1 rows after (or before) a
+    cursor, so deep pages cost the same as the first and nothing is counted.
+
+    The first page after a cursor reports a previous page without checking;
+    only the direction being read is probed with the extra row.
+    """
+
+    def __init__(self, object_list, per_page, ordering=('-created_at', '-id')):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        opts = object_list.model._meta
+        self.keys = [(name.lstrip('-'), name.startswith('-')) for name in self.ordering]
+        self.fields = [opts.get_field(name) for name, _ in self.keys]
+
+    def cursor(self, obj):
+        return encode_cursor([getattr(obj, field.attname) for field in self.fields])
+
+    def _seek(self, values, forward):
+        """Rows strictly after (forward) or before the key `values` in the ordering"""
+        seek = Q()
+        for index, (name, descending) in enumerate(self.keys):
+            lookup = 'lt' if descending == forward else 'gt'
+            equal = {key: value for (key, _), value in zip(self.keys[:index], values[:index])}
+            seek |= Q(**equal, **{f'{name}__{lookup}': values[index]})
+        # Bound the leading column too so the engine can range-scan its index
+        name, descending = self.keys[0]
+        bound = Q(**{f"{name}__{'lte' if descending == forward else 'gte'}": values[0]})
+        return bound & seek
+
+    def page(self, after=None, before=None, size=None, backward=None):
+        """
+        Up to `size` (default per_page) rows after the `after` cursor, or,
+        reading backwards, the rows just before `before`. backward=True
+        without a cursor returns the last rows.
+        """
+        size = self.per_page if size is None else int(size)
+        if size < 1:
+            raise InvalidPage(_('The page size must be at least 1.'))
+        if backward is None:
+            backward = before is not None
+
+        queryset = self.object_list
+        if after:
+            queryset = queryset.filter(self._seek(decode_cursor(after, self.fields), forward=True))
+        if before:
+            queryset = queryset.filter(self._seek(decode_cursor(before, self.fields), forward=False))
+
+        if backward:
+            reverse = [name[1:] if name.startswith('-') else f'-{name}' for name in self.ordering]
+            rows = list(queryset.order_by(*reverse)[:size + 1])
+            more = len(rows) > size
+            return KeysetPage(rows[:size][::-1], self, has_next=bool(before), has_previous=more)
+
+        rows = list(queryset.order_by(*self.ordering)[:size + 1])
+        more = len(rows) > size
+        return KeysetPage(rows[:size], self, has_next=more, has_previous=bool(after))
+
+    @cached_property
+    def approximate_count(self):
+        """The engine's estimate of the total (see estimated_count), or None"""
+        return estimated_count(self.object_list)
@@ -0,0 +1,273 @@
+# blog/utils/related_articles.py
+import numpy as np
+from django.db import transaction
+from django.db.models import Count, Min
+from blog.models.article_model import Article
+from blog.models.related_article_model import RelatedArticle
+from blog.models.term_stats_model import ArticleTerm, ArticleTermStats
+from blog.settings import RELATED_ARTICLES_SETTINGS
+from blog.utils import page_cache
+from blog.utils.term_stats import idf_weights, smoothed_idf
+
+
+def _compressed_rows(rows, cols, weights, size):
+    """Sort coordinate triples by row and return (cols, weights, row offsets)"""
+    order = np.argsort(rows, kind='stable')
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=size), out=offsets[1:])
+    return rows[order], cols[order], weights[order], offsets
+
+
+class RelatedArticlesIndex:
+    """
+    Every article as NumPy arrays: category, tag memberships and tf-idf
+    term weights (row-compressed, so one article's vector is a slice).
+    Scoring an article against the whole corpus is a handful of bincounts.
+    """
+
+    def __init__(self, articles, tag_pairs, term_rows, idf=None):
+        # articles: (pk, category_id, is_published); tag_pairs: (article_id, tag_id);
+        # term_rows: (article_id, {term: count}); idf: terms -> weights, when the
+        # rows are only part of the corpus
+        articles = list(articles)
+        self.pks = np.array([pk for pk, _, _ in articles], dtype=np.int64)
+        self.positions = {pk: position for position, pk in enumerate(self.pks.tolist())}
+        self.categories = np.array([category or -1 for _, category, _ in articles], dtype=np.int64)
+        self.published = np.array([published for _, _, published in articles], dtype=bool)
+        size = len(articles)
+
+        # Tags: membership pairs, tag ids mapped to 0..T-1
+        tag_pairs = [(self.positions[a], t) for a, t in tag_pairs if a in self.positions]
+        tag_rows = np.array([row for row, _ in tag_pairs], dtype=np.int64)
+        tag_ids = np.array([tag for _, tag in tag_pairs], dtype=np.int64)
+        self.tag_count = len(np.unique(tag_ids))
+        tag_cols = np.unique(tag_ids, return_inverse=True)[1].astype(np.int64)
+        self.tag_rows, self.tag_cols, _, self.tag_offsets = _compressed_rows(
+            tag_rows, tag_cols, np.ones(len(tag_rows)), size
+        )
+        self.tags_per_article = np.diff(self.tag_offsets).astype(np.float64)
+
+        # Content: tf * idf, with document frequencies taken from these rows unless given
+        vocabulary = {}
+        rows, cols, counts = [], [], []
+        for article_id, terms in term_rows:
+            position = self.positions.get(article_id)
+            if position is None:
+                continue
+            for term, count in terms.items():
+                rows.append(position)
+                cols.append(vocabulary.setdefault(term, len(vocabulary)))
+                counts.append(count)
+        self.vocabulary_size = len(vocabulary)
+        rows = np.array(rows, dtype=np.int64)
+        cols = np.array(cols, dtype=np.int64)
+        if idf is None:
+            idf = smoothed_idf(np.bincount(cols, minlength=self.vocabulary_size), len(np.unique(rows)))
+        else:
+            idf = np.asarray(idf(list(vocabulary)), dtype=np.float64).reshape(self.vocabulary_size)
+        weights = np.array(counts, dtype=np.float64) * idf[cols]
+        self.term_rows, self.term_cols, self.term_weights, self.term_offsets = _compressed_rows(
+            rows, cols, weights, size
+        )
+        self.norms = np.sqrt(np.bincount(self.term_rows, weights=self.term_weights ** 2, minlength=size))
+
+    @classmethod
+    def load(cls, article_ids=None):
+        """
+        Read the corpus in three queries, or only the given articles. A part
+        of the corpus is weighted with the stored document frequencies.
+        """
+        if article_ids is None:
+            return cls(
+                Article.objects.order_by('pk').values_list('pk', 'category_id', 'is_published'),
+                Article.tags.through.objects.values_list('article_id', 'tag_id'),
+                ArticleTermStats.objects.values_list('article_id', 'terms'),
+            )
+        article_ids = sorted(article_ids)
+        return cls(
+            Article.objects.filter(pk__in=article_ids).order_by('pk').values_list('pk', 'category_id', 'is_published'),
+            Article.tags.through.objects.filter(article_id__in=article_ids).values_list('article_id', 'tag_id'),
+            ArticleTermStats.objects.filter(article_id__in=article_ids).values_list('article_id', 'terms'),
+            idf=idf_weights,
+        )
+
+    @classmethod
+    def load_around(cls, pks):
+        """The given articles and every article that can score above zero against them"""
+        return cls.load(candidate_articles(pks))
+
+    def __len__(self):
+        return len(self.pks)
+
+    def __contains__(self, pk):
+        return pk in self.positions
+
+    def scores(self, pk):
+        """Similarity of every article to `pk` (symmetric, the article itself is -inf)"""
+        position = self.positions[pk]
+        size = len(self)
+        settings = RELATED_ARTICLES_SETTINGS
+
+        # Jaccard overlap of tag sets
+        start, end = self.tag_offsets[position], self.tag_offsets[position + 1]
+        target_tags = np.zeros(self.tag_count)
+        target_tags[self.tag_cols[start:end]] = 1.0
+        shared = np.bincount(self.tag_rows, weights=target_tags[self.tag_cols], minlength=size)
+        union = self.tags_per_article + self.tags_per_article[position] - shared
+        tags = np.divide(shared, union, out=np.zeros(size), where=union > 0)
+
+        # Cosine similarity of tf-idf vectors
+        start, end = self.term_offsets[position], self.term_offsets[position + 1]
+        target_terms = np.zeros(self.vocabulary_size)
+        target_terms[self.term_cols[start:end]] = self.term_weights[start:end]
+        dots = np.bincount(self.term_rows, weights=self.term_weights * target_terms[self.term_cols], minlength=size)
+        norms = self.norms * self.norms[position]
+        content = np.divide(dots, norms, out=np.zeros(size), where=norms > 0)
+
+        category = self.categories[position]
+        same_category = (self.categories == category) & (category >= 0)
+
+        scores = (
+            settings['TAG_WEIGHT'] * tags
+            + settings['CATEGORY_WEIGHT'] * same_category
+            + settings['CONTENT_WEIGHT'] * content
+        )
+        scores[position] = -np.inf
+        return scores
+
+    def neighbours(self, pk, scores=None):
+        """Top published neighbours of `pk` as [(pk, score)], best first, ties by lower pk"""
+        if scores is None:
+            scores = self.scores(pk)
+        candidates = np.flatnonzero(self.published & (scores >= RELATED_ARTICLES_SETTINGS['MIN_SCORE']))
+        ranked = candidates[np.lexsort((self.pks[candidates], -scores[candidates]))]
+        ranked = ranked[:RELATED_ARTICLES_SETTINGS['COUNT']]
+        return [(int(self.pks[i]), float(scores[i])) for i in ranked]
+
+
+def candidate_articles(pks):
+    """
+    Ids of `pks` and of the articles most likely to score against them:
+    those sharing the most tags, those sharing the most terms and the newest
+    of their categories, at most MAX_CANDIDATES from each (one indexed query
+    apiece). Anything else scores zero, or no more than a shared category,
+    so a big category or a common term never loads a big slice of the
+    corpus. None (the whole corpus) when MIN_SCORE lets zero scores through.
+    """
+    if RELATED_ARTICLES_SETTINGS['MIN_SCORE'] <= 0:
+        return None
+    pks = list(pks)
+    limit = RELATED_ARTICLES_SETTINGS['MAX_CANDIDATES']
+    through = Article.tags.through
+    shared_tag = (
+        through.objects.filter(tag_id__in=through.objects.filter(article_id__in=pks).values('tag_id'))
+        .values('article_id').annotate(shared=Count('pk')).order_by('-shared', 'article_id')
+        .values_list('article_id', flat=True)[:limit]
+    )
+    shared_term = (
+        ArticleTerm.objects.filter(term__in=ArticleTerm.objects.filter(article_id__in=pks).values('term'))
+        .values('article_id').annotate(shared=Count('pk')).order_by('-shared', 'article_id')
+        .values_list('article_id', flat=True)[:limit]
+    )
+    same_category = (
+        Article.objects.filter(
+            category_id__in=Article.objects.filter(pk__in=pks, category__isnull=False).values('category_id')
+        )
+        .order_by('-created_at', '-id').values_list('pk', flat=True)[:limit]
+    )
+    return set(pks) | set(shared_tag) | set(shared_term) | set(same_category)
+
+
+def _store(neighbours_by_article):
+    """
+    Replace the stored neighbours of the given articles. Scores are always
+    rewritten; the articles whose list of neighbours changed are touched
+    and their pages purged (see page_cache.update_derived).
+    """
+    stored = {}
+    rows = (
+        RelatedArticle.objects.filter(article_id__in=list(neighbours_by_article))
+        .order_by('article_id', 'rank').values_list('article_id', 'related_id')
+    )
+    for article_id, related_id in rows:
+        stored.setdefault(article_id, []).append(related_id)
+    changed = [
+        article_id for article_id, neighbours in neighbours_by_article.items()
+        if stored.get(article_id, []) != [related_id for related_id, _ in neighbours]
+    ]
+
+    with transaction.atomic():
+        RelatedArticle.objects.filter(article_id__in=list(neighbours_by_article)).delete()
+        RelatedArticle.objects.bulk_create([
+            RelatedArticle(article_id=article_id, related_id=related_id, rank=rank, score=score)
+            for article_id, neighbours in neighbours_by_article.items()
+            for rank, (related_id, score) in enumerate(neighbours, start=1)
+        ])
+        page_cache.update_derived(Article, changed)
+
+
+def recompute_related_articles(article_ids, index=None):
+    """Recompute the neighbour lists of exactly these articles"""
+    index = index or RelatedArticlesIndex.load_around(article_ids)
+    _store({pk: index.neighbours(pk) if pk in index else [] for pk in article_ids})
+
+
+def affected_articles(index, pk, scores):
+    """
+    Articles whose stored lists can change when `pk` changes: those that list
+    it now, and those it would now enter (scores are symmetric).
+    """
+    affected = set(RelatedArticle.objects.filter(related_id=pk).values_list('article_id', flat=True))
+    if not index.published[index.positions[pk]]:
+        return affected
+
+    candidates = [int(index.pks[i]) for i in np.flatnonzero(scores >= RELATED_ARTICLES_SETTINGS['MIN_SCORE'])]
+    stored = {
+        row['article_id']: (row['count'], row['lowest'])
+        for row in (
+            RelatedArticle.objects.filter(article_id__in=candidates)
+            .values('article_id').annotate(count=Count('pk'), lowest=Min('score'))
+        )
+    }
+    for candidate in candidates:
+        count, lowest = stored.get(candidate, (0, None))
+        score = scores[index.positions[candidate]]
+        if count < RELATED_ARTICLES_SETTINGS['COUNT'] or score > lowest:
+            affected.add(candidate)
+    return affected
+
+
+def refresh_related_articles(pks):
+    """
+    Recompute the neighbours of the changed articles and of the articles they
+    affect. Only their candidate neighbours are read (see candidate_articles),
+    and unaffected lists keep their older idf weighting until
+    `rebuild_related_articles`.
+    """
+    index = RelatedArticlesIndex.load_around(pks)
+    pks = [pk for pk in pks if pk in index]
+    if not pks:
+        return
+
+    neighbours = {}
+    affected = set()
+    for pk in pks:
+        scores = index.scores(pk)
+        neighbours[pk] = index.neighbours(pk, scores)
+        affected |= affected_articles(index, pk, scores)
+
+    affected -= set(pks)
+    if affected:
+        # Scored against their own candidates, which reach beyond the changed articles'
+        around = RelatedArticlesIndex.load_around(affected)
+        neighbours.update({pk: around.neighbours(pk) if pk in around else [] for pk in affected})
+    _store(neighbours)
+
+
+def rebuild_related_articles():
+    """Recompute every article's neighbours; returns the number of articles"""
+    index = RelatedArticlesIndex.load()
+    with transaction.atomic():
+        RelatedArticle.objects.all().delete()
+        _store({int(pk): index.neighbours(int(pk)) for pk in index.pks})
+    return len(index)
@@ -0,0 +1,247 @@
+# blog/utils/search_backends.py
+import logging
+from django.db import connection
+from django.db.models import Count
+from django.db.models.expressions import RawSQL
+from blog.models.search_index_model import SearchDocument, SearchPosting, SearchTerm
+from blog.settings import SEARCH_SETTINGS
+from blog.utils import search_index
+from blog.utils.html_utils import html_to_text
+from blog.utils.search_index import SearchResults, tokenize
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_TABLE = 'blog_article'
+# Created by migration 0009 when the database engine supports them
+FTS5_TABLE = 'blog_article_fts'
+POSTGRES_TABLE = 'blog_article_search'
+
+
+class SearchBackend:
+    """
+    Keeps one full-text index of the articles in step with the database and
+    ranks queries against it. Every backend returns SearchResults whose hits
+    are (article_id, score) pairs, higher scores first.
+    """
+    name = None
+
+    def is_available(self):
+        return True
+
+    def index(self, article):
+        raise NotImplementedError
+
+    def remove(self, article_id):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def search(self, query, page=1, per_page=None, published_only=True):
+        raise NotImplementedError
+
+    def filter(self, queryset, query):
+        """
+        Narrow an Article queryset to the articles containing every word of
+        the query (like the admin's own search) with a subquery on the index,
+        leaving ordering, filters and pagination to the caller.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return queryset.none()
+        return queryset.filter(pk__in=self.matching_ids(tokens))
+
+    def matching_ids(self, tokens):
+        """Subquery of the ids of the articles containing all the tokens"""
+        raise NotImplementedError
+
+
+class InvertedIndexBackend(SearchBackend):
+    """The portable BM25 index in blog/utils/search_index.py"""
+    name = 'inverted'
+
+    def index(self, article):
+        search_index.index_article(article)
+
+    def remove(self, article_id):
+        search_index.remove_article(article_id)
+
+    def clear(self):
+        SearchDocument.objects.all().delete()
+        SearchTerm.objects.all().delete()
+        search_index.reset_index_stats()
+
+    def search(self, query, page=1, per_page=None, published_only=True):
+        return search_index.search(query, page, per_page, published_only)
+
+    def matching_ids(self, tokens):
+        # One posting per (term, document): documents with a posting for each token
+        return (
+            SearchPosting.objects.filter(term__term__in=tokens)
+            .values('document_id')
+            .annotate(matched=Count('pk'))
+            .filter(matched=len(tokens))
+            .values('document_id')
+        )
+
+
+class NativeBackend(SearchBackend):
+    """Shared plumbing for engine-native indexes kept in a side table"""
+    vendor = None
+    table = None
+
+    def __init__(self):
+        self._available = None
+
+    def is_available(self):
+        if self._available is None:
+            self._available = (
+                connection.vendor == self.vendor
+                and self.table in connection.introspection.table_names(include_views=False)
+            )
+        return self._available
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+
+    def match_sql(self, tokens, match_all=False):
+        """
+        (SELECT with article_id and score columns, params) over the rows
+        matching any of the tokens, or all of them
+        """
+        raise NotImplementedError
+
+    def matching_ids(self, tokens):
+        select, params = self.match_sql(tokens, match_all=True)
+        return RawSQL(f"SELECT article_id FROM ({select}) AS matches", params)
+
+    def search(self, query, page=1, per_page=None, published_only=True):
+        per_page = per_page or SEARCH_SETTINGS['RESULTS_PER_PAGE']
+        page = max(int(page), 1)
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return SearchResults(query, [], 0, page, per_page)
+
+        select, params = self.match_sql(tokens)
+        published = f" WHERE {ARTICLE_TABLE}.is_published" if published_only else ""
+        matches = f"FROM ({select}) AS matches JOIN {ARTICLE_TABLE} ON {ARTICLE_TABLE}.id = matches.article_id{published}"
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT matches.article_id, matches.score, COUNT(*) OVER () {matches} "
+                f"ORDER BY matches.score DESC, matches.article_id DESC LIMIT %s OFFSET %s",
+                params + [per_page, (page - 1) * per_page],
+            )
+            rows = cursor.fetchall()
+            if rows:
+                total = rows[0][2]
+            else:
+                # Past the last page the window count comes back empty, so count separately
+                cursor.execute(f"SELECT COUNT(*) {matches}", params)
+                total = cursor.fetchone()[0]
+
+        hits = [(int(article_id), float(score)) for article_id, score, _ in rows]
+        return SearchResults(query, hits, total, page, per_page)
+
+
+class SQLiteFTS5Backend(NativeBackend):
+    """An FTS5 virtual table keyed by article id, ranked with FTS5's bm25()"""
+    name = 'fts5'
+    vendor = 'sqlite'
+    table = FTS5_TABLE
+
+    def index(self, article):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [article.pk])
+            cursor.execute(
+                f"INSERT INTO {self.table} (rowid, title, content) VALUES (%s, %s, %s)",
+                [article.pk, article.title or '', html_to_text(article.content or '')],
+            )
+
+    def remove(self, article_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [article_id])
+
+    def match_sql(self, tokens, match_all=False):
+        # Quoted tokens are plain strings to FTS5; OR matches any of them, like the BM25 index
+        expression = (' AND ' if match_all else ' OR ').join(f'"{token}"' for token in tokens)
+        # bm25() is lower-is-better; column weights: title, content
+        select = (
+            f"SELECT rowid AS article_id, -bm25({self.table}, %s, 1.0) AS score "
+            f"FROM {self.table} WHERE {self.table} MATCH %s"
+        )
+        return select, [float(SEARCH_SETTINGS['TITLE_WEIGHT']), expression]
+
+
+class PostgresBackend(NativeBackend):
+    """
+    A tsvector side table with a GIN index. The title is weighted 'A' and
+    the body 'B', each parsed with the text search configuration of the
+    article's language.
+    """
+    name = 'postgres'
+    vendor = 'postgresql'
+    table = POSTGRES_TABLE
+
+    def configs(self):
+        return sorted(set(SEARCH_SETTINGS['POSTGRES_CONFIGS'].values()) | {'simple'})
+
+    def index(self, article):
+        config = SEARCH_SETTINGS['POSTGRES_CONFIGS'].get(article.language, 'simple')
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {self.table} (article_id, document) VALUES ("
+                f"%s, setweight(to_tsvector(%s::regconfig, %s), 'A') || setweight(to_tsvector(%s::regconfig, %s), 'B')"
+                f") ON CONFLICT (article_id) DO UPDATE SET document = EXCLUDED.document",
+                [article.pk, config, article.title or '', config, html_to_text(article.content or '')],
+            )
+
+    def remove(self, article_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE article_id = %s", [article_id])
+
+    def match_sql(self, tokens, match_all=False):
+        # Tokens are \w+ only, so they are safe to_tsquery operands. One query per
+        # configuration, OR-ed together, keeps it constant and the GIN index usable.
+        configs = self.configs()
+        tsquery = ' || '.join(['to_tsquery(%s::regconfig, %s)'] * len(configs))
+        terms = (' & ' if match_all else ' | ').join(tokens)
+        query_params = [value for config in configs for value in (config, terms)]
+        params = [1.0 / SEARCH_SETTINGS['TITLE_WEIGHT']] + query_params + query_params
+        select = (
+            f"SELECT article_id, ts_rank_cd(ARRAY[0.1, 0.2, %s, 1.0]::float4[], document, ({tsquery})) AS score "
+            f"FROM {self.table} WHERE document @@ ({tsquery})"
+        )
+        return select, params
+
+
+BACKENDS = {backend.name: backend for backend in (SQLiteFTS5Backend(), PostgresBackend(), InvertedIndexBackend())}
+
+
+def get_search_backend():
+    """
+    The configured backend. 'auto' picks the database's native index when
+    migration 0009 created it and falls back to the BM25 inverted index.
+    """
+    name = SEARCH_SETTINGS['BACKEND']
+    if name != 'auto':
+        backend = BACKENDS[name]
+        if backend.is_available():
+            return backend
+        logger.warning(f"Search backend {name!r} is not available here, using the inverted index")
+        return BACKENDS['inverted']
+
+    for backend in BACKENDS.values():
+        if backend.is_available():
+            return backend
+
+
+def maintained_backends():
+    """
+    Every index kept in step with the articles: the active backend, plus the
+    BM25 inverted index, which stays current so that BACKEND can be switched
+    to it, or 'auto' fall back to it, without serving stale results.
+    """
+    active = get_search_backend()
+    inverted = BACKENDS['inverted']
+    return [active] if active is inverted else [active, inverted]
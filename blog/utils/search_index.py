@@ -0,0 +1,206 @@
+# blog/utils/search_index.py
+import math
+import re
+from collections import Counter
+import numpy as np
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.db.models import Avg, Count, F
+from blog.models.search_index_model import SearchDocument, SearchPosting, SearchTerm
+from blog.settings import SEARCH_SETTINGS
+from blog.utils.html_utils import html_to_text
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+MAX_TERM_LENGTH = 100
+STATS_CACHE_KEY = 'search-index-stats'
+
+
+def tokenize(text):
+    """Lowercased word tokens of plain text; single characters are dropped"""
+    return [
+        token for token in TOKEN_RE.findall(text.lower())
+        if 1 < len(token) <= MAX_TERM_LENGTH
+    ]
+
+
+def document_terms(article):
+    """Term frequencies of an article; title tokens count TITLE_WEIGHT times"""
+    terms = Counter(tokenize(html_to_text(article.content or '')))
+    for token in tokenize(article.title or ''):
+        terms[token] += SEARCH_SETTINGS['TITLE_WEIGHT']
+    return terms
+
+
+def _term_ids(terms):
+    """Ids of the given terms, creating missing SearchTerm rows"""
+    SearchTerm.objects.bulk_create([SearchTerm(term=term) for term in terms], ignore_conflicts=True)
+    return dict(SearchTerm.objects.filter(term__in=terms).values_list('term', 'pk'))
+
+
+def _stats_cache():
+    return caches[SEARCH_SETTINGS['CACHE_ALIAS']]
+
+
+def reset_index_stats():
+    """Forget the cached corpus statistics (after writing the index tables directly)"""
+    _stats_cache().delete(STATS_CACHE_KEY)
+
+
+def index_article(article):
+    """
+    Bring an article's postings up to date: only terms that appeared,
+    disappeared or changed frequency are written.
+    """
+    terms = document_terms(article)
+
+    with transaction.atomic():
+        document, _ = SearchDocument.objects.get_or_create(article_id=article.pk)
+        current = {
+            term: (posting_id, frequency)
+            for posting_id, term, frequency in document.postings.values_list('pk', 'term__term', 'frequency')
+        }
+
+        added = sorted(set(terms) - set(current))
+        removed = sorted(set(current) - set(terms))
+        changed = [term for term in terms if term in current and current[term][1] != terms[term]]
+
+        if removed:
+            SearchPosting.objects.filter(pk__in=[current[term][0] for term in removed]).delete()
+            SearchTerm.objects.filter(term__in=removed).update(document_count=F('document_count') - 1)
+        if added:
+            term_ids = _term_ids(added)
+            SearchPosting.objects.bulk_create([
+                SearchPosting(term_id=term_ids[term], document=document, frequency=terms[term]) for term in added
+            ])
+            SearchTerm.objects.filter(pk__in=term_ids.values()).update(document_count=F('document_count') + 1)
+        if changed:
+            SearchPosting.objects.bulk_update(
+                [SearchPosting(pk=current[term][0], frequency=terms[term]) for term in changed],
+                ['frequency'],
+            )
+
+        document.length = sum(terms.values())
+        document.save(update_fields=['length', 'updated_at'])
+
+    reset_index_stats()
+    return document
+
+
+def remove_article(article_id):
+    """Drop an article's postings and release its terms"""
+    with transaction.atomic():
+        term_ids = list(SearchPosting.objects.filter(document_id=article_id).values_list('term_id', flat=True))
+        SearchTerm.objects.filter(pk__in=term_ids).update(document_count=F('document_count') - 1)
+        SearchDocument.objects.filter(pk=article_id).delete()
+    reset_index_stats()
+
+
+def index_stats():
+    """(number of documents, average length), cached until the index changes"""
+    stats = _stats_cache().get(STATS_CACHE_KEY)
+    if stats is None:
+        row = SearchDocument.objects.aggregate(count=Count('pk'), average=Avg('length'))
+        stats = (row['count'], float(row['average'] or 0.0))
+        _stats_cache().set(STATS_CACHE_KEY, stats, SEARCH_SETTINGS['STATS_TIMEOUT'])
+    return stats
+
+
+def bm25_idf(document_counts, total):
+    """Okapi BM25 idf, always positive"""
+    document_counts = np.asarray(document_counts, dtype=np.float64)
+    return np.log(1.0 + (total - document_counts + 0.5) / (document_counts + 0.5))
+
+
+class SearchResults:
+    """One page of ranked article ids plus the total number of matches"""
+
+    def __init__(self, query, hits, total, page, per_page):
+        self.query = query
+        # [(article_id, score)], best first
+        self.hits = hits
+        self.total = total
+        self.page = page
+        self.per_page = per_page
+
+    @property
+    def article_ids(self):
+        return [article_id for article_id, _ in self.hits]
+
+    @property
+    def num_pages(self):
+        return max(math.ceil(self.total / self.per_page), 1)
+
+    @property
+    def has_next(self):
+        return self.page < self.num_pages
+
+    @property
+    def has_previous(self):
+        return self.page > 1
+
+    @property
+    def next_page_number(self):
+        return self.page + 1
+
+    @property
+    def previous_page_number(self):
+        return self.page - 1
+
+    def __len__(self):
+        return len(self.hits)
+
+    def __iter__(self):
+        return iter(self.hits)
+
+
+def search(query, page=1, per_page=None, published_only=True):
+    """
+    BM25-ranked article ids for a free-text query.
+
+    Terms found in more than MAX_DOCUMENT_RATIO of the documents add almost
+    nothing to the ranking but dominate the postings read, so they are
+    skipped whenever the query has rarer terms.
+    """
+    per_page = per_page or SEARCH_SETTINGS['RESULTS_PER_PAGE']
+    page = max(int(page), 1)
+    tokens = list(dict.fromkeys(tokenize(query)))
+    empty = SearchResults(query, [], 0, page, per_page)
+    if not tokens:
+        return empty
+
+    terms = list(SearchTerm.objects.filter(term__in=tokens, document_count__gt=0).values_list('pk', 'document_count'))
+    if not terms:
+        return empty
+
+    total, average_length = index_stats()
+    rare = [(pk, count) for pk, count in terms if count <= SEARCH_SETTINGS['MAX_DOCUMENT_RATIO'] * total]
+    terms = rare or terms
+    terms.sort()
+    term_ids = np.array([pk for pk, _ in terms], dtype=np.int64)
+    term_idf = bm25_idf([count for _, count in terms], total)
+
+    postings = SearchPosting.objects.filter(term_id__in=term_ids.tolist())
+    if published_only:
+        postings = postings.filter(document__article__is_published=True)
+    # Straight from the cursor: common terms can have tens of thousands of postings
+    sql, params = postings.values_list('document_id', 'term_id', 'frequency', 'document__length').query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    if not rows:
+        return empty
+
+    columns = np.array(rows, dtype=np.float64)
+    document_ids, inverse = np.unique(columns[:, 0].astype(np.int64), return_inverse=True)
+    idf = term_idf[np.searchsorted(term_ids, columns[:, 1].astype(np.int64))]
+    frequency, length = columns[:, 2], columns[:, 3]
+
+    k1, b = SEARCH_SETTINGS['BM25_K1'], SEARCH_SETTINGS['BM25_B']
+    norm = k1 * (1.0 - b + b * length / (average_length or 1.0))
+    scores = np.bincount(inverse, weights=idf * frequency * (k1 + 1.0) / (frequency + norm))
+
+    # Best first, ties by newer article (higher id)
+    start = (page - 1) * per_page
+    order = np.lexsort((-document_ids, -scores))[start:start + per_page]
+    hits = [(int(document_ids[i]), float(scores[i])) for i in order]
+    return SearchResults(query, hits, len(document_ids), page, per_page)
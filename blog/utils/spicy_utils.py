@@ -1,32 +1,230 @@
 # blog/utils/spacy_utils.py
+import gc
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
 import spacy
-from django.core.cache import cache
-from functools import lru_cache
+from spacy.attrs import ENT_IOB, POS, SENT_START
+from spacy.parts_of_speech import NOUN, PROPN, VERB
 from blog.settings import SPACY_SETTINGS
 
-@lru_cache(maxsize=1)
-def get_spacy_model():
+logger = logging.getLogger(__name__)
+
+# Parts of speech that count towards a sentence's importance
+IMPORTANT_POS = [NOUN, PROPN, VERB]
+# ENT_IOB value of the first token of an entity
+ENT_IOB_BEGIN = 3
+
+
+def _current_rss_bytes():
+    """Return the resident set size of this process in bytes (0 if unknown)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+        # ru_maxrss is a peak value, reported in KB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == 'Darwin' else peak * 1024
+    except (ImportError, AttributeError):
+        return 0
+
+
+class TaskPipeline:
+    """A shared spaCy model bound to the components disabled for one task.
+
+    Components are disabled per call, so the underlying model is never
+    mutated and the same instance can be used from several threads.
+    """
+
+    def __init__(self, nlp, task, disable=()):
+        self.nlp = nlp
+        self.task = task
+        self.disable = [name for name in disable if name in nlp.pipe_names]
+
+    def __call__(self, text):
+        return self.nlp(text, disable=self.disable)
+
+    def pipe(self, texts, **kwargs):
+        kwargs.setdefault('disable', self.disable)
+        return self.nlp.pipe(texts, **kwargs)
+
+    def __repr__(self):
+        return f"<TaskPipeline task={self.task!r} disable={self.disable!r}>"
+
+
+def model_for_language(language=None):
+    """
+    Name of the spaCy model configured for a language code.
+    Regional variants fall back to the base language ('sr-latn' -> 'sr'),
+    unknown languages to the default MODEL_NAME.
+    """
+    models = SPACY_SETTINGS.get('LANGUAGE_MODELS', {})
+    if language:
+        language = language.lower()
+        for code in (language, language.split('-')[0].split('_')[0]):
+            if code in models:
+                return models[code]
+    return SPACY_SETTINGS['MODEL_NAME']
+
+
+class SpacyModelRegistry:
+    """
+    Process-wide pool that loads each spaCy model once per worker.
+
+    Models are loaded lazily on first use. When the RSS growth attributed to
+    the loaded models exceeds MODEL_POOL_MAX_MB, the least recently used
+    models are dropped (the model just requested is always kept).
+    """
+
+    def __init__(self):
+        self._models = OrderedDict()
+        self._stats = {}
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get_model(self, model_name=None, language=None):
+        """Get or load a spaCy model, by name or by language code"""
+        model_name = model_name or model_for_language(language)
+
+        with self._lock:
+            nlp = self._models.get(model_name)
+            if nlp is None:
+                nlp = self._load(model_name)
+                self._models[model_name] = nlp
+                self._evict(keep=model_name)
+            else:
+                self._models.move_to_end(model_name)
+            self._stats[model_name]['uses'] += 1
+        return nlp
+
+    def get_pipeline(self, task, model_name=None, language=None):
+        """Get a model with the components listed for `task` disabled"""
+        disable = SPACY_SETTINGS.get('TASK_DISABLED_PIPES', {}).get(task, [])
+        return TaskPipeline(self.get_model(model_name, language), task, disable)
+
+    def _load(self, model_name):
+        rss_before = _current_rss_bytes()
+        started = time.perf_counter()
+
+        if model_name.startswith('blank:'):
+            # Languages without a trained pipeline: tokenizer and sentence splitting only
+            nlp = spacy.blank(model_name.split(':', 1)[1])
+            nlp.add_pipe('sentencizer')
+        else:
+            nlp = spacy.load(model_name)
+
+        load_ms = (time.perf_counter() - started) * 1000
+        rss_delta = max(_current_rss_bytes() - rss_before, 0)
+        self._stats[model_name] = {
+            'load_time_ms': round(load_ms, 1),
+            'rss_delta_mb': round(rss_delta / (1024 * 1024), 1),
+            'pipe_names': list(nlp.pipe_names),
+            'pid': os.getpid(),
+            'uses': 0,
+        }
+        logger.info(
+            f"Loaded spaCy model {model_name} in {load_ms:.0f} ms "
+            f"(+{rss_delta / (1024 * 1024):.1f} MB RSS, pid {os.getpid()})"
+        )
+        return nlp
+
+    def _evict(self, keep):
+        """Drop least recently used models until the pool fits the memory cap"""
+        max_mb = SPACY_SETTINGS.get('MODEL_POOL_MAX_MB')
+        if not max_mb:
+            return
+
+        evicted = False
+        for model_name in list(self._models):
+            if self.memory_mb() <= max_mb:
+                break
+            if model_name == keep:
+                continue
+            del self._models[model_name]
+            info = self._stats.pop(model_name)
+            self._evictions += 1
+            evicted = True
+            logger.info(f"Evicted spaCy model {model_name} ({info['rss_delta_mb']} MB) from the pool")
+
+        if evicted:
+            # Break reference cycles so the model's memory can actually be released
+            gc.collect()
+
+    def memory_mb(self):
+        """Estimated memory held by the loaded models, from their load-time RSS growth"""
+        return sum(self._stats[name]['rss_delta_mb'] for name in self._models)
+
+    def is_loaded(self, model_name=None, language=None):
+        return (model_name or model_for_language(language)) in self._models
+
+    def loaded_models(self):
+        """Loaded model names, least recently used first"""
+        return list(self._models)
+
+    def stats(self):
+        """Load time and memory figures for every model loaded in this process"""
+        return {name: dict(info) for name, info in self._stats.items()}
+
+    @property
+    def evictions(self):
+        return self._evictions
+
+    def clear(self):
+        """Drop every loaded model (mainly useful in tests)"""
+        with self._lock:
+            self._models.clear()
+            self._stats.clear()
+            self._evictions = 0
+
+
+registry = SpacyModelRegistry()
+
+
+def get_spacy_model(model_name=None, language=None):
     """Get or load spaCy model with caching"""
-    return spacy.load(SPACY_SETTINGS['MODEL_NAME'])
-
-def get_sentence_importance(doc):
-    """Calculate importance score for each sentence based on token importance"""
-    scores = {}
-    
-    for sent in doc.sents:
-        # Calculate score based on named entities, noun phrases, and other important tokens
-        score = 0
-        
-        # Add score for named entities
-        score += len([ent for ent in sent.ents])
-        
-        # Add score for noun chunks
-        score += len([chunk for chunk in sent.noun_chunks])
-        
-        # Add score for important POS tags
-        important_pos = {'NOUN', 'PROPN', 'VERB'}
-        score += len([token for token in sent if token.pos_ in important_pos])
-        
-        scores[sent] = score
-    
-    return scores
\ No newline at end of file
+    return registry.get_model(model_name, language)
+
+
+def get_nlp_pipeline(task, model_name=None, language=None):
+    """Get the shared spaCy model configured for a task (and language)"""
+    return registry.get_pipeline(task, model_name, language)
+
+
+def token_sentence_indices(doc):
+    """Index of the sentence each token belongs to, from the SENT_START column"""
+    if not len(doc):
+        return np.zeros(0, dtype=np.int64)
+    starts = doc.to_array(SENT_START).astype(np.int64) == 1
+    starts[0] = True  # The first token always opens a sentence
+    return np.cumsum(starts) - 1
+
+
+def get_sentence_importance(doc, token_sents=None, chunk_starts=None):
+    """
+    Importance score of every sentence, indexed by sentence number: named
+    entities + noun chunks + nouns, proper nouns and verbs it contains.
+    Computed in one pass over the POS / ENT_IOB columns and noun-chunk starts;
+    pass `token_sents` / `chunk_starts` when the caller already has them.
+    """
+    if not len(doc):
+        return np.zeros(0)
+    if token_sents is None:
+        token_sents = token_sentence_indices(doc)
+
+    columns = doc.to_array([POS, ENT_IOB]).astype(np.int64)
+    token_scores = np.isin(columns[:, 0], IMPORTANT_POS).astype(np.float64)
+    token_scores += columns[:, 1] == ENT_IOB_BEGIN
+
+    if chunk_starts is None and doc.has_annotation('DEP') and doc.vocab.get_noun_chunks is not None:
+        chunk_starts = [chunk.start for chunk in doc.noun_chunks]
+    if chunk_starts is not None:
+        np.add.at(token_scores, np.asarray(chunk_starts, dtype=np.int64), 1.0)
+
+    return np.bincount(token_sents, weights=token_scores, minlength=int(token_sents[-1]) + 1)
@@ -0,0 +1,149 @@
+# blog/utils/suggestion_service.py
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from django.core.cache import caches
+from django.db import close_old_connections, connection
+from blog.models.article_model import Article
+from blog.settings import SUGGESTION_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+STATUS_READY = 'ready'
+STATUS_PENDING = 'pending'
+STATUS_FAILED = 'failed'
+STATUS_BUSY = 'busy'
+
+# _submit() result when another process is computing the same suggestions
+RUNNING_ELSEWHERE = object()
+
+_executor = None
+_inflight = {}
+_lock = threading.Lock()
+
+
+def content_version(article):
+    """
+    Short hash of everything the suggestions are computed from: the text and
+    the tags and category the article already has, which are left out.
+    """
+    tag_ids = list(article.tags.order_by('pk').values_list('pk', flat=True)) if article.pk else []
+    source = '\0'.join([article.title, article.content, article.language, str(article.category_id), repr(tag_ids)])
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+
+
+def _cache():
+    return caches[SUGGESTION_SETTINGS['CACHE_ALIAS']]
+
+
+def _key(article_id, version, kind='result'):
+    return f"{SUGGESTION_SETTINGS['KEY_PREFIX']}:{kind}:{article_id}:{version}"
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=SUGGESTION_SETTINGS['MAX_WORKERS'],
+            thread_name_prefix='suggestions',
+        )
+    return _executor
+
+
+def format_suggestions(raw_suggestions):
+    """Plain JSON-ready form of Article.suggest_content_tags_and_categories()"""
+    def entry(suggestion):
+        kind, info = suggestion
+        return {
+            'type': kind,
+            'info': {
+                'id': info.id if kind == 'existing' else None,
+                'name': info.name if kind == 'existing' else info['name'],
+            }
+        }
+
+    return {
+        'tags': [entry(suggestion) for suggestion in raw_suggestions.get('tags', [])],
+        'categories': [entry(suggestion) for suggestion in raw_suggestions.get('categories', [])],
+    }
+
+
+def compute_suggestions(article_id):
+    """Run the suggestion pipeline for one article (on a pool thread)"""
+    close_old_connections()
+    try:
+        article = Article.objects.select_related('category').get(pk=article_id)
+        return format_suggestions(article.suggest_content_tags_and_categories())
+    finally:
+        # Pool threads outlive requests, so never keep a connection open between jobs
+        connection.close()
+
+
+def _finish(article_id, version, future):
+    try:
+        result = future.result()
+    except Exception as e:
+        logger.error(f"Suggestions for article {article_id} failed: {e}")
+        _cache().set(_key(article_id, version, 'error'), str(e), SUGGESTION_SETTINGS['ERROR_TIMEOUT'])
+    else:
+        _cache().set(_key(article_id, version), result, SUGGESTION_SETTINGS['CACHE_TIMEOUT'])
+    finally:
+        _cache().delete(_key(article_id, version, 'pending'))
+        with _lock:
+            _inflight.pop((article_id, version), None)
+
+
+def _submit(article_id, version):
+    """
+    Return the running computation for (article, version), starting one if
+    needed; None when too many are in flight, RUNNING_ELSEWHERE when another
+    process sharing the cache has claimed it.
+    """
+    with _lock:
+        future = _inflight.get((article_id, version))
+        if future is not None:
+            return future
+        if len(_inflight) >= SUGGESTION_SETTINGS['MAX_PENDING']:
+            return None
+        if not _cache().add(_key(article_id, version, 'pending'), True, SUGGESTION_SETTINGS['PENDING_TIMEOUT']):
+            return RUNNING_ELSEWHERE
+        future = _get_executor().submit(compute_suggestions, article_id)
+        _inflight[(article_id, version)] = future
+    future.add_done_callback(lambda done: _finish(article_id, version, done))
+    return future
+
+
+def get_suggestions(article, wait=None):
+    """
+    Suggestions for an article without tying up the caller.
+
+    Returns (status, version, payload). Concurrent requests for the same
+    article and content version share one computation, across processes
+    through the shared cache; the caller waits at most `wait` seconds
+    (SUGGESTION_SETTINGS['WAIT'] by default) before getting STATUS_PENDING
+    and polling again.
+    """
+    version = content_version(article)
+    cached = _cache().get(_key(article.pk, version))
+    if cached is not None:
+        return STATUS_READY, version, cached
+
+    error = _cache().get(_key(article.pk, version, 'error'))
+    if error is not None:
+        return STATUS_FAILED, version, {'error': error}
+
+    future = _submit(article.pk, version)
+    if future is None:
+        return STATUS_BUSY, version, {'error': 'Too many suggestion requests in progress'}
+    if future is RUNNING_ELSEWHERE:
+        # Its result lands in the shared cache, where the next poll finds it
+        return STATUS_PENDING, version, {}
+
+    wait = SUGGESTION_SETTINGS['WAIT'] if wait is None else wait
+    try:
+        return STATUS_READY, version, future.result(timeout=wait)
+    except TimeoutError:
+        return STATUS_PENDING, version, {}
+    except Exception as e:
+        return STATUS_FAILED, version, {'error': str(e)}
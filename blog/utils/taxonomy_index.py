@@ -0,0 +1,161 @@
+# blog/utils/taxonomy_index.py
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+from django.core.cache import caches
+from django.utils.text import slugify
+from blog.settings import TAXONOMY_INDEX_SETTINGS
+
+
+def build_automaton(patterns):
+    """
+    Build an Aho-Corasick automaton for `patterns`.
+    Returns (goto, fail, output) tables indexed by state.
+    """
+    goto = [{}]
+    fail = [0]
+    output = [[]]
+
+    for index, pattern in enumerate(patterns):
+        state = 0
+        for char in pattern:
+            next_state = goto[state].get(char)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][char] = next_state
+                goto.append({})
+                fail.append(0)
+                output.append([])
+            state = next_state
+        output[state].append(index)
+
+    # Breadth-first pass to wire failure links
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, next_state in goto[state].items():
+            queue.append(next_state)
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[next_state] = goto[fallback].get(char, 0)
+            output[next_state] = output[next_state] + output[fail[next_state]]
+
+    return goto, fail, output
+
+
+class TaxonomyIndex:
+    """
+    In-memory index over the names and slugs of one taxonomy model.
+
+    Resolves candidates with the same rules as
+    ``filter(Q(name__iexact=c) | Q(name__icontains=c) | Q(slug=slugify(c))).first()``
+    (lowest primary key wins), but for all candidates in a single scan.
+    """
+
+    SEPARATOR = '\n'
+
+    def __init__(self, rows):
+        # rows: (pk, name, slug) ordered by pk
+        self.pks = []
+        self.starts = []
+        self.slugs = {}
+        names = []
+        position = 0
+
+        for pk, name, slug in rows:
+            name = name.lower()
+            self.pks.append(pk)
+            self.starts.append(position)
+            names.append(name)
+            position += len(name) + len(self.SEPARATOR)
+            self.slugs.setdefault(slug, pk)
+
+        self.corpus = self.SEPARATOR.join(names)
+
+    def __len__(self):
+        return len(self.pks)
+
+    def match_many(self, candidates):
+        """Map each candidate to the pk of the matching object (or None)"""
+        patterns = list(dict.fromkeys(c.lower() for c in candidates if c))
+        best = {pattern: self.slugs.get(slugify(pattern)) for pattern in patterns}
+        # A pattern spanning the separator could match across two names
+        patterns = [pattern for pattern in patterns if self.SEPARATOR not in pattern]
+
+        if patterns and self.corpus:
+            goto, fail, output = build_automaton(patterns)
+            found_in_name = [False] * len(patterns)
+            remaining = len(patterns)
+            state = 0
+
+            for position, char in enumerate(self.corpus):
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+
+                for index in output[state]:
+                    # Names are scanned in pk order, so the first hit is the lowest pk
+                    if found_in_name[index]:
+                        continue
+                    found_in_name[index] = True
+                    remaining -= 1
+                    pattern = patterns[index]
+                    pk = self.pks[bisect_right(self.starts, position) - 1]
+                    if best[pattern] is None or pk < best[pattern]:
+                        best[pattern] = pk
+
+                if not remaining:
+                    break
+
+        return {candidate: best.get(candidate.lower()) for candidate in candidates if candidate}
+
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def _version_key(model):
+    return f"taxonomy-index-version:{model._meta.label_lower}"
+
+
+def _current_version(model):
+    return caches[TAXONOMY_INDEX_SETTINGS['CACHE_ALIAS']].get(_version_key(model), 0)
+
+
+def get_taxonomy_index(model):
+    """Return the cached index for Tag or Category, rebuilding it when stale"""
+    label = model._meta.label_lower
+    version = _current_version(model)
+    entry = _indexes.get(label)
+
+    if entry is not None:
+        cached_version, built_at, index = entry
+        if cached_version == version and time.monotonic() - built_at < TAXONOMY_INDEX_SETTINGS['MAX_AGE']:
+            return index
+
+    rows = model.objects.order_by('pk').values_list('pk', 'name', 'slug')
+    index = TaxonomyIndex(rows)
+    with _lock:
+        _indexes[label] = (version, time.monotonic(), index)
+    return index
+
+
+def invalidate_taxonomy_index(model):
+    """Bump the index version so every process rebuilds it on next use"""
+    cache = caches[TAXONOMY_INDEX_SETTINGS['CACHE_ALIAS']]
+    key = _version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+    with _lock:
+        _indexes.pop(model._meta.label_lower, None)
+
+
+def resolve_candidates(model, candidates):
+    """Map candidates to existing objects of `model` with one index scan and one query"""
+    matches = get_taxonomy_index(model).match_many(candidates)
+    objects = model.objects.in_bulk({pk for pk in matches.values() if pk is not None})
+    return {candidate: objects.get(pk) for candidate, pk in matches.items()}
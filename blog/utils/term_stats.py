@@ -0,0 +1,90 @@
+# blog/utils/term_stats.py
+from collections import Counter
+import numpy as np
+from django.db import transaction
+from django.db.models import F
+from blog.models.term_stats_model import ArticleTerm, ArticleTermStats, TermDocumentFrequency
+from blog.utils.text_analysis import analyze_content, tag_candidate_terms
+
+# Longer phrases do not fit in TermDocumentFrequency.term and make poor tags anyway
+MAX_TERM_LENGTH = 255
+
+
+def article_terms(article):
+    """Tag candidate term counts for an article's title and content"""
+    analyses = [analyze_content(article.title, language=article.language), article.analyze_content()]
+    return Counter(term for term in tag_candidate_terms(analyses) if len(term) <= MAX_TERM_LENGTH)
+
+
+def _adjust_document_counts(terms, delta):
+    if not terms:
+        return
+    if delta > 0:
+        TermDocumentFrequency.objects.bulk_create(
+            [TermDocumentFrequency(term=term, document_count=0) for term in terms],
+            ignore_conflicts=True,
+        )
+    TermDocumentFrequency.objects.filter(term__in=terms).update(document_count=F('document_count') + delta)
+    if delta < 0:
+        TermDocumentFrequency.objects.filter(term__in=terms, document_count__lte=0).delete()
+
+
+def update_article_terms(article):
+    """Store an article's term counts and move document frequencies by the difference"""
+    terms = article_terms(article)
+
+    with transaction.atomic():
+        stats, created = ArticleTermStats.objects.select_for_update().get_or_create(article=article)
+        old_terms = set() if created else set(stats.terms)
+        new_terms = set(terms)
+
+        added, removed = sorted(new_terms - old_terms), sorted(old_terms - new_terms)
+        _adjust_document_counts(added, +1)
+        _adjust_document_counts(removed, -1)
+        if removed:
+            ArticleTerm.objects.filter(article=article, term__in=removed).delete()
+        ArticleTerm.objects.bulk_create([ArticleTerm(article=article, term=term) for term in added])
+
+        stats.terms = dict(terms)
+        stats.save()
+    return stats
+
+
+def remove_article_terms(article_id):
+    """Take a deleted article out of the document frequencies"""
+    with transaction.atomic():
+        stats = ArticleTermStats.objects.select_for_update().filter(article_id=article_id).first()
+        if stats is None:
+            return
+        _adjust_document_counts(sorted(stats.terms), -1)
+        ArticleTerm.objects.filter(article_id=article_id).delete()
+        stats.delete()
+
+
+def smoothed_idf(document_counts, total):
+    """idf = ln((1 + N) / (1 + df)) + 1, so unseen terms still get a finite weight"""
+    return np.log((1 + total) / (1 + np.asarray(document_counts, dtype=np.float64))) + 1.0
+
+
+def idf_weights(terms):
+    """Smoothed inverse document frequency for each term, as a NumPy vector"""
+    total = ArticleTermStats.objects.count()
+    frequencies = dict(
+        TermDocumentFrequency.objects.filter(term__in=terms).values_list('term', 'document_count')
+    )
+    return smoothed_idf([frequencies.get(term, 0) for term in terms], total)
+
+
+def rank_by_tfidf(term_counts):
+    """
+    Order terms by tf-idf, best first.
+    With an empty corpus every idf is 1, which falls back to raw frequency.
+    """
+    terms = list(term_counts)
+    if not terms:
+        return []
+
+    tf = np.fromiter(term_counts.values(), dtype=np.float64, count=len(terms))
+    scores = tf * idf_weights(terms)
+    order = np.argsort(-scores, kind='stable')
+    return [(terms[i], float(scores[i])) for i in order]
@@ -0,0 +1,207 @@
+# blog/utils/text_analysis.py
+import numpy as np
+from spacy.attrs import IS_STOP, LENGTH, POS
+from spacy.parts_of_speech import NOUN, PROPN
+from blog.settings import SPACY_SETTINGS
+from blog.utils.html_utils import html_to_text
+from blog.utils.spicy_utils import get_nlp_pipeline, get_sentence_importance, model_for_language, token_sentence_indices
+from blog.utils.nlp_cache import analysis_cache
+
+# Named entity labels worth turning into tags or categories (English models;
+# SPACY_SETTINGS['TOPIC_ENTITY_LABELS'] has the other label schemes)
+TOPIC_ENTITY_LABELS = ['ORG', 'PRODUCT', 'PERSON', 'GPE', 'TECH']
+
+# Extra weight of opening sentences in excerpts: 1 + LEAD_SENTENCE_BONUS / (index + 1)
+LEAD_SENTENCE_BONUS = 1.0
+
+
+def clean_html(content):
+    """Remove HTML tags and clean up text"""
+    return html_to_text(content)
+
+
+def topic_entity_labels(language=None):
+    """Topic entity labels of the models for a spaCy language code"""
+    return SPACY_SETTINGS.get('TOPIC_ENTITY_LABELS', {}).get(language, TOPIC_ENTITY_LABELS)
+
+
+def tag_candidate_terms(analyses):
+    """
+    Candidate tag terms from one or more analyses, in scoring order:
+    named entities, 2-3 word noun phrases, then single nouns.
+    """
+    terms = [
+        text.lower()
+        for analysis in analyses
+        for text, label, _ in analysis.entities
+        if label in topic_entity_labels(analysis.language)
+    ]
+    terms.extend(
+        text.lower()
+        for analysis in analyses
+        for text, _ in analysis.noun_chunks
+        if 2 <= len(text.split()) <= 3
+    )
+    terms.extend(keyword for analysis in analyses for keyword in analysis.keywords)
+    return terms
+
+
+class ContentAnalysis:
+    """
+    Everything the blog derives from one spaCy parse of a piece of content.
+
+    Holds plain Python data only, so the excerpt, the meta description and
+    the tag/category suggestions can all be built from a single parse.
+    """
+
+    def __init__(self, text='', sentences=None, entities=None, noun_chunks=None, keywords=None, doc=None,
+                 sentence_scores=None, language=None):
+        self.text = text
+        # spaCy language of the model that parsed it, which decides the entity label scheme
+        self.language = language
+        self.sentences = sentences or []
+        self.sentence_word_counts = [len(sent.split()) for sent in self.sentences]
+        # Importance of each sentence (see get_sentence_importance)
+        self.sentence_scores = sentence_scores or [0.0] * len(self.sentences)
+        # (text, label, sentence index)
+        self.entities = entities or []
+        # (text, sentence index)
+        self.noun_chunks = noun_chunks or []
+        # Lowercased nouns and proper nouns that are not stop words
+        self.keywords = keywords or []
+        self.doc = doc
+
+    @classmethod
+    def from_doc(cls, doc):
+        """Collect sentences, entities, noun chunks and keywords from a parsed doc"""
+        # Sentence membership for every token in one vectorized pass,
+        # instead of re-scanning doc.ents / noun chunks for each sentence
+        token_sents = token_sentence_indices(doc)
+
+        sentences = [sent.text.strip() for sent in doc.sents]
+        entities = [(ent.text, ent.label_, int(token_sents[ent.start])) for ent in doc.ents]
+        noun_chunks = []
+        chunk_starts = []
+        # Languages without a noun chunk iterator (or a parser) have no chunks
+        if doc.has_annotation('DEP') and doc.vocab.get_noun_chunks is not None:
+            for chunk in doc.noun_chunks:
+                noun_chunks.append((chunk.text, int(token_sents[chunk.start])))
+                chunk_starts.append(chunk.start)
+
+        # Nouns and proper nouns that are not stop words and longer than 3 characters
+        columns = doc.to_array([POS, IS_STOP, LENGTH]).astype(np.int64)
+        keyword_mask = np.isin(columns[:, 0], [NOUN, PROPN]) & (columns[:, 1] == 0) & (columns[:, 2] > 3)
+        keywords = [doc[int(i)].lower_ for i in np.flatnonzero(keyword_mask)]
+
+        return cls(
+            text=doc.text,
+            sentences=sentences,
+            entities=entities,
+            noun_chunks=noun_chunks,
+            keywords=keywords,
+            doc=doc,
+            sentence_scores=get_sentence_importance(doc, token_sents, chunk_starts).tolist(),
+            language=doc.lang_,
+        )
+
+    def to_dict(self):
+        """Plain representation used by the analysis cache"""
+        return {
+            'text': self.text,
+            'sentences': self.sentences,
+            'entities': [list(entity) for entity in self.entities],
+            'noun_chunks': [list(chunk) for chunk in self.noun_chunks],
+            'keywords': self.keywords,
+            'sentence_scores': self.sentence_scores,
+            'language': self.language,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            text=data['text'],
+            sentences=data['sentences'],
+            entities=[tuple(entity) for entity in data['entities']],
+            noun_chunks=[tuple(chunk) for chunk in data['noun_chunks']],
+            keywords=data['keywords'],
+            sentence_scores=data['sentence_scores'],
+            language=data['language'],
+        )
+
+    @property
+    def word_count(self):
+        return sum(self.sentence_word_counts)
+
+    def __bool__(self):
+        return bool(self.sentences)
+
+    def ranked_sentences(self):
+        """
+        Sentence indices, best first: importance normalised by the square root
+        of the sentence length, with a bonus for opening sentences. Ties keep
+        document order.
+        """
+        scores = np.asarray(self.sentence_scores, dtype=np.float64)
+        words = np.maximum(np.asarray(self.sentence_word_counts, dtype=np.float64), 1.0)
+        positions = np.arange(len(scores))
+        ranking = scores / np.sqrt(words) * (1.0 + LEAD_SENTENCE_BONUS / (positions + 1))
+        return np.lexsort((positions, -ranking))
+
+    def excerpt(self, max_words=None):
+        """Best sentences that fit within the word limit, in document order"""
+        max_words = max_words or SPACY_SETTINGS['EXCERPT_MAX_WORDS']
+        words = np.asarray(self.sentence_word_counts, dtype=np.int64)
+        ranked = self.ranked_sentences()
+        remaining = max_words
+        chosen = []
+
+        # Greedy fill, best first, skipping sentences that no longer fit
+        for index in ranked[words[ranked] <= max_words]:
+            if words[index] <= remaining:
+                chosen.append(index)
+                remaining -= words[index]
+                if not remaining:
+                    break
+
+        return ' '.join(self.sentences[index] for index in sorted(chosen)).strip()
+
+    def meta_description(self, max_chars=None):
+        """Best sentence under the character limit, else the best one truncated"""
+        max_chars = max_chars or SPACY_SETTINGS['META_DESCRIPTION_MAX_CHARS']
+        if not self.sentences:
+            return ""
+
+        ranked = self.ranked_sentences()
+        lengths = np.fromiter((len(sent) for sent in self.sentences), dtype=np.int64, count=len(self.sentences))
+        fitting = ranked[lengths[ranked] <= max_chars]
+        if len(fitting):
+            return self.sentences[fitting[0]]
+
+        return self.sentences[ranked[0]][:max_chars - 3] + "..."
+
+
+def analyze_content(content, use_cache=True, language=None):
+    """
+    Clean HTML content and parse it once with the spaCy model for its language.
+    Results are cached by content hash, so unchanged text skips spaCy.
+    """
+    if not content:
+        return ContentAnalysis()
+
+    clean_text = clean_html(content)
+    if not clean_text:
+        return ContentAnalysis()
+
+    model_name = model_for_language(language)
+    key = analysis_cache.make_key(clean_text, model_name) if use_cache else None
+    if key:
+        cached = analysis_cache.get(key)
+        if cached is not None:
+            return ContentAnalysis.from_dict(cached)
+
+    nlp = get_nlp_pipeline('analysis', model_name)
+    analysis = ContentAnalysis.from_doc(nlp(clean_text))
+
+    if key:
+        analysis_cache.set(key, analysis.to_dict())
+    return analysis
@@ -0,0 +1,121 @@
+# blog/utils/topic_scoring.py
+"""
+Category topic scoring with NumPy. Doc.to_array is used where a parsed Doc
+exists: ContentAnalysis.from_doc reads sentence membership and keyword
+columns from it. Scoring itself runs on ContentAnalysis (entities and noun
+chunks with their sentence index), not on the Doc, because analyses are
+usually served from the analysis cache (blog/utils/nlp_cache.py) as plain
+data with no Doc to read columns from. Their entities and noun chunks are
+flattened into arrays once, and sections, weights and rankings are array
+operations over them.
+"""
+import numpy as np
+from blog.utils.text_analysis import topic_entity_labels
+
+ENTITY_WEIGHT = 1.0
+NOUN_CHUNK_WEIGHT = 0.5
+
+# Occurrence kinds, in the order they are scored within a section
+KIND_ENTITY = 0
+KIND_NOUN_CHUNK = 1
+
+
+def topic_occurrences(analysis):
+    """
+    Flatten an analysis into parallel arrays of topic occurrences:
+    (topics, sentence indices, base weights, kinds).
+    """
+    topics = []
+    sentences = []
+    weights = []
+    kinds = []
+
+    labels = topic_entity_labels(analysis.language)
+    for text, label, index in analysis.entities:
+        if label in labels:
+            topics.append(text.lower())
+            sentences.append(index)
+            weights.append(ENTITY_WEIGHT)
+            kinds.append(KIND_ENTITY)
+
+    for text, index in analysis.noun_chunks:
+        if 1 <= len(text.split()) <= 2:  # 1-2 word phrases for categories
+            topics.append(text.lower())
+            sentences.append(index)
+            weights.append(NOUN_CHUNK_WEIGHT)
+            kinds.append(KIND_NOUN_CHUNK)
+
+    return (
+        topics,
+        np.asarray(sentences, dtype=np.int64),
+        np.asarray(weights, dtype=np.float64),
+        np.asarray(kinds, dtype=np.int64),
+    )
+
+
+def score_topics(sections):
+    """
+    Score topics over weighted sections of one or more analyses.
+
+    `sections` is a list of (analysis, first sentence, last sentence or None,
+    weight). Returns [(topic, score)] sorted by score, ties broken by the
+    order in which topics first appear (section, entities before noun
+    chunks, position).
+    """
+    topic_ids = {}
+    occurrences = {'ids': [], 'scores': [], 'sections': [], 'kinds': [], 'positions': []}
+
+    grouped = {}
+    for number, (analysis, first, last, weight) in enumerate(sections):
+        grouped.setdefault(id(analysis), (analysis, []))[1].append((number, first, last, weight))
+
+    for analysis, analysis_sections in grouped.values():
+        topics, sentences, base_weights, kinds = topic_occurrences(analysis)
+        if not topics:
+            continue
+
+        ids = np.fromiter(
+            (topic_ids.setdefault(topic, len(topic_ids)) for topic in topics),
+            dtype=np.int64,
+            count=len(topics),
+        )
+        section_weights = np.zeros(len(topics))
+        section_numbers = np.full(len(topics), -1, dtype=np.int64)
+
+        for number, first, last, weight in analysis_sections:
+            mask = sentences >= first
+            if last is not None:
+                mask &= sentences < last
+            section_weights[mask] = weight
+            section_numbers[mask] = number
+
+        keep = section_numbers >= 0
+        occurrences['ids'].append(ids[keep])
+        occurrences['scores'].append(base_weights[keep] * section_weights[keep])
+        occurrences['sections'].append(section_numbers[keep])
+        occurrences['kinds'].append(kinds[keep])
+        occurrences['positions'].append(np.flatnonzero(keep))
+
+    if not topic_ids:
+        return []
+
+    ids, scores, section_numbers, kinds, positions = (
+        np.concatenate(occurrences[key]) for key in ('ids', 'scores', 'sections', 'kinds', 'positions')
+    )
+    if not len(ids):
+        return []
+
+    topic_count = len(topic_ids)
+    totals = np.bincount(ids, weights=scores, minlength=topic_count)
+    seen = np.bincount(ids, minlength=topic_count) > 0
+
+    # Rank of each topic's first appearance, in scoring order
+    order = np.lexsort((positions, kinds, section_numbers))
+    first_seen = np.full(topic_count, len(ids), dtype=np.int64)
+    np.minimum.at(first_seen, ids[order], np.arange(len(order)))
+
+    candidates = np.flatnonzero(seen)
+    ranked = candidates[np.lexsort((first_seen[candidates], -totals[candidates]))]
+
+    names = list(topic_ids)
+    return [(names[i], float(totals[i])) for i in ranked]
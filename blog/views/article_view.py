@@ -2,17 +2,35 @@ from django.views.generic import ListView
 from django.views.generic import DetailView
 from blog.models.article_model import Article
 from django.urls import reverse
+from blog.views.mixins_view import KeysetPaginationMixin, PageLinksMixin
 
-class ArticleListView(ListView):
+# Columns rendered by blog/components/article_item.html, plus the versions its fragment cache key needs
+CARD_FIELDS = (
+    'id', 'title', 'slug', 'content', 'featured_image', 'created_at', 'updated_at',
+    'category__id', 'category__name', 'category__slug', 'category__updated_at',
+)
+
+
+def article_cards(queryset):
+    """
+    Articles ready for the card template: the category comes in the same
+    query and the columns the card never shows are left unread.
+    """
+    return queryset.select_related('category').only(*CARD_FIELDS)
+
+
+class ArticleListView(PageLinksMixin, KeysetPaginationMixin, ListView):
     model = Article
     template_name = 'blog/article/article_list.html'
     context_object_name = 'article_list'
     paginate_by = 2
     ordering = ['-created_at'] 
+    page_url_name = 'articles-list'
+    paginated_url_name = 'article-list-paginated'
     
     def get_queryset(self):
         # Filter only published articles and order by created_at
-        return Article.objects.filter(is_published=True).order_by(*self.ordering)
+        return article_cards(Article.objects.filter(is_published=True)).order_by(*self.ordering)
 
 
 class ArticleDetailView(DetailView):
@@ -21,8 +39,8 @@ class ArticleDetailView(DetailView):
     context_object_name = 'article'
 
     def get_queryset(self):
-        # Filter only published articles
-        return Article.objects.filter(is_published=True)
+        # Filter only published articles; the template shows the category and every tag
+        return Article.objects.filter(is_published=True).select_related('category').prefetch_related('tags')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -32,4 +50,8 @@ class ArticleDetailView(DetailView):
             {'name': article.category.name, 'url': reverse('category-detail', args=[article.category.slug])},
             {'name': article.title, 'url': reverse('article-detail', args=[article.slug])}
         ]
+        # Precomputed neighbours (see blog/utils/related_articles.py), one indexed query
+        context['related_articles'] = article_cards(
+            Article.objects.filter(related_from__article=article, is_published=True)
+        ).order_by('related_from__rank')
         return context
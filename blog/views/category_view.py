@@ -1,8 +1,8 @@
 from django.views.generic import ListView
-from django.views.generic import DetailView
 from blog.models.category_model import Category
 from blog.models.article_model import Article
-from django.db.models import Count, Q
+from blog.views.article_view import article_cards
+from blog.views.mixins_view import ArticlesOfObjectMixin
 
 class CategoryListView(ListView):
     model = Category
@@ -11,23 +11,23 @@ class CategoryListView(ListView):
     ordering = ['name']
 
     def get_queryset(self):
-        # Annotate categories with the number of related articles
-        return Category.objects.annotate(
-            article_count=Count('articles', filter=Q(articles__is_published=True))
-            ).order_by(*self.ordering)
+        # article_count is a stored column (see blog/utils/article_counts.py)
+        return Category.objects.order_by(*self.ordering)
 
 
-class CategoryDetailView(DetailView):
+class CategoryDetailView(ArticlesOfObjectMixin, ListView):
     model = Category
     template_name = 'blog/category/category_detail.html'
-    context_object_name = 'category'
-    paginate_by = 1
-    ordering = ['-created_at'] 
+    paginate_by = 10
+    ordering = ['-created_at', '-id']
+    page_url_name = 'category-detail'
+    paginated_url_name = 'category-detail-paginated'
 
-    def get_context_data(self, **kwargs):
+    def get_queryset(self):
         """
-        Add related articles to the context data.
+        The category's published articles, newest first
+        (blog_article_category_idx covers the filter and the ordering).
         """
-        context = super().get_context_data(**kwargs)
-        context['articles'] = Article.objects.filter(category=self.object, is_published=True).order_by(*self.ordering)
-        return context  
+        return article_cards(
+            Article.objects.filter(category=self.object, is_published=True)
+        ).order_by(*self.ordering)
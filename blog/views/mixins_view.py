@@ -0,0 +1,86 @@
+# blog/views/mixins_view.py
+from django.core.paginator import InvalidPage
+from django.http import Http404
+from django.urls import reverse
+from django.views.generic.detail import SingleObjectMixin
+from blog.settings import PAGINATION_SETTINGS
+from blog.utils.pagination import KeysetPaginator, StoredCountPaginator
+
+
+class KeysetPaginationMixin:
+    """
+    For ListViews: with PAGINATION_SETTINGS['KEYSET'] on, pages are read
+    with a KeysetPaginator from the ?after= / ?before= cursors instead of
+    page numbers. A numbered page is then a 404 rather than the first page
+    under another URL.
+    """
+    keyset_ordering = ('-created_at', '-id')
+
+    def keyset_enabled(self):
+        return PAGINATION_SETTINGS['KEYSET']
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.keyset_enabled():
+            return super().paginate_queryset(queryset, page_size)
+
+        if self.kwargs.get(self.page_kwarg) or self.request.GET.get(self.page_kwarg):
+            raise Http404("Pages are addressed by cursor, not by number.")
+        paginator = KeysetPaginator(queryset, page_size, self.keyset_ordering)
+        try:
+            page = paginator.page(after=self.request.GET.get('after'), before=self.request.GET.get('before'))
+        except InvalidPage as e:
+            raise Http404(str(e))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['keyset_pagination'] = self.keyset_enabled()
+        return context
+
+
+class PageLinksMixin:
+    """
+    For paginated ListViews: page 1 links to `page_url_name`, later pages to
+    `paginated_url_name` (a route with a `page` argument). Read by the
+    {% page_url %} tag in blog/components/pagination.html.
+    """
+    page_url_name = None
+    paginated_url_name = None
+
+    def get_page_url_kwargs(self):
+        return {}
+
+    def get_page_url(self, number):
+        kwargs = self.get_page_url_kwargs()
+        if int(number) == 1:
+            return reverse(self.page_url_name, kwargs=kwargs)
+        return reverse(self.paginated_url_name, kwargs={**kwargs, 'page': number})
+
+
+class ArticlesOfObjectMixin(PageLinksMixin, KeysetPaginationMixin, SingleObjectMixin):
+    """
+    A ListView of one object's published articles (a category or a tag),
+    paginated like the article list. The object is in the context under its
+    model name, the articles as article_list. The model needs an
+    article_count column.
+    """
+
+    def get(self, request, *args, **kwargs):
+        self.object = self.get_object(queryset=self.model.objects.all())
+        return super().get(request, *args, **kwargs)
+
+    def get_page_url_kwargs(self):
+        return {'slug': self.object.slug}
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        # The object's stored published-article count stands in for a COUNT(*)
+        return StoredCountPaginator(
+            queryset, per_page, self.object.article_count,
+            orphans=orphans, allow_empty_first_page=allow_empty_first_page, **kwargs
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        # SingleObjectMixin's get_context_object_name shadows the list's one
+        context['article_list'] = context['object_list']
+        return context
@@ -0,0 +1,74 @@
+# blog/views/search_view.py
+from django.http import JsonResponse
+from django.urls import reverse
+from django.views.decorators.http import require_GET
+from django.views.generic import TemplateView
+from blog.models.article_model import Article
+from blog.settings import PAGINATION_SETTINGS, SEARCH_SETTINGS
+from blog.utils import autocomplete
+from blog.utils.search_backends import get_search_backend
+
+
+def search_articles(query, page=1, per_page=None):
+    """
+    Ranked published articles for a query: (SearchResults, [(article, score)]).
+    The backend ranks ids; the page of articles is loaded in one query. The
+    page is at least 1 and the page size at most MAX_CONNECTION_PAGE_SIZE,
+    for the search page and GraphQL alike.
+    """
+    page = max(int(page or 1), 1)
+    per_page = min(
+        max(int(per_page or SEARCH_SETTINGS['RESULTS_PER_PAGE']), 1),
+        PAGINATION_SETTINGS['MAX_CONNECTION_PAGE_SIZE'],
+    )
+    results = get_search_backend().search(query, page=page, per_page=per_page)
+    articles = Article.objects.select_related('category').in_bulk(results.article_ids)
+    hits = [(articles[article_id], score) for article_id, score in results if article_id in articles]
+    return results, hits
+
+
+class SearchView(TemplateView):
+    template_name = 'blog/search/search_results.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query = self.request.GET.get('q', '').strip()
+        try:
+            page = int(self.request.GET.get('page', 1))
+        except ValueError:
+            page = 1
+
+        results, hits = search_articles(query, page)
+        context.update({
+            'query': query,
+            'results': results,
+            'article_list': [article for article, _ in hits],
+        })
+        return context
+
+
+COMPLETION_URLS = {
+    autocomplete.KIND_ARTICLE: 'article-detail',
+    autocomplete.KIND_CATEGORY: 'category-detail',
+    autocomplete.KIND_TAG: 'tag-detail',
+}
+
+
+@require_GET
+def autocomplete_view(request):
+    """Type-ahead completions for the header search box, from the in-process trie"""
+    query = request.GET.get('q', '')
+    try:
+        limit = int(request.GET.get('limit', 0)) or None
+    except ValueError:
+        limit = None
+
+    results = [
+        {
+            'type': entry.kind,
+            'label': entry.label,
+            'url': reverse(COMPLETION_URLS[entry.kind], args=[entry.slug]),
+        }
+        for entry in autocomplete.complete(query, limit)
+    ]
+    return JsonResponse({'query': query, 'results': results})
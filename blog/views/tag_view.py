@@ -1,8 +1,8 @@
 from django.views.generic import ListView
-from django.views.generic import DetailView
 from blog.models.article_model import Article
-from django.db.models import Count, Q
 from blog.models.tag_model import Tag
+from blog.views.article_view import article_cards
+from blog.views.mixins_view import ArticlesOfObjectMixin
 
 class TagListView(ListView):
     model = Tag
@@ -11,20 +11,24 @@ class TagListView(ListView):
     ordering = ['name']
 
     def get_queryset(self):
-        return Tag.objects.annotate(
-            article_count=Count('articles', filter=Q(articles__is_published=True))
-        ).order_by(*self.ordering)
+        # article_count is a stored column (see blog/utils/article_counts.py)
+        return Tag.objects.order_by(*self.ordering)
 
-class TagDetailView(DetailView):
+class TagDetailView(ArticlesOfObjectMixin, ListView):
     model = Tag
     template_name = 'blog/tag/tag_detail.html'
-    context_object_name = 'tag'
-    ordering = ['-created_at'] 
+    paginate_by = 10
+    ordering = ['-created_at', '-id']
+    page_url_name = 'tag-detail'
+    paginated_url_name = 'tag-detail-paginated'
 
-    def get_context_data(self, **kwargs):
+    def get_queryset(self):
         """
-        Add related articles to the context data.
+        The tag's published articles, newest first. The through table's
+        tag_id index finds the links, but created_at lives on the article, so
+        the engine sorts the tag's articles for each page: unlike category
+        pages, the cost follows the tag's size (not the number of articles).
         """
-        context = super().get_context_data(**kwargs)
-        context['articles'] = Article.objects.filter(tags=self.object, is_published=True).order_by(*self.ordering)
-        return context  
+        return article_cards(
+            Article.objects.filter(tags=self.object, is_published=True)
+        ).order_by(*self.ordering)
@@ -1,3 +1,6 @@
+const SUGGESTION_POLL_INTERVAL = 1000;
+const SUGGESTION_MAX_POLLS = 30;
+
 function getSuggestions(articleId) {
     if (!articleId) {
         console.error("Article ID is required");
@@ -12,21 +15,35 @@ function getSuggestions(articleId) {
         },
         credentials: 'same-origin'
     })
-    .then(response => {
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        return response.json();
-    })
-    .then(data => {
-        console.log("Suggestions:", data);
-        displaySuggestions(data);
-    })
+    .then(response => handleSuggestionResponse(response, 0))
     .catch(error => {
         console.error("Error fetching suggestions:", error);
     });
 }
 
+function handleSuggestionResponse(response, polls) {
+    if (response.status === 202) {
+        // Still being computed on the server: poll the URL it gave us
+        return response.json().then(data => pollSuggestions(data.poll_url, polls + 1));
+    }
+    if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+    return response.json().then(data => {
+        console.log("Suggestions:", data);
+        displaySuggestions(data);
+    });
+}
+
+function pollSuggestions(pollUrl, polls) {
+    if (polls > SUGGESTION_MAX_POLLS) {
+        throw new Error("Suggestions are taking too long, please try again");
+    }
+    return new Promise(resolve => setTimeout(resolve, SUGGESTION_POLL_INTERVAL))
+        .then(() => fetch(pollUrl, { credentials: 'same-origin' }))
+        .then(response => handleSuggestionResponse(response, polls));
+}
+
 function getSuggestionsForArticle() {
     const articleId = document.getElementById('article_id').value;
     if (!articleId) {
@@ -0,0 +1,98 @@
+export class SearchAutocomplete {
+    constructor(input) {
+      this.input = input;
+      this.url = input.dataset.autocompleteUrl;
+      this.list = document.getElementById(input.getAttribute('aria-controls'));
+      this.results = [];
+      this.active = -1;
+      this.timer = null;
+      this.controller = null;
+      this.init();
+    }
+  
+    init() {
+      this.input.addEventListener('input', () => this.schedule());
+      this.input.addEventListener('keydown', (e) => this.handleKeydown(e));
+      this.input.addEventListener('blur', () => setTimeout(() => this.close(), 150));
+    }
+  
+    schedule() {
+      clearTimeout(this.timer);
+      this.timer = setTimeout(() => this.fetchResults(), 80);
+    }
+  
+    async fetchResults() {
+      const query = this.input.value.trim();
+      if (!query) {
+        this.close();
+        return;
+      }
+  
+      // Only the latest keystroke's response matters
+      this.controller?.abort();
+      this.controller = new AbortController();
+      try {
+        const response = await fetch(`${this.url}?q=${encodeURIComponent(query)}`, {
+          signal: this.controller.signal,
+          headers: { 'Accept': 'application/json' },
+        });
+        const data = await response.json();
+        this.render(data.results);
+      } catch (error) {
+        if (error.name !== 'AbortError') {
+          this.close();
+        }
+      }
+    }
+  
+    render(results) {
+      this.results = results;
+      this.active = -1;
+      this.list.innerHTML = '';
+  
+      results.forEach((result, index) => {
+        const item = document.createElement('li');
+        item.id = `${this.list.id}-${index}`;
+        item.className = `site-search__result site-search__result--${result.type}`;
+        item.setAttribute('role', 'option');
+        const link = document.createElement('a');
+        link.href = result.url;
+        link.textContent = result.label;
+        item.appendChild(link);
+        this.list.appendChild(item);
+      });
+  
+      this.list.hidden = !results.length;
+      this.input.setAttribute('aria-expanded', results.length > 0);
+    }
+  
+    handleKeydown(e) {
+      if (this.list.hidden) return;
+  
+      if (e.key === 'ArrowDown' || e.key === 'ArrowUp') {
+        e.preventDefault();
+        const step = e.key === 'ArrowDown' ? 1 : -1;
+        this.active = (this.active + step + this.results.length) % this.results.length;
+        this.highlight();
+      } else if (e.key === 'Enter' && this.active >= 0) {
+        e.preventDefault();
+        window.location.href = this.results[this.active].url;
+      } else if (e.key === 'Escape') {
+        this.close();
+      }
+    }
+  
+    highlight() {
+      this.list.querySelectorAll('.site-search__result').forEach((item, index) => {
+        item.setAttribute('aria-selected', index === this.active);
+      });
+      this.input.setAttribute('aria-activedescendant', `${this.list.id}-${this.active}`);
+    }
+  
+    close() {
+      this.list.hidden = true;
+      this.active = -1;
+      this.input.setAttribute('aria-expanded', 'false');
+      this.input.removeAttribute('aria-activedescendant');
+    }
+  }
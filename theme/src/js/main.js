@@ -1,6 +1,8 @@
 import { MainNavigation } from './components/navigation.js';
+import { SearchAutocomplete } from './components/autocomplete.js';
 
 // Initialize the navigation when the DOM is fully loaded
 document.addEventListener('DOMContentLoaded', () => {
   new MainNavigation();
-});
\ No newline at end of file
+  document.querySelectorAll('[data-autocomplete-url]').forEach((input) => new SearchAutocomplete(input));
+});